@@ -21,28 +21,31 @@ def main() -> None:
     violation_repository = ViolationRepository(mysql_connection_manager)
 
     service = ViolationService(driver_repository, speed_camera_repository, offense_repository, violation_repository)
-    service1 = service.get_offenses_by_driver('K123456')
-    for driver_offense in service1:
+    dashboard = service.get_dashboard('K123456')
+    for driver_offense in dashboard.offenses_by_driver or []:
         print(driver_offense)
 
     print('--------------------------------- [1] ---------------------------------')
 
-    service2 = service.get_top_drivers_by_points()
-    for driver_offense in service2:
+    for driver_offense in dashboard.top_drivers or []:
         print(driver_offense)
 
     print('--------------------------------- [2] ---------------------------------')
 
-    service3 = service.get_speed_camera_statistic()
-    for driver_offense in service3:
+    for driver_offense in dashboard.speed_camera_statistic or []:
         print(driver_offense)
 
     print('--------------------------------- [3] ---------------------------------')
 
-    service4 = service.get_generate_report()
-    for driver_offense in service4:
+    for driver_offense in dashboard.summary or []:
         print(driver_offense)
 
+    print('--------------------------------- [4] ---------------------------------')
+
+    for report, seconds in dashboard.timings.items():
+        print(f'{report}: {seconds * 1000:.1f} ms')
+    for report, error in dashboard.errors.items():
+        print(f'{report} failed: {error}')
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
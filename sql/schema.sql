@@ -4,11 +4,24 @@ CREATE TABLE IF NOT EXISTS speed_cameras (
     allowed_speed INT NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS camera_sections (
+    id_ INT PRIMARY KEY AUTO_INCREMENT,
+    entry_camera_id INT NOT NULL,
+    exit_camera_id INT NOT NULL,
+    distance_m INT NOT NULL,
+    speed_limit INT NOT NULL,
+    max_travel_seconds INT NOT NULL,
+    UNIQUE KEY uq_camera_sections_cameras (entry_camera_id, exit_camera_id),
+    FOREIGN KEY (entry_camera_id) REFERENCES speed_cameras(id_) ON DELETE CASCADE,
+    FOREIGN KEY (exit_camera_id) REFERENCES speed_cameras(id_) ON DELETE CASCADE
+);
+
 CREATE TABLE IF NOT EXISTS drivers (
     id_ INT PRIMARY KEY AUTO_INCREMENT,
     first_name VARCHAR(255) NOT NULL,
     last_name VARCHAR(255) NOT NULL,
-    registration_number VARCHAR(20) NOT NULL
+    registration_number VARCHAR(20) NOT NULL,
+    INDEX idx_drivers_registration_number (registration_number)
 );
 
 CREATE TABLE IF NOT EXISTS offenses (
@@ -24,7 +37,58 @@ CREATE TABLE IF NOT EXISTS violations (
     driver_id INT,
     speed_camera_id INT,
     offense_id INT,
+    INDEX idx_violations_date_driver (violation_date, driver_id),
+    FOREIGN KEY (driver_id) REFERENCES drivers(id_) ON DELETE CASCADE,
+    FOREIGN KEY (speed_camera_id) REFERENCES speed_cameras(id_) ON DELETE CASCADE,
+    FOREIGN KEY (offense_id) REFERENCES offenses(id_) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS violations_archive (
+    id_ INT PRIMARY KEY,
+    violation_date DATE NOT NULL,
+    driver_id INT,
+    speed_camera_id INT,
+    offense_id INT,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_violations_archive_violation_date (violation_date),
     FOREIGN KEY (driver_id) REFERENCES drivers(id_) ON DELETE CASCADE,
     FOREIGN KEY (speed_camera_id) REFERENCES speed_cameras(id_) ON DELETE CASCADE,
     FOREIGN KEY (offense_id) REFERENCES offenses(id_) ON DELETE CASCADE
-);
\ No newline at end of file
+);
+
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name VARCHAR(100) PRIMARY KEY,
+    position BIGINT NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS violation_daily_rollups (
+    period_start DATE NOT NULL,
+    speed_camera_id INT NOT NULL,
+    offense_id INT NOT NULL,
+    violation_count INT NOT NULL,
+    PRIMARY KEY (period_start, speed_camera_id, offense_id)
+);
+
+CREATE TABLE IF NOT EXISTS violation_monthly_rollups (
+    period_start DATE NOT NULL,
+    speed_camera_id INT NOT NULL,
+    offense_id INT NOT NULL,
+    violation_count INT NOT NULL,
+    PRIMARY KEY (period_start, speed_camera_id, offense_id)
+);
+
+CREATE TABLE IF NOT EXISTS outbox_subscriptions (
+    name VARCHAR(100) PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS violation_outbox (
+    id_ BIGINT PRIMARY KEY AUTO_INCREMENT,
+    subscription VARCHAR(100) NOT NULL,
+    violation_id INT NOT NULL,
+    created_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    available_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    attempts INT NOT NULL DEFAULT 0,
+    INDEX idx_violation_outbox_subscription (subscription, id_)
+);
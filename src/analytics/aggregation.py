@@ -0,0 +1,99 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Self
+
+
+@dataclass(slots=True)
+class ViolationAggregate:
+    """Mergeable totals over a set of violations.
+
+    Counters are plain sums and the fine extremes are min/max, so aggregates
+    of disjoint sets of violations can be combined with `merge` in any order.
+
+    Attributes:
+        violations (int): Number of violations.
+        offense_violations (int): Violations whose offense exists.
+        driver_violations (int): Violations whose offense exists and that have a driver.
+        total_points (int): Penalty points of violations whose offense exists.
+        total_fine_amount (Decimal): Fines of violations whose offense exists.
+        max_fine_amount (Decimal | None): Highest fine, None if there are no offenses.
+        min_fine_amount (Decimal | None): Lowest fine, None if there are no offenses.
+    """
+
+    violations: int = 0
+    offense_violations: int = 0
+    driver_violations: int = 0
+    total_points: int = 0
+    total_fine_amount: Decimal = Decimal(0)
+    max_fine_amount: Decimal | None = None
+    min_fine_amount: Decimal | None = None
+
+    @property
+    def average_points(self) -> float | None:
+        """Returns the mean penalty points per violation with an offense, rounded to 2 places."""
+        if not self.offense_violations:
+            return None
+        return round(self.total_points / self.offense_violations, 2)
+
+    def merge(self, other: Self) -> None:
+        """Adds the totals of another aggregate to this one.
+
+        Args:
+            other (ViolationAggregate): Aggregate of a disjoint set of violations.
+        """
+        self.violations += other.violations
+        self.offense_violations += other.offense_violations
+        self.driver_violations += other.driver_violations
+        self.total_points += other.total_points
+        self.total_fine_amount += other.total_fine_amount
+        if other.max_fine_amount is not None:
+            self.max_fine_amount = (other.max_fine_amount if self.max_fine_amount is None
+                                    else max(self.max_fine_amount, other.max_fine_amount))
+        if other.min_fine_amount is not None:
+            self.min_fine_amount = (other.min_fine_amount if self.min_fine_amount is None
+                                    else min(self.min_fine_amount, other.min_fine_amount))
+
+
+@dataclass
+class ViolationAggregation:
+    """Per-driver, per-camera and overall totals built from one scan of violations.
+
+    The scan is grouped by (driver, camera); `add` rolls each group up into
+    the driver, the camera and the overall totals, which stands in for the
+    `GROUPING SETS` MySQL does not support.
+
+    Attributes:
+        by_driver (dict[int, ViolationAggregate]): Totals keyed by driver ID.
+        by_camera (dict[int, ViolationAggregate]): Totals keyed by speed camera ID.
+        overall (ViolationAggregate): Totals over all violations.
+    """
+
+    by_driver: dict[int, ViolationAggregate] = field(default_factory=dict)
+    by_camera: dict[int, ViolationAggregate] = field(default_factory=dict)
+    overall: ViolationAggregate = field(default_factory=ViolationAggregate)
+
+    def add(self, driver_id: int | None, speed_camera_id: int | None, aggregate: ViolationAggregate) -> None:
+        """Rolls up the totals of one (driver, camera) group.
+
+        Args:
+            driver_id (int | None): Driver of the group; None for violations without a driver.
+            speed_camera_id (int | None): Camera of the group; None for violations without a camera.
+            aggregate (ViolationAggregate): Totals of the group.
+        """
+        if driver_id is not None:
+            self.by_driver.setdefault(driver_id, ViolationAggregate()).merge(aggregate)
+        if speed_camera_id is not None:
+            self.by_camera.setdefault(speed_camera_id, ViolationAggregate()).merge(aggregate)
+        self.overall.merge(aggregate)
+
+    def merge(self, other: Self) -> None:
+        """Adds another aggregation over a disjoint set of violations.
+
+        Args:
+            other (ViolationAggregation): Aggregation to merge into this one.
+        """
+        for driver_id, aggregate in other.by_driver.items():
+            self.by_driver.setdefault(driver_id, ViolationAggregate()).merge(aggregate)
+        for speed_camera_id, aggregate in other.by_camera.items():
+            self.by_camera.setdefault(speed_camera_id, ViolationAggregate()).merge(aggregate)
+        self.overall.merge(other.overall)
@@ -0,0 +1,124 @@
+from src.analytics.aggregation import ViolationAggregation
+from src.database.connection import MySQLConnectionManager
+from src.domain.repository import ViolationRepository
+from src.domain.typed_dict import CombinedStatisticsDict
+from concurrent.futures import ProcessPoolExecutor
+from src.config import logger
+import os
+import time
+
+_worker_repository: ViolationRepository | None = None
+
+
+def id_partitions(first_id: int, last_id: int, partitions: int) -> list[tuple[int, int]]:
+    """Splits an inclusive ID range into contiguous ranges of nearly equal width.
+
+    Args:
+        first_id (int): Lowest ID.
+        last_id (int): Highest ID.
+        partitions (int): Maximum number of ranges.
+
+    Returns:
+        list[tuple[int, int]]: Inclusive (first, last) ranges covering the whole range in order.
+    """
+    width = last_id - first_id + 1
+    count = max(1, min(partitions, width))
+    bounds = [first_id + width * index // count for index in range(count + 1)]
+    return [(bounds[index], bounds[index + 1] - 1) for index in range(count)]
+
+
+def _init_worker() -> None:
+    """Creates the repository, and with it the connection pool, of a worker process."""
+    global _worker_repository
+    _worker_repository = ViolationRepository(MySQLConnectionManager())
+
+
+def _aggregate_partition(
+    first_id: int,
+    last_id: int,
+    chunk_size: int,
+    include_archived: bool,
+) -> tuple[ViolationAggregation, dict[int, tuple[str, str]]]:
+    """Aggregates one ID range in a worker process."""
+    repository = _worker_repository or ViolationRepository(MySQLConnectionManager())
+    return repository.aggregate_id_range(first_id, last_id, chunk_size, include_archived)
+
+
+class ParallelViolationAggregator:
+    """Computes the `combined_statistics` reports with a pool of worker processes.
+
+    The violation IDs are split into contiguous ranges; every worker process
+    opens its own connection, aggregates the ranges it is given and sends back
+    a picklable `ViolationAggregation`. Partial totals are plain sums and
+    min/max values, so merging them gives exactly the result of one scan.
+    Using more ranges than workers keeps all cores busy when IDs are unevenly
+    dense.
+    """
+
+    def __init__(
+        self,
+        violation_repository: ViolationRepository,
+        max_workers: int | None = None,
+        partitions_per_worker: int = 4,
+        chunk_size: int = 10_000,
+    ):
+        """Initializes the aggregator.
+
+        Args:
+            violation_repository (ViolationRepository): Repository used by the coordinating process.
+            max_workers (int | None): Number of worker processes; defaults to the number of CPUs.
+            partitions_per_worker (int): ID ranges created per worker process.
+            chunk_size (int): Number of grouped rows a worker fetches at a time.
+        """
+        self._violation_repository = violation_repository
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._partitions_per_worker = partitions_per_worker
+        self._chunk_size = chunk_size
+
+    def aggregate(self, include_archived: bool = False) -> tuple[ViolationAggregation, dict[int, tuple[str, str]]]:
+        """Aggregates all violations in parallel.
+
+        Args:
+            include_archived (bool): Whether to also read violations moved to `violations_archive`.
+
+        Returns:
+            tuple[ViolationAggregation, dict[int, tuple[str, str]]]: Merged totals and the
+                first and last names of drivers keyed by driver ID.
+        """
+        aggregation = ViolationAggregation()
+        driver_names: dict[int, tuple[str, str]] = {}
+        bounds = self._violation_repository.violation_id_bounds(include_archived)
+        if bounds is None:
+            return aggregation, driver_names
+
+        start = time.perf_counter()
+        first_id, last_id = bounds
+        partitions = id_partitions(first_id, last_id, self._max_workers * self._partitions_per_worker)
+        workers = min(self._max_workers, len(partitions))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = [
+                executor.submit(_aggregate_partition, low, high, self._chunk_size, include_archived)
+                for low, high in partitions
+            ]
+            for future in futures:
+                partial_aggregation, partial_names = future.result()
+                aggregation.merge(partial_aggregation)
+                driver_names.update(partial_names)
+
+        logger.info(
+            f'Aggregated {aggregation.overall.violations} violations in {len(partitions)} ranges '
+            f'with {workers} processes in {time.perf_counter() - start:.2f}s'
+        )
+        return aggregation, driver_names
+
+    def combined_statistics(self, include_archived: bool = False) -> CombinedStatisticsDict:
+        """Computes the reports of `ViolationRepository.combined_statistics` in parallel.
+
+        Args:
+            include_archived (bool): Whether to also read violations moved to `violations_archive`.
+
+        Returns:
+            CombinedStatisticsDict: Driver ranking, camera popularity and summary statistics.
+        """
+        aggregation, driver_names = self.aggregate(include_archived)
+        return self._violation_repository.statistics_from_aggregation(aggregation, driver_names)
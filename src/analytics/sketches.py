@@ -0,0 +1,447 @@
+from src.ingestion.reading import SpeedReading
+from src.domain.entity import Violation
+from dataclasses import dataclass, field
+from typing import Hashable, Iterable, Self
+import threading
+import hashlib
+import math
+
+HASH_MASK = (1 << 64) - 1
+
+
+def _hash128(value: object) -> tuple[int, int]:
+    """Hashes a value into two independent 64-bit integers."""
+    digest = hashlib.blake2b(repr(value).encode(), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big')
+
+
+class HyperLogLog:
+    """Estimates the number of distinct values in constant memory.
+
+    Each value is hashed; the first `precision` bits select a register, which
+    keeps the longest run of leading zeros seen in the remaining bits. The
+    standard error is about `1.04 / sqrt(2 ** precision)`, i.e. 0.8% for the
+    default of 2^14 one-byte registers. Sketches of the same precision merge
+    by taking the register-wise maximum.
+    """
+
+    def __init__(self, precision: int = 14):
+        """Initializes an empty sketch.
+
+        Args:
+            precision (int): Number of register index bits, from 4 to 16.
+
+        Raises:
+            ValueError: If the precision is out of range.
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError('HyperLogLog precision must be between 4 and 16')
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, value: Hashable) -> None:
+        """Adds a value to the sketch.
+
+        Args:
+            value (Hashable): Value to count; values are compared by their `repr`.
+        """
+        hashed, _ = _hash128(value)
+        index = hashed >> (64 - self.precision)
+        remaining_bits = 64 - self.precision
+        rank = remaining_bits - (hashed & ((1 << remaining_bits) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def count(self) -> int:
+        """Returns the estimated number of distinct values added."""
+        registers = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / registers)
+        estimate = alpha * registers * registers / sum(2.0 ** -rank for rank in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * registers and zeros:
+            estimate = registers * math.log(registers / zeros)
+        return round(estimate)
+
+    def merge(self, other: Self) -> None:
+        """Adds the values of another sketch to this one.
+
+        Args:
+            other (HyperLogLog): Sketch with the same precision.
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+        if other.precision != self.precision:
+            raise ValueError('Cannot merge HyperLogLog sketches of different precision')
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+
+class CountMinSketch:
+    """Estimates the frequency of values in constant memory.
+
+    Every value increments one counter in each of `depth` rows; its estimate is
+    the smallest of those counters, which never underestimates and overestimates
+    by at most `2 * total / width` with probability `1 - 2 ** -depth`. Sketches
+    with the same dimensions merge by adding their counters.
+    """
+
+    def __init__(self, width: int = 2_048, depth: int = 4):
+        """Initializes an empty sketch.
+
+        Args:
+            width (int): Counters per row.
+            depth (int): Number of rows.
+
+        Raises:
+            ValueError: If a dimension is not positive.
+        """
+        if width < 1 or depth < 1:
+            raise ValueError('Count-Min Sketch dimensions must be positive')
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [[0] * width for _ in range(depth)]
+
+    def add(self, value: Hashable, count: int = 1) -> int:
+        """Counts occurrences of a value.
+
+        Args:
+            value (Hashable): Value to count; values are compared by their `repr`.
+            count (int): Number of occurrences.
+
+        Returns:
+            int: Estimated frequency of the value after the update.
+        """
+        self.total += count
+        estimate: int | None = None
+        for row, index in zip(self._rows, self._indexes(value)):
+            row[index] += count
+            estimate = row[index] if estimate is None else min(estimate, row[index])
+        return estimate or 0
+
+    def estimate(self, value: Hashable) -> int:
+        """Returns the estimated frequency of a value.
+
+        Args:
+            value (Hashable): Value to look up.
+
+        Returns:
+            int: Estimated number of occurrences; never lower than the true one.
+        """
+        return min(row[index] for row, index in zip(self._rows, self._indexes(value)))
+
+    def merge(self, other: Self) -> None:
+        """Adds the counts of another sketch to this one.
+
+        Args:
+            other (CountMinSketch): Sketch with the same dimensions.
+
+        Raises:
+            ValueError: If the dimensions differ.
+        """
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError('Cannot merge Count-Min Sketches of different dimensions')
+        self.total += other.total
+        for row, other_row in zip(self._rows, other._rows):
+            for index, count in enumerate(other_row):
+                if count:
+                    row[index] += count
+
+    def _indexes(self, value: Hashable) -> list[int]:
+        """Returns the counter index of a value in every row, using double hashing."""
+        first, second = _hash128(value)
+        return [((first + row * second) & HASH_MASK) % self.width for row in range(self.depth)]
+
+
+class TopK[T: Hashable]:
+    """Tracks the `k` most frequent values of a stream.
+
+    Frequencies come from a `CountMinSketch`; only the current `k` candidates
+    are kept with their estimates, so memory does not grow with the number of
+    distinct values.
+    """
+
+    def __init__(self, k: int = 10, width: int = 2_048, depth: int = 4):
+        """Initializes an empty tracker.
+
+        Args:
+            k (int): Number of values to track.
+            width (int): Counters per row of the underlying sketch.
+            depth (int): Rows of the underlying sketch.
+        """
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self._candidates: dict[T, int] = {}
+
+    def add(self, value: T, count: int = 1) -> None:
+        """Counts occurrences of a value.
+
+        Args:
+            value (T): Value to count.
+            count (int): Number of occurrences.
+        """
+        estimate = self.sketch.add(value, count)
+        if value in self._candidates or len(self._candidates) < self.k:
+            self._candidates[value] = estimate
+            return
+        smallest = min(self._candidates, key=self._candidates.__getitem__)
+        if estimate > self._candidates[smallest]:
+            del self._candidates[smallest]
+            self._candidates[value] = estimate
+
+    def top(self, n: int | None = None) -> list[tuple[T, int]]:
+        """Returns the most frequent values with their estimated frequencies.
+
+        Args:
+            n (int | None): Number of values to return; None returns all `k`.
+
+        Returns:
+            list[tuple[T, int]]: Values and frequencies, most frequent first.
+        """
+        ranked = sorted(self._candidates.items(), key=lambda item: (-item[1], repr(item[0])))
+        return ranked[:n] if n is not None else ranked
+
+    def merge(self, other: Self) -> None:
+        """Adds the counts of another tracker to this one.
+
+        Args:
+            other (TopK): Tracker with the same sketch dimensions.
+        """
+        self.sketch.merge(other.sketch)
+        candidates = self._candidates.keys() | other._candidates.keys()
+        estimates = {value: self.sketch.estimate(value) for value in candidates}
+        self._candidates = dict(sorted(estimates.items(), key=lambda item: -item[1])[:self.k])
+
+
+class TDigest:
+    """Estimates quantiles of a stream of numbers in constant memory.
+
+    Values are buffered and periodically merged into weighted centroids whose
+    size is bounded by the k1 scale function, so centroids near the tails stay
+    small and extreme quantiles remain accurate. Digests merge by combining
+    their centroids.
+    """
+
+    def __init__(self, compression: float = 100.0):
+        """Initializes an empty digest.
+
+        Args:
+            compression (float): Accuracy parameter; the digest keeps at most about
+                `compression` centroids.
+        """
+        self.compression = compression
+        self.count = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+        self._centroids: list[tuple[float, float]] = []
+        self._buffer: list[tuple[float, float]] = []
+        self._buffer_size = max(int(compression) * 5, 50)
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Adds a value to the digest.
+
+        Args:
+            value (float): Observed value.
+            weight (float): Number of observations of the value.
+        """
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def quantile(self, q: float) -> float | None:
+        """Returns the estimated value at a quantile.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            float | None: Estimated value, or None if the digest is empty.
+
+        Raises:
+            ValueError: If `q` is outside [0, 1].
+        """
+        if not 0 <= q <= 1:
+            raise ValueError('Quantile must be between 0 and 1')
+        self._compress()
+        if not self._centroids or self.min is None or self.max is None:
+            return None
+
+        target = q * self.count
+        cumulative = 0.0
+        previous_center, previous_mean = 0.0, self.min
+        for mean, weight in self._centroids:
+            center = cumulative + weight / 2
+            if target <= center:
+                return self._interpolate(target, previous_center, previous_mean, center, mean)
+            previous_center, previous_mean = center, mean
+            cumulative += weight
+        return self._interpolate(target, previous_center, previous_mean, self.count, self.max)
+
+    def merge(self, other: Self) -> None:
+        """Adds the observations of another digest to this one.
+
+        Args:
+            other (TDigest): Digest to merge.
+        """
+        other._compress()
+        if not other._centroids or other.min is None or other.max is None:
+            return
+        self._buffer.extend(other._centroids)
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+
+    def _compress(self) -> None:
+        """Merges buffered values into the centroids, respecting the scale function."""
+        if not self._buffer:
+            return
+        items = sorted(self._centroids + self._buffer)
+        self._buffer = []
+        merged: list[tuple[float, float]] = []
+        weight_before = 0.0
+        weight_limit = self.count * self._quantile_limit(0.0)
+        mean, weight = items[0]
+        for item_mean, item_weight in items[1:]:
+            if weight_before + weight + item_weight <= weight_limit:
+                weight += item_weight
+                mean += (item_mean - mean) * item_weight / weight
+            else:
+                merged.append((mean, weight))
+                weight_before += weight
+                weight_limit = self.count * self._quantile_limit(weight_before / self.count)
+                mean, weight = item_mean, item_weight
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def _quantile_limit(self, q: float) -> float:
+        """Returns the highest quantile one centroid starting at `q` may reach under the k1 scale."""
+        scale = self.compression / (2 * math.pi)
+        k = scale * math.asin(2 * q - 1) + 1
+        return (math.sin(min(k / scale, math.pi / 2)) + 1) / 2
+
+    @staticmethod
+    def _interpolate(target: float, left: float, left_value: float, right: float, right_value: float) -> float:
+        """Linearly interpolates the value at `target` between two weight positions."""
+        if right <= left:
+            return right_value
+        return left_value + (right_value - left_value) * (target - left) / (right - left)
+
+
+@dataclass(frozen=True)
+class SketchSummary:
+    """Approximate statistics answered by `ViolationSketches`.
+
+    Attributes:
+        distinct_drivers (int): Estimated number of drivers with violations.
+        distinct_plates (int): Estimated number of plates read by cameras.
+        busiest_cameras (list[tuple[int, int]]): Camera IDs with estimated violation counts.
+        common_offenses (list[tuple[int, int]]): Offense IDs with estimated violation counts.
+        fine_quantiles (dict[float, float | None]): Estimated fine amount per quantile.
+        speed_quantiles (dict[float, float | None]): Estimated measured speed per quantile.
+    """
+
+    distinct_drivers: int
+    distinct_plates: int
+    busiest_cameras: list[tuple[int, int]]
+    common_offenses: list[tuple[int, int]]
+    fine_quantiles: dict[float, float | None]
+    speed_quantiles: dict[float, float | None]
+
+
+@dataclass
+class ViolationSketches:
+    """Constant-memory approximate analytics fed incrementally by ingestion.
+
+    Every sketch is mergeable, so workers can keep their own instance and
+    combine them with `merge`; instances are picklable for sending between
+    processes. Updates are serialized with a lock, so one instance can be
+    shared by ingestion threads.
+
+    Attributes:
+        fine_amounts (dict[int, float]): Fine amount keyed by offense ID, used to
+            feed the fine distribution.
+        drivers (HyperLogLog): Distinct drivers with violations.
+        plates (HyperLogLog): Distinct plates read by cameras.
+        cameras (TopK): Cameras with the most violations.
+        offenses (TopK): Most frequent offenses.
+        fines (TDigest): Distribution of fine amounts of violations.
+        speeds (TDigest): Distribution of measured speeds of all readings.
+    """
+
+    fine_amounts: dict[int, float] = field(default_factory=dict)
+    drivers: HyperLogLog = field(default_factory=HyperLogLog)
+    plates: HyperLogLog = field(default_factory=HyperLogLog)
+    cameras: TopK[int] = field(default_factory=TopK)
+    offenses: TopK[int] = field(default_factory=TopK)
+    fines: TDigest = field(default_factory=TDigest)
+    speeds: TDigest = field(default_factory=TDigest)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def observe(self, readings: Iterable[SpeedReading], violations: Iterable[Violation]) -> None:
+        """Feeds one ingested batch into the sketches.
+
+        Args:
+            readings (Iterable[SpeedReading]): Readings of the batch, violating or not.
+            violations (Iterable[Violation]): Violations created from the batch.
+        """
+        with self._lock:
+            for reading in readings:
+                self.plates.add(reading.registration_number)
+                self.speeds.add(reading.measured_speed)
+            for violation in violations:
+                if violation.driver_id is not None:
+                    self.drivers.add(violation.driver_id)
+                if violation.speed_camera_id is not None:
+                    self.cameras.add(violation.speed_camera_id)
+                if violation.offense_id is not None:
+                    self.offenses.add(violation.offense_id)
+                    fine_amount = self.fine_amounts.get(violation.offense_id)
+                    if fine_amount is not None:
+                        self.fines.add(fine_amount)
+
+    def merge(self, other: Self) -> None:
+        """Adds the observations of another worker's sketches.
+
+        Args:
+            other (ViolationSketches): Sketches built with the same parameters.
+        """
+        with self._lock:
+            self.drivers.merge(other.drivers)
+            self.plates.merge(other.plates)
+            self.cameras.merge(other.cameras)
+            self.offenses.merge(other.offenses)
+            self.fines.merge(other.fines)
+            self.speeds.merge(other.speeds)
+
+    def summary(self, top: int = 10, quantiles: tuple[float, ...] = (0.5, 0.9, 0.99)) -> SketchSummary:
+        """Answers the approximate statistics.
+
+        Args:
+            top (int): Number of busiest cameras and most common offenses.
+            quantiles (tuple[float, ...]): Quantiles of the fine and speed distributions.
+
+        Returns:
+            SketchSummary: Estimated counts, heavy hitters and quantiles.
+        """
+        with self._lock:
+            return SketchSummary(
+                distinct_drivers=self.drivers.count(),
+                distinct_plates=self.plates.count(),
+                busiest_cameras=self.cameras.top(top),
+                common_offenses=self.offenses.top(top),
+                fine_quantiles={q: self.fines.quantile(q) for q in quantiles},
+                speed_quantiles={q: self.speeds.quantile(q) for q in quantiles},
+            )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
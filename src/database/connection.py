@@ -1,19 +1,39 @@
-from mysql.connector import pooling, MySQLConnection
-from typing import Callable, Any, cast
-from dotenv import load_dotenv
+from src.database.workload import AdmittedConnection, WorkloadAdmission, active_workload
+from src.database.deadline import QueryTimeoutError, QueryWatchdog, remaining_time
+from src.database.profiling import current_profiler
+from typing import Callable, Any, TYPE_CHECKING, cast
+from contextvars import ContextVar
+from src.config import logger
+import threading
+import math
 import os
 
-load_dotenv()
+if TYPE_CHECKING:
+    from mysql.connector.pooling import MySQLConnectionPool
+    from mysql.connector import MySQLConnection
+    from mysql.connector.cursor import MySQLCursor
+
+guarded_connection: ContextVar[int | None] = ContextVar('guarded_connection', default=None)
+
 
 class MySQLConnectionManager:
     """Manages a pool of MySQL connections using mysql.connector.pooling.
 
-    This class initializes a connection pool based on environment variables
-    and provides pooled connections to the database when requested.
+    The pool is created lazily on the first checkout, and pooled connections
+    are opened one by one as concurrent demand grows, so constructing the
+    manager costs nothing for short-lived jobs that may never query.
+
+    With a `WorkloadAdmission`, the pool is sliced by workload class: every
+    checkout first takes a slot for the class active in the caller's context,
+    and the returned connection gives the slot back when it is closed.
     """
 
-    def __init__(self):
-        """Initializes the MySQL connection pool using environment variables.
+    def __init__(self, admission: WorkloadAdmission | None = None) -> None:
+        """Prepares the manager; the pool is configured from environment variables on first use.
+
+        Args:
+            admission (WorkloadAdmission | None): Admission of connections by workload class;
+                without it connections are handed out first come, first served.
 
         Environment variables:
             DB_POOL_SIZE: Number of connections in the pool (default: 5).
@@ -23,23 +43,163 @@ class MySQLConnectionManager:
             DB_PASSWORD: Database password.
             DB_PORT: Database port (default: 3307).
         """
-        self._pool = pooling.MySQLConnectionPool(
-            pool_name='localhost',
-            pool_size=int(os.getenv('DB_POOL_SIZE', 5)),
-            host=os.getenv('DB_HOST'),
-            database=os.getenv('DB_NAME'),
-            user=os.getenv('DB_USER'),
-            password=os.getenv('DB_PASSWORD'),
-            port=int(os.getenv('DB_PORT', 3307)),
-        )
-
-    def get_connection(self) -> MySQLConnection:
+        self._pool: MySQLConnectionPool | None = None
+        self._config: dict[str, Any] = {}
+        self._opened_connections = 0
+        self._lock = threading.Lock()
+        self._control_connection: MySQLConnection | None = None
+        self._control_lock = threading.Lock()
+        self.admission = admission
+
+    def get_connection(self) -> 'MySQLConnection':
         """Retrieves a new database connection from the connection pool.
 
+        A new connection is opened only when every already opened one is in use.
+        With an admission, the call first waits for a slot of the active workload class.
+
         Returns:
             MySQLConnection: A MySQL database connection object.
+
+        Raises:
+            AdmissionTimeoutError: If no slot of the workload class was free in time.
+        """
+        pool = self._get_pool()
+        if self.admission is None:
+            return self._checkout(pool)
+
+        workload_class = active_workload.get()
+        self.admission.acquire(workload_class)
+        try:
+            connection = self._checkout(pool)
+        except Exception:
+            self.admission.release(workload_class)
+            raise
+        return cast('MySQLConnection', AdmittedConnection(connection, self.admission, workload_class))
+
+    def _checkout(self, pool: 'MySQLConnectionPool') -> 'MySQLConnection':
+        """Takes a connection from the pool, opening one if every opened connection is in use."""
+        from mysql.connector.errors import PoolError
+
+        with self._lock:
+            try:
+                return cast('MySQLConnection', pool.get_connection())
+            except PoolError:
+                if self._opened_connections >= pool.pool_size:
+                    raise
+            pool.add_connection()
+            self._opened_connections += 1
+            return cast('MySQLConnection', pool.get_connection())
+
+    @property
+    def pool_size(self) -> int:
+        """Returns the maximum number of connections held by the pool.
+
+        Returns:
+            int: Configured size of the connection pool.
+        """
+        return self._get_pool().pool_size
+
+    @property
+    def opened_connections(self) -> int:
+        """Returns the number of connections opened so far.
+
+        Returns:
+            int: Number of physical connections held by the pool.
+        """
+        return self._opened_connections
+
+    def kill_query(self, connection_id: int) -> None:
+        """Stops the statement running on a connection, leaving the connection open.
+
+        Uses a dedicated connection outside the pool, so a query can be
+        cancelled even when the pool is exhausted.
+
+        Args:
+            connection_id (int): Server-side ID of the connection running the statement.
+        """
+        import mysql.connector
+
+        self._get_pool()
+        with self._control_lock:
+            if self._control_connection is None or not self._control_connection.is_connected():
+                self._control_connection = cast('MySQLConnection', mysql.connector.connect(**self._config))
+            with self._control_connection.cursor() as cursor:
+                cursor.execute(f'KILL QUERY {int(connection_id)}')
+
+    def _get_pool(self) -> 'MySQLConnectionPool':
+        """Creates the pool without opening connections on first use.
+
+        Returns:
+            MySQLConnectionPool: The connection pool.
+        """
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    from mysql.connector import pooling
+                    from dotenv import load_dotenv
+
+                    load_dotenv()
+                    pool = pooling.MySQLConnectionPool(
+                        pool_name='localhost',
+                        pool_size=int(os.getenv('DB_POOL_SIZE', 5)),
+                    )
+                    self._config = {
+                        'host': os.getenv('DB_HOST'),
+                        'database': os.getenv('DB_NAME'),
+                        'user': os.getenv('DB_USER'),
+                        'password': os.getenv('DB_PASSWORD'),
+                        'port': int(os.getenv('DB_PORT', 3307)),
+                    }
+                    pool.set_config(**self._config)
+                    if self.admission is not None:
+                        self.admission.configure(pool.pool_size)
+                    self._pool = pool
+        return self._pool
+
+
+class ConnectionHolder:
+    """Base class for objects whose methods use `with_db_connection`.
+
+    The connection and cursor of the running call are kept per thread, so one
+    instance, e.g. a repository, can be shared by several threads running
+    queries at the same time.
+    """
+
+    @property
+    def _connection_state(self) -> threading.local:
+        """Returns the per-thread storage of the instance, creating it on first use."""
+        return self.__dict__.setdefault('_thread_connection_state', threading.local())
+
+    @property
+    def _conn(self) -> 'MySQLConnection':
+        """Returns the connection of the call running in the current thread."""
+        return self._connection_state.conn
+
+    @_conn.setter
+    def _conn(self, conn: 'MySQLConnection') -> None:
+        self._connection_state.conn = conn
+
+    @property
+    def _cursor(self) -> 'MySQLCursor':
+        """Returns the cursor of the call running in the current thread."""
+        return self._connection_state.cursor
+
+    @_cursor.setter
+    def _cursor(self, cursor: 'MySQLCursor') -> None:
+        self._connection_state.cursor = cursor
+
+    @property
+    def _after_commit(self) -> list[Callable[[], None]] | None:
+        """Returns the callbacks run once the current call's transaction is committed.
+
+        None while the call runs on an external connection, which only the
+        caller commits or rolls back.
         """
-        return self._pool.get_connection()
+        return self._connection_state.after_commit
+
+    @_after_commit.setter
+    def _after_commit(self, callbacks: list[Callable[[], None]] | None) -> None:
+        self._connection_state.after_commit = callbacks
 
 
 def with_db_connection(func: Callable) -> Callable:
@@ -49,6 +209,18 @@ def with_db_connection(func: Callable) -> Callable:
     for the wrapped function. It supports both internal (managed) and external
     connections, handling commits, rollbacks, and proper cleanup.
 
+    A call is bounded by its `timeout` keyword argument and by the active
+    `Deadline`, whichever ends first. The remaining budget is applied as the
+    session's `max_execution_time` and guarded by a `QueryWatchdog`; a call that
+    runs out of time is rolled back and raises `QueryTimeoutError`. While a
+    `Profiler` is active, the call is profiled under `ClassName.method_name`.
+
+    A call that opens its own connection collects callbacks in `_after_commit`
+    and runs them only after its commit succeeded, so in-memory state derived
+    from the writes is never updated for a rolled-back transaction. A nested
+    call on the same connection adds to the outer call's callbacks; a call on
+    any other external connection sees None, as its outcome is up to the caller.
+
     Args:
         func (Callable): The function to wrap, which expects `self` and optional
             database-related arguments.
@@ -56,30 +228,103 @@ def with_db_connection(func: Callable) -> Callable:
     Returns:
         Callable: The wrapped function with automatic connection and transaction handling.
     """
-    def wrapper(self, *args: Any, conn: MySQLConnection | None = None, **kwargs: Any) -> Any:
+    def wrapper(
+        self,
+        *args: Any,
+        conn: 'MySQLConnection | None' = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
         """Wrapper providing automatic connection handling for the decorated method."""
+        budget = remaining_time(timeout)
+        if budget is not None and budget <= 0:
+            raise QueryTimeoutError(f'{func.__name__} was not started, its time budget is spent')
+
         external_conn = conn is not None
         if not external_conn:
             conn = self._connection_manager.get_connection()
 
-        conn = cast(MySQLConnection, conn)
+        conn = cast('MySQLConnection', conn)
+        if guarded_connection.get() == id(conn):
+            budget = None
+        previous_conn = getattr(self, '_conn', None)
+        previous_cursor = getattr(self, '_cursor', None)
+        previous_after_commit = getattr(self, '_after_commit', None)
+        if not external_conn:
+            after_commit: list[Callable[[], None]] | None = []
+        else:
+            after_commit = previous_after_commit if conn is previous_conn else None
+        watchdog: QueryWatchdog | None = None
 
         with conn.cursor() as cursor:
             try:
                 self._conn = conn
                 self._cursor = cursor
-                result = func(self, *args, **kwargs)
+                self._after_commit = after_commit
+                if budget is not None:
+                    cursor.execute('set session max_execution_time = %s', (max(1, math.ceil(budget * 1000)),))
+                    connection_id = conn.connection_id
+                    watchdog = QueryWatchdog(budget, lambda: self._connection_manager.kill_query(connection_id))
+                    watchdog.start()
+                    guard_token = guarded_connection.set(id(conn))
+                try:
+                    profiler = current_profiler()
+                    if profiler is None:
+                        result = func(self, *args, **kwargs)
+                    else:
+                        result = profiler.run(f'{type(self).__name__}.{func.__name__}', func, self, *args, **kwargs)
+                finally:
+                    if watchdog is not None:
+                        watchdog.stop()
+                        guarded_connection.reset(guard_token)
+                if watchdog is not None and watchdog.fired:
+                    raise QueryTimeoutError(f'{func.__name__} exceeded its time budget of {budget:.3f} s')
 
                 if not external_conn:
                     self._conn.commit()
+                    for callback in after_commit or ():
+                        callback()
 
                 return result
             except Exception as e:
                 if not external_conn and self._conn:
                     self._conn.rollback()
+                if isinstance(e, QueryTimeoutError):
+                    raise e
+                if budget is not None and (_is_timeout_error(e) or (watchdog is not None and watchdog.fired)):
+                    raise QueryTimeoutError(f'{func.__name__} exceeded its time budget of {budget:.3f} s') from e
                 raise e
             finally:
+                if budget is not None:
+                    _reset_execution_time(cursor)
+                self._conn = previous_conn
+                self._cursor = previous_cursor
+                self._after_commit = previous_after_commit
                 if not external_conn and conn:
                     conn.close()
 
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+
+def _is_timeout_error(error: Exception) -> bool:
+    """Checks whether a MySQL error reports an exceeded or interrupted statement.
+
+    Args:
+        error (Exception): Error raised by a decorated call.
+
+    Returns:
+        bool: True for `ER_QUERY_TIMEOUT` (3024) and `ER_QUERY_INTERRUPTED` (1317).
+    """
+    return getattr(error, 'errno', None) in (3024, 1317)
+
+
+def _reset_execution_time(cursor: Any) -> None:
+    """Removes the statement time limit so the connection goes back to the pool unrestricted.
+
+    Args:
+        cursor (Any): Cursor of the connection whose limit is removed.
+    """
+    try:
+        cursor.execute('set session max_execution_time = 0')
+    except Exception as e:
+        logger.warning(f'Failed to reset max_execution_time: {e}')
@@ -0,0 +1,127 @@
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Self
+from functools import wraps
+from src.config import logger
+import threading
+import time
+
+active_deadline: ContextVar[float | None] = ContextVar('active_deadline', default=None)
+
+
+class QueryTimeoutError(TimeoutError):
+    """Raised when a database call exceeds its time budget."""
+
+
+class Deadline:
+    """Context manager bounding the time of all database calls made inside it.
+
+    The deadline is stored in a context variable, so it applies to nested
+    service and repository calls without passing it explicitly. Nested
+    deadlines can only shorten the budget, never extend it.
+    """
+
+    def __init__(self, seconds: float):
+        """Initializes the deadline.
+
+        Args:
+            seconds (float): Time budget counted from entering the context.
+        """
+        self._seconds = seconds
+        self._token: Token[float | None] | None = None
+
+    def __enter__(self) -> Self:
+        expires = time.monotonic() + self._seconds
+        current = active_deadline.get()
+        self._token = active_deadline.set(expires if current is None else min(current, expires))
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            active_deadline.reset(self._token)
+            self._token = None
+
+
+def remaining_time(timeout: float | None = None) -> float | None:
+    """Returns the time left for a call, combining a per-call timeout with the active deadline.
+
+    Args:
+        timeout (float | None): Per-call budget in seconds, or None.
+
+    Returns:
+        float | None: Seconds left, possibly negative, or None if the call is unbounded.
+    """
+    expires = active_deadline.get()
+    remaining = None if expires is None else expires - time.monotonic()
+    if timeout is not None:
+        remaining = timeout if remaining is None else min(remaining, timeout)
+    return remaining
+
+
+class QueryWatchdog:
+    """Cancels the running statement of a connection once its budget is spent.
+
+    The server-side `max_execution_time` only stops SELECT statements; the
+    watchdog covers every other statement and time spent between statements
+    by calling `cancel_query` from a timer thread. Stopping the watchdog waits
+    for a cancellation in progress, so a statement of a later call on the same
+    connection can never be cancelled.
+    """
+
+    def __init__(self, seconds: float, cancel_query: Callable[[], None]):
+        """Initializes the watchdog; it is armed by `start`.
+
+        Args:
+            seconds (float): Time after which the query is cancelled.
+            cancel_query (Callable[[], None]): Cancels the statement running on the connection.
+        """
+        self._cancel_query = cancel_query
+        self._timer = threading.Timer(seconds, self._fire)
+        self._timer.daemon = True
+        self._lock = threading.Lock()
+        self._stopped = False
+        self.fired = False
+
+    def start(self) -> None:
+        """Arms the watchdog."""
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Disarms the watchdog, waiting for a cancellation in progress."""
+        self._timer.cancel()
+        with self._lock:
+            self._stopped = True
+
+    def _fire(self) -> None:
+        """Cancels the running statement unless the watchdog was stopped."""
+        with self._lock:
+            if self._stopped:
+                return
+            self.fired = True
+            try:
+                self._cancel_query()
+            except Exception as e:
+                logger.error(f'Failed to cancel a query that exceeded its deadline: {e}')
+
+
+def with_time_budget(func: Callable) -> Callable:
+    """Decorator running a service method within the time budget configured for it.
+
+    The budget is looked up by method name in the service's `timeouts`
+    mapping; methods without an entry run unbounded.
+
+    Args:
+        func (Callable): Service method to wrap.
+
+    Returns:
+        Callable: The wrapped method running inside a `Deadline`.
+    """
+    @wraps(func)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        """Wrapper entering the method's deadline."""
+        seconds = self.timeouts.get(func.__name__)
+        if seconds is None:
+            return func(self, *args, **kwargs)
+        with Deadline(seconds):
+            return func(self, *args, **kwargs)
+
+    return wrapper
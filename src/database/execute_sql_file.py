@@ -1,10 +1,9 @@
-from src.database.connection import MySQLConnectionManager, with_db_connection
-from mysql.connector.connection import MySQLCursor, MySQLConnection
+from src.database.connection import MySQLConnectionManager, ConnectionHolder, with_db_connection
 from mysql.connector import Error
 from src.config import logger
 
 
-class SqlFileExecutor:
+class SqlFileExecutor(ConnectionHolder):
     """Executes SQL commands from a .sql file using a managed MySQL connection.
 
     This class provides functionality for reading SQL scripts from files and
@@ -20,8 +19,6 @@ class SqlFileExecutor:
                 for providing MySQL connections from a connection pool.
         """
         self._connection_manager = connection_manager
-        self._conn: MySQLConnection
-        self._cursor: MySQLCursor
 
     @with_db_connection
     def execute_sql_file(self, file_path: str) -> None:
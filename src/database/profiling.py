@@ -0,0 +1,276 @@
+from typing import Any, Callable, Self
+from contextvars import ContextVar, Token
+from collections import Counter
+from functools import wraps
+from pathlib import Path
+from src.config import logger
+import tracemalloc
+import threading
+import cProfile
+import atexit
+import pstats
+import time
+import io
+import os
+
+HYDRATION_MODULES = (
+    os.path.join('src', 'domain', 'entity.py'),
+    os.path.join('src', 'service', 'dto.py'),
+)
+
+active_profiler: ContextVar['Profiler | None'] = ContextVar('active_profiler', default=None)
+
+_profiling_lock = threading.Lock()
+_profiling_thread = threading.local()
+_counter_lock = threading.Lock()
+_environment_lock = threading.Lock()
+_environment_profiler: 'Profiler | None' = None
+_environment_checked = False
+
+
+class Profiler:
+    """Collects cProfile statistics and allocation sites per profiled method.
+
+    Profiling is opt-in: it is active inside `with Profiler(...)`, or for the
+    whole process when the `PROFILING_DIR` environment variable is set, in
+    which case the results are written at exit (`PROFILING_ALLOCATIONS=0`
+    turns allocation tracing off). Every call of a method
+    decorated with `profiled` or wrapped by `with_db_connection` then runs
+    under cProfile, and, with `trace_allocations`, the memory it leaves
+    allocated is attributed to source lines by comparing tracemalloc
+    snapshots taken before and after the call.
+
+    cProfile and tracemalloc see the whole process, so only one call is
+    profiled at a time: calls nested in a profiled call are part of its
+    profile, and calls started by other threads meanwhile run unprofiled
+    and are only counted. Work a profiled call hands to worker threads,
+    like the reports of `ViolationService.get_dashboard`, therefore gets
+    no results of its own; its functions and allocations are merged into
+    the profile of the calling method. Results accumulate per method across calls and
+    are written as one `.prof` file per method, loadable with `pstats`,
+    plus a `summary.txt` of the top functions by cumulative time and the
+    top allocation sites, listing those in entity and DTO hydration code
+    separately.
+    """
+
+    def __init__(self, output_dir: str | Path, trace_allocations: bool = True, top: int = 20):
+        """Initializes the profiler; nothing is measured before it is entered.
+
+        Args:
+            output_dir (str | Path): Directory receiving the `.prof` files and `summary.txt`.
+            trace_allocations (bool): Whether to record allocation sites with tracemalloc.
+            top (int): Number of functions and allocation sites listed per method in the summary.
+        """
+        self._output_dir = Path(output_dir)
+        self._trace_allocations = trace_allocations
+        self._top = top
+        self._stats: dict[str, pstats.Stats] = {}
+        self._allocations: dict[str, Counter[tuple[str, int]]] = {}
+        self._calls: Counter[str] = Counter()
+        self._concurrent: Counter[str] = Counter()
+        self._seconds: dict[str, float] = {}
+        self._report = io.StringIO()
+        self._started_tracemalloc = False
+        self._token: Token['Profiler | None'] | None = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        self._token = active_profiler.set(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            active_profiler.reset(self._token)
+            self._token = None
+        self.stop()
+        self.dump()
+
+    def start(self) -> None:
+        """Starts tracemalloc if allocations are traced and it is not running yet."""
+        if self._trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start(5)
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stops tracemalloc if this profiler started it."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def run[R](self, name: str, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Calls a function, profiling it under a method name unless another call is being profiled.
+
+        Args:
+            name (str): Name the results are accumulated under, e.g. `'ViolationService.get_dashboard'`.
+            func (Callable[..., R]): Function to call.
+            *args (Any): Positional arguments of the call.
+            **kwargs (Any): Keyword arguments of the call.
+
+        Returns:
+            R: Result of the call.
+        """
+        if getattr(_profiling_thread, 'active', False):
+            return func(*args, **kwargs)
+        if not _profiling_lock.acquire(blocking=False):
+            with _counter_lock:
+                self._concurrent[name] += 1
+            return func(*args, **kwargs)
+
+        _profiling_thread.active = True
+        profile = cProfile.Profile()
+        tracing = self._trace_allocations and tracemalloc.is_tracing()
+        before = _snapshot() if tracing else None
+        start = time.perf_counter()
+        try:
+            profile.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.disable()
+        finally:
+            elapsed = time.perf_counter() - start
+            after = _snapshot() if before is not None else None
+            self._record(name, profile, elapsed, before, after)
+            _profiling_thread.active = False
+            _profiling_lock.release()
+
+    def dump(self) -> Path | None:
+        """Writes the accumulated results; earlier files of the same methods are replaced.
+
+        Returns:
+            Path | None: Location of the summary, or None if nothing was profiled.
+        """
+        with _profiling_lock:
+            if not self._calls and not self._concurrent:
+                return None
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            for name, stats in self._stats.items():
+                stats.dump_stats(self._output_dir / f'{name}.prof')
+            summary_path = self._output_dir / 'summary.txt'
+            summary_path.write_text(self.summary())
+        logger.info(f'Wrote profiling results to {self._output_dir}')
+        return summary_path
+
+    def summary(self) -> str:
+        """Renders the top functions and allocation sites of every profiled method.
+
+        Returns:
+            str: Human-readable report.
+        """
+        sections = []
+        for name in sorted(self._calls.keys() | self._concurrent.keys()):
+            lines = [
+                f'== {name}: {self._calls[name]} profiled calls, {self._seconds.get(name, 0.0):.3f} s; '
+                f'{self._concurrent[name]} concurrent calls not profiled'
+            ]
+            stats = self._stats.get(name)
+            if stats is not None:
+                self._report.seek(0)
+                self._report.truncate()
+                stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._top)
+                lines.append(self._report.getvalue().strip())
+            allocations = self._allocations.get(name)
+            if allocations:
+                lines.append('-- top allocation sites (bytes left allocated)')
+                lines.extend(_format_sites(allocations.most_common(self._top)))
+                hydration = [
+                    (site, size) for site, size in allocations.most_common()
+                    if site[0].endswith(HYDRATION_MODULES)
+                ][:self._top]
+                lines.append('-- entity and DTO hydration allocation sites')
+                lines.extend(_format_sites(hydration) or ['   none'])
+            sections.append('\n'.join(lines))
+        return '\n\n'.join(sections) + '\n'
+
+    def _record(
+        self,
+        name: str,
+        profile: cProfile.Profile,
+        elapsed: float,
+        before: tracemalloc.Snapshot | None,
+        after: tracemalloc.Snapshot | None,
+    ) -> None:
+        """Merges one profiled call into the results of its method; the profiling lock is held."""
+        self._calls[name] += 1
+        self._seconds[name] = self._seconds.get(name, 0.0) + elapsed
+        stats = self._stats.get(name)
+        if stats is None:
+            self._stats[name] = pstats.Stats(profile, stream=self._report)
+        else:
+            stats.add(profile)
+        if before is not None and after is not None:
+            sites = self._allocations.setdefault(name, Counter())
+            for difference in after.compare_to(before, 'lineno'):
+                if difference.size_diff > 0:
+                    frame = difference.traceback[0]
+                    sites[(frame.filename, frame.lineno)] += difference.size_diff
+
+
+def current_profiler() -> Profiler | None:
+    """Returns the profiler of the running context, or the process-wide one configured by `PROFILING_DIR`.
+
+    Returns:
+        Profiler | None: Active profiler, or None when profiling is off.
+    """
+    profiler = active_profiler.get()
+    if profiler is not None:
+        return profiler
+    if not _environment_checked:
+        _configure_from_environment()
+    return _environment_profiler
+
+
+def profiled[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Decorator profiling a service method while a profiler is active.
+
+    Only one call in the process is profiled at a time. A decorated method
+    called by another thread while a profile is running, e.g. a report run
+    by a worker of `ViolationService.get_dashboard`, runs unprofiled and is
+    only counted as a concurrent call; whatever it executes shows up in the
+    profile of the method that started it instead.
+
+    Args:
+        func (Callable[P, R]): Method to wrap.
+
+    Returns:
+        Callable[P, R]: The wrapped method, profiled under `ClassName.method_name`.
+    """
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        """Wrapper running the method under the active profiler."""
+        profiler = current_profiler()
+        if profiler is None:
+            return func(*args, **kwargs)
+        return profiler.run(f'{type(args[0]).__name__}.{func.__name__}', func, *args, **kwargs)
+
+    return wrapper
+
+
+def _configure_from_environment() -> None:
+    """Creates the process-wide profiler when `PROFILING_DIR` is set, writing its results at exit."""
+    global _environment_profiler, _environment_checked
+    with _environment_lock:
+        if _environment_checked:
+            return
+        output_dir = os.getenv('PROFILING_DIR')
+        if output_dir:
+            profiler = Profiler(output_dir, trace_allocations=os.getenv('PROFILING_ALLOCATIONS', '1') != '0')
+            profiler.start()
+            atexit.register(profiler.dump)
+            _environment_profiler = profiler
+            logger.info(f'Profiling enabled, results go to {output_dir}')
+        _environment_checked = True
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Takes a tracemalloc snapshot without the profiler's own allocations."""
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, pstats.__file__),
+    ))
+
+
+def _format_sites(sites: list[tuple[tuple[str, int], int]]) -> list[str]:
+    """Formats allocation sites as `size  file:line` lines."""
+    return [f'   {size / 1024:10.1f} KiB  {filename}:{lineno}' for (filename, lineno), size in sites]
@@ -0,0 +1,295 @@
+from src.database.deadline import QueryTimeoutError, remaining_time
+from typing import Any, Callable, Self, TYPE_CHECKING
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, replace
+from functools import wraps
+from enum import IntEnum
+import threading
+import time
+
+if TYPE_CHECKING:
+    from mysql.connector import MySQLConnection
+
+
+class WorkloadClass(IntEnum):
+    """Class of database work; a lower value is admitted first when connections are scarce."""
+
+    LOOKUP = 0
+    INGESTION = 1
+    DEFAULT = 2
+    REPORT = 3
+
+
+active_workload: ContextVar[WorkloadClass] = ContextVar('active_workload', default=WorkloadClass.DEFAULT)
+
+
+class AdmissionTimeoutError(QueryTimeoutError):
+    """Raised when a call waits too long for a connection of its workload class."""
+
+
+class Workload:
+    """Context manager declaring the workload class of all database calls made inside it.
+
+    The class is stored in a context variable, so it applies to nested service
+    and repository calls without passing it explicitly. The innermost
+    declaration wins.
+    """
+
+    def __init__(self, workload_class: WorkloadClass):
+        """Initializes the declaration.
+
+        Args:
+            workload_class (WorkloadClass): Class of the calls made inside the context.
+        """
+        self._workload_class = workload_class
+        self._token: Token[WorkloadClass] | None = None
+
+    def __enter__(self) -> Self:
+        self._token = active_workload.set(self._workload_class)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            active_workload.reset(self._token)
+            self._token = None
+
+
+def workload[**P, R](workload_class: WorkloadClass) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator declaring the workload class of a service or repository method.
+
+    Args:
+        workload_class (WorkloadClass): Class of the database calls made by the method.
+
+    Returns:
+        Callable[[Callable[P, R]], Callable[P, R]]: Decorator running the method inside a `Workload`.
+    """
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            """Wrapper entering the method's workload class."""
+            with Workload(workload_class):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class WorkloadPolicy:
+    """Share of the connection pool given to a workload class.
+
+    Attributes:
+        reserved (int): Connections kept free for the class; other classes cannot take them.
+        limit (int | None): Maximum connections the class may hold at once, or None for no cap.
+    """
+
+    reserved: int = 0
+    limit: int | None = None
+
+
+@dataclass
+class WorkloadStats:
+    """Queueing metrics of a workload class.
+
+    Attributes:
+        in_use (int): Connections currently held by the class.
+        waiting (int): Calls currently queued for a connection.
+        admitted (int): Connections handed out so far.
+        queued (int): Admissions that had to wait.
+        timed_out (int): Calls that gave up waiting.
+        total_wait_seconds (float): Time spent waiting by all admitted calls.
+        max_wait_seconds (float): Longest wait of an admitted call.
+    """
+
+    in_use: int = 0
+    waiting: int = 0
+    admitted: int = 0
+    queued: int = 0
+    timed_out: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """Returns the mean wait of admitted calls."""
+        return self.total_wait_seconds / self.admitted if self.admitted else 0.0
+
+
+DEFAULT_POLICIES: dict[WorkloadClass, WorkloadPolicy] = {
+    WorkloadClass.LOOKUP: WorkloadPolicy(reserved=1),
+}
+
+
+class WorkloadAdmission:
+    """Hands out the slots of a connection pool by workload class and priority.
+
+    A class is admitted when a slot is free, it is below its own `limit`, and
+    taking the slot still leaves the unused reservations of every other class
+    free. When slots run out, callers queue; a freed slot goes to the waiting
+    class with the highest priority that is allowed to take it, so a burst of
+    reports can never starve roadside lookups, while lookups still cannot take
+    more than the pool holds.
+    """
+
+    def __init__(
+        self,
+        policies: dict[WorkloadClass, WorkloadPolicy] | None = None,
+        acquire_timeout: float | None = 30.0,
+    ):
+        """Initializes the admission; its capacity is set by `configure`.
+
+        Args:
+            policies (dict[WorkloadClass, WorkloadPolicy] | None): Reservations and limits per
+                class; defaults to one connection reserved for lookups.
+            acquire_timeout (float | None): Longest wait for a slot in seconds, further
+                shortened by the active deadline; None waits without bound.
+        """
+        self._policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self._acquire_timeout = acquire_timeout
+        self._capacity: int | None = None
+        self._condition = threading.Condition()
+        self._stats = {workload_class: WorkloadStats() for workload_class in WorkloadClass}
+
+    def configure(self, capacity: int) -> None:
+        """Sets the number of slots, i.e. the size of the connection pool.
+
+        Args:
+            capacity (int): Number of connections in the pool.
+
+        Raises:
+            ValueError: If the reservations do not leave at least one slot unreserved.
+        """
+        reserved = sum(policy.reserved for policy in self._policies.values())
+        if reserved >= capacity:
+            raise ValueError(f'Workload reservations ({reserved}) must be smaller than the pool size ({capacity})')
+        with self._condition:
+            self._capacity = capacity
+
+    def acquire(self, workload_class: WorkloadClass) -> None:
+        """Waits until the class may take a slot and takes it.
+
+        Args:
+            workload_class (WorkloadClass): Class of the caller.
+
+        Raises:
+            AdmissionTimeoutError: If no slot was granted within the timeout or the active deadline.
+        """
+        budget = remaining_time(self._acquire_timeout)
+        stats = self._stats[workload_class]
+        with self._condition:
+            if self._may_admit(workload_class):
+                self._admit(workload_class, 0.0)
+                return
+
+            start = time.monotonic()
+            expires = None if budget is None else start + budget
+            stats.waiting += 1
+            stats.queued += 1
+            try:
+                while not self._may_admit(workload_class):
+                    timeout = None if expires is None else expires - time.monotonic()
+                    if timeout is not None and timeout <= 0:
+                        stats.timed_out += 1
+                        raise AdmissionTimeoutError(
+                            f'No {workload_class.name.lower()} connection was free within {budget:.3f} s'
+                        )
+                    self._condition.wait(timeout)
+            finally:
+                stats.waiting -= 1
+                self._condition.notify_all()
+            self._admit(workload_class, time.monotonic() - start)
+
+    def release(self, workload_class: WorkloadClass) -> None:
+        """Returns a slot taken by `acquire` and wakes the queued callers.
+
+        Args:
+            workload_class (WorkloadClass): Class that took the slot.
+        """
+        with self._condition:
+            self._stats[workload_class].in_use -= 1
+            self._condition.notify_all()
+
+    def stats(self) -> dict[WorkloadClass, WorkloadStats]:
+        """Returns a snapshot of the queueing metrics of every class.
+
+        Returns:
+            dict[WorkloadClass, WorkloadStats]: Copies of the metrics keyed by class.
+        """
+        with self._condition:
+            return {workload_class: replace(stats) for workload_class, stats in self._stats.items()}
+
+    def _admit(self, workload_class: WorkloadClass, waited: float) -> None:
+        """Records a granted slot; the condition must be held."""
+        stats = self._stats[workload_class]
+        stats.in_use += 1
+        stats.admitted += 1
+        stats.total_wait_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+
+    def _may_admit(self, workload_class: WorkloadClass) -> bool:
+        """Checks whether the class may take a slot now, giving way to queued classes of higher priority."""
+        if not self._fits(workload_class):
+            return False
+        return not any(
+            self._stats[other].waiting and self._fits(other)
+            for other in WorkloadClass
+            if other < workload_class
+        )
+
+    def _fits(self, workload_class: WorkloadClass) -> bool:
+        """Checks the capacity, limit and reservation rules for one more slot of the class."""
+        capacity = self._capacity
+        if capacity is None:
+            return True
+        policy = self._policies.get(workload_class, WorkloadPolicy())
+        in_use = self._stats[workload_class].in_use
+        if policy.limit is not None and in_use >= policy.limit:
+            return False
+        free = capacity - sum(stats.in_use for stats in self._stats.values())
+        kept_for_others = sum(
+            max(0, policy.reserved - self._stats[other].in_use)
+            for other, policy in self._policies.items()
+            if other != workload_class
+        )
+        return free > kept_for_others
+
+
+class AdmittedConnection:
+    """Pooled connection that returns its admission slot when closed.
+
+    Every attribute other than `close` and the context manager protocol is
+    delegated to the wrapped connection.
+    """
+
+    def __init__(self, connection: 'MySQLConnection', admission: WorkloadAdmission, workload_class: WorkloadClass):
+        """Wraps a connection checked out under an admission slot.
+
+        Args:
+            connection (MySQLConnection): Connection taken from the pool.
+            admission (WorkloadAdmission): Admission that granted the slot.
+            workload_class (WorkloadClass): Class the slot was granted to.
+        """
+        self._connection = connection
+        self._admission = admission
+        self.workload_class = workload_class
+        self._released = False
+
+    def close(self) -> None:
+        """Returns the connection to the pool, then its slot to the admission; later calls do nothing."""
+        if self._released:
+            return
+        self._released = True
+        try:
+            self._connection.close()
+        finally:
+            self._admission.release(self.workload_class)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -1,7 +1,8 @@
-from src.domain.typed_dict import SpeedCameraDict, DriverDict, OffenseDict, ViolationDict
+from src.domain.typed_dict import SpeedCameraDict, CameraSectionDict, DriverDict, OffenseDict, ViolationDict
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Self, override
+from typing import Protocol, Self, override
 
 
 @dataclass
@@ -62,6 +63,46 @@ class SpeedCamera(Entity[SpeedCameraDict]):
         )
 
 
+@dataclass
+class CameraSection(Entity[CameraSectionDict]):
+    """Represents a pair of speed cameras enforcing an average speed limit.
+
+    Attributes:
+        id_ (int | None): Unique identifier of the section.
+        entry_camera_id (int | None): ID of the speed camera at the start of the section.
+        exit_camera_id (int | None): ID of the speed camera at the end of the section.
+        distance_m (int | None): Road distance between the cameras in meters.
+        speed_limit (int | None): Maximum allowed average speed (km/h) over the section.
+        max_travel_seconds (int | None): Longest travel time still matched as one passage.
+    """
+
+    entry_camera_id: int | None = None
+    exit_camera_id: int | None = None
+    distance_m: int | None = None
+    speed_limit: int | None = None
+    max_travel_seconds: int | None = None
+
+    @classmethod
+    @override
+    def from_row(cls, row: CameraSectionDict) -> Self:
+        """Creates a CameraSection entity from a dictionary row.
+
+        Args:
+            row (CameraSectionDict): Dictionary containing section data.
+
+        Returns:
+            CameraSection: Entity instance populated with the given row data.
+        """
+        return cls(
+            id_=row["id_"],
+            entry_camera_id=row["entry_camera_id"],
+            exit_camera_id=row["exit_camera_id"],
+            distance_m=row["distance_m"],
+            speed_limit=row["speed_limit"],
+            max_travel_seconds=row["max_travel_seconds"],
+        )
+
+
 @dataclass
 class Driver(Entity[DriverDict]):
     """Represents a driver record from the database.
@@ -130,10 +171,41 @@ class Offense(Entity[OffenseDict]):
         )
 
 
+class RelationLoader(Protocol):
+    """Loads entities related to violations, batching lookups of many violations.
+
+    Implemented by `src.domain.loader.RelationLoaderScope`.
+    """
+
+    def register(self, violation: 'Violation') -> None:
+        """Records the related IDs of a newly created violation for the next batch."""
+        ...
+
+    def driver(self, driver_id: int | None) -> Driver | None:
+        """Returns the driver with the given ID."""
+        ...
+
+    def speed_camera(self, speed_camera_id: int | None) -> SpeedCamera | None:
+        """Returns the speed camera with the given ID."""
+        ...
+
+    def offense(self, offense_id: int | None) -> Offense | None:
+        """Returns the offense with the given ID."""
+        ...
+
+
+active_relation_loader: ContextVar[RelationLoader | None] = ContextVar('active_relation_loader', default=None)
+
+
 @dataclass
 class Violation(Entity[ViolationDict]):
     """Represents a traffic violation record from the database.
 
+    Inside a `RelationLoaderScope`, the related `driver`, `speed_camera` and
+    `offense` can be accessed directly; they are loaded in batches covering
+    all violations created in the scope. Violations returned by
+    `ViolationRepository.find_with_relations` carry them already attached.
+
     Attributes:
         id_ (int | None): Unique identifier of the violation.
         violation_date (str | None): ISO 8601 formatted date of the violation.
@@ -147,6 +219,67 @@ class Violation(Entity[ViolationDict]):
     speed_camera_id: int | None = None
     offense_id: int | None = None
 
+    def __post_init__(self) -> None:
+        """Registers the violation with the active relation loader, if any."""
+        self._relations_attached = False
+        self._driver: Driver | None = None
+        self._speed_camera: SpeedCamera | None = None
+        self._offense: Offense | None = None
+        loader = active_relation_loader.get()
+        if loader is not None:
+            loader.register(self)
+
+    @property
+    def driver(self) -> Driver | None:
+        """Driver involved in the violation, loaded in a batch with other violations."""
+        if self._relations_attached:
+            return self._driver
+        return self._relation_loader().driver(self.driver_id)
+
+    @property
+    def speed_camera(self) -> SpeedCamera | None:
+        """Speed camera that recorded the violation, loaded in a batch with other violations."""
+        if self._relations_attached:
+            return self._speed_camera
+        return self._relation_loader().speed_camera(self.speed_camera_id)
+
+    @property
+    def offense(self) -> Offense | None:
+        """Offense definition of the violation, loaded in a batch with other violations."""
+        if self._relations_attached:
+            return self._offense
+        return self._relation_loader().offense(self.offense_id)
+
+    def attach_relations(
+        self,
+        driver: Driver | None,
+        speed_camera: SpeedCamera | None,
+        offense: Offense | None,
+    ) -> None:
+        """Attaches eagerly loaded related entities, bypassing the relation loader.
+
+        Args:
+            driver (Driver | None): Driver involved in the violation.
+            speed_camera (SpeedCamera | None): Speed camera that recorded the violation.
+            offense (Offense | None): Offense definition of the violation.
+        """
+        self._driver = driver
+        self._speed_camera = speed_camera
+        self._offense = offense
+        self._relations_attached = True
+
+    @staticmethod
+    def _relation_loader() -> RelationLoader:
+        """Returns the active relation loader.
+
+        Raises:
+            RuntimeError: If related entities are accessed outside a loader scope.
+        """
+        loader = active_relation_loader.get()
+        if loader is None:
+            raise RuntimeError('Related entities of a violation can only be loaded inside a RelationLoaderScope')
+        return loader
+
     @classmethod
     @override
     def from_row(cls, row: ViolationDict) -> Self:
@@ -160,7 +293,7 @@ class Violation(Entity[ViolationDict]):
         """
         return cls(
             id_=row["id_"],
-            violation_date=row["violation_date"].isoformat() if "violation_date" in row else None,
+            violation_date=row["violation_date"].isoformat() if row.get("violation_date") else None,
             driver_id=row["driver_id"],
             speed_camera_id=row["speed_camera_id"],
             offense_id=row["offense_id"],
@@ -0,0 +1,201 @@
+from src.domain.plate_index import normalize_plate
+from dataclasses import dataclass
+from typing import Iterable
+import threading
+import string
+
+CONFUSABLE_GROUPS = ['0ODQ', '1IL', '2Z', '5S', '6G', '8B']
+
+CANONICAL = {char: group[0] for group in CONFUSABLE_GROUPS for char in group}
+
+CANONICAL_TABLE = str.maketrans(CANONICAL)
+
+CANONICAL_ALPHABET = sorted({CANONICAL.get(char, char) for char in string.digits + string.ascii_uppercase})
+
+
+def canonical_plate(registration_number: str) -> str:
+    """Maps a normalized registration number to its OCR-confusion canonical form.
+
+    Characters that OCR commonly confuses (e.g. `0`/`O`, `8`/`B`, `1`/`I`) are
+    replaced by one representative, so plates differing only in such
+    characters share the same canonical form.
+
+    Args:
+        registration_number (str): Normalized registration number.
+
+    Returns:
+        str: Canonical form of the registration number.
+    """
+    return registration_number.translate(CANONICAL_TABLE)
+
+
+def plate_distance(first: str, second: str, confusion_cost: float = 0.25) -> float:
+    """Computes a confusion-aware edit distance between two normalized plates.
+
+    Insertions, deletions, transpositions and substitutions cost 1, except that
+    substituting a character with an OCR-confusable one costs `confusion_cost`.
+
+    Args:
+        first (str): First normalized registration number.
+        second (str): Second normalized registration number.
+        confusion_cost (float): Cost of substituting confusable characters.
+
+    Returns:
+        float: Edit distance between the plates.
+    """
+    rows = len(first) + 1
+    columns = len(second) + 1
+    distances = [[0.0] * columns for _ in range(rows)]
+    for i in range(rows):
+        distances[i][0] = float(i)
+    for j in range(columns):
+        distances[0][j] = float(j)
+
+    for i in range(1, rows):
+        for j in range(1, columns):
+            a, b = first[i - 1], second[j - 1]
+            if a == b:
+                substitution = 0.0
+            elif CANONICAL.get(a, a) == CANONICAL.get(b, b):
+                substitution = confusion_cost
+            else:
+                substitution = 1.0
+            distance = min(
+                distances[i - 1][j] + 1,
+                distances[i][j - 1] + 1,
+                distances[i - 1][j - 1] + substitution,
+            )
+            if i > 1 and j > 1 and a == second[j - 2] and first[i - 2] == b:
+                distance = min(distance, distances[i - 2][j - 2] + 1)
+            distances[i][j] = distance
+
+    return distances[-1][-1]
+
+
+@dataclass(frozen=True, slots=True)
+class PlateMatch:
+    """Candidate driver for a possibly misread registration number.
+
+    Attributes:
+        driver_id (int): ID of the candidate driver.
+        registration_number (str): Normalized registration number of the driver.
+        distance (float): Confusion-aware edit distance from the queried plate.
+    """
+
+    driver_id: int
+    registration_number: str
+    distance: float
+
+
+class FuzzyPlateIndex:
+    """Approximate matching index over normalized registration numbers.
+
+    Plates are grouped by their canonical form, so OCR confusions alone resolve
+    with a single dictionary lookup. Candidates within `k` further edits are
+    found by generating the query's edit neighbourhood in the reduced canonical
+    alphabet and probing the dictionary, which keeps memory at one entry per
+    plate. Each candidate is then verified with `plate_distance`.
+    """
+
+    def __init__(self, confusion_cost: float = 0.25) -> None:
+        """Initializes an empty index.
+
+        Args:
+            confusion_cost (float): Cost of substituting OCR-confusable characters.
+        """
+        self._confusion_cost = confusion_cost
+        self._groups: dict[str, dict[int, str]] = {}
+        self._canonical_plates: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._canonical_plates)
+
+    def add(self, driver_id: int, registration_number: str) -> None:
+        """Indexes a driver's plate, replacing the driver's previous plate.
+
+        Args:
+            driver_id (int): ID of the driver.
+            registration_number (str): Registration number in any formatting.
+        """
+        plate = normalize_plate(registration_number)
+        canonical = canonical_plate(plate)
+        with self._lock:
+            self._discard(driver_id)
+            self._groups.setdefault(canonical, {})[driver_id] = plate
+            self._canonical_plates[driver_id] = canonical
+
+    def remove(self, driver_id: int) -> None:
+        """Removes a driver from the index.
+
+        Args:
+            driver_id (int): ID of the driver.
+        """
+        with self._lock:
+            self._discard(driver_id)
+
+    def match(self, registration_number: str, max_distance: int = 1) -> list[PlateMatch]:
+        """Finds drivers whose plate is within a confusion-aware edit distance.
+
+        Args:
+            registration_number (str): Registration number as read by the camera.
+            max_distance (int): Maximum edit distance of returned candidates.
+
+        Returns:
+            list[PlateMatch]: Candidates ordered by distance, closest first.
+        """
+        plate = normalize_plate(registration_number)
+        groups = self._groups
+        matches: list[PlateMatch] = []
+        for canonical in self._neighbourhood(canonical_plate(plate), max_distance):
+            for driver_id, candidate in list(groups.get(canonical, {}).items()):
+                distance = plate_distance(plate, candidate, self._confusion_cost)
+                if distance <= max_distance:
+                    matches.append(PlateMatch(driver_id, candidate, distance))
+        return sorted(matches, key=lambda match: (match.distance, match.driver_id))
+
+    def match_many(self, registration_numbers: Iterable[str], max_distance: int = 1) -> dict[str, list[PlateMatch]]:
+        """Finds candidates for many plates.
+
+        Args:
+            registration_numbers (Iterable[str]): Registration numbers as read by cameras.
+            max_distance (int): Maximum edit distance of returned candidates.
+
+        Returns:
+            dict[str, list[PlateMatch]]: Candidates keyed by the registration number as given;
+                plates without candidates are omitted.
+        """
+        result: dict[str, list[PlateMatch]] = {}
+        for registration_number in registration_numbers:
+            matches = self.match(registration_number, max_distance)
+            if matches:
+                result[registration_number] = matches
+        return result
+
+    @staticmethod
+    def _neighbourhood(canonical: str, max_distance: int) -> set[str]:
+        """Generates all strings within `max_distance` edits in the canonical alphabet."""
+        found = {canonical}
+        frontier = {canonical}
+        for _ in range(max_distance):
+            edits: set[str] = set()
+            for word in frontier:
+                splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+                edits.update(left + right[1:] for left, right in splits if right)
+                edits.update(left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1)
+                for char in CANONICAL_ALPHABET:
+                    edits.update(left + char + right[1:] for left, right in splits if right)
+                    edits.update(left + char + right for left, right in splits)
+            frontier = edits - found
+            found |= edits
+        return found
+
+    def _discard(self, driver_id: int) -> None:
+        """Removes a driver's plate; the caller must hold the lock."""
+        canonical = self._canonical_plates.pop(driver_id, None)
+        if canonical is None:
+            return
+        group = self._groups[canonical]
+        group.pop(driver_id, None)
+        if not group:
+            del self._groups[canonical]
@@ -0,0 +1,133 @@
+from src.domain.repository import CrudRepository, DriverRepository, SpeedCameraRepository, OffenseRepository
+from src.domain.entity import Driver, SpeedCamera, Offense, Violation, Entity, active_relation_loader
+from contextvars import Token
+from itertools import batched
+from typing import Self
+from src.config import logger
+
+
+class BatchLoader[T: Entity]:
+    """DataLoader-style batcher of primary key lookups for one repository.
+
+    IDs are collected as pending until one of them is requested. The first
+    request fetches all pending IDs with `find_by_ids`, and every result,
+    including IDs that do not exist, is memoized for the lifetime of the loader.
+    """
+
+    def __init__(self, repository: CrudRepository[T], max_batch_size: int = 1_000):
+        """Initializes the loader.
+
+        Args:
+            repository (CrudRepository[T]): Repository used to fetch entities.
+            max_batch_size (int): Maximum number of IDs fetched by one query.
+        """
+        self._repository = repository
+        self._max_batch_size = max_batch_size
+        self._pending: set[int] = set()
+        self._cache: dict[int, T | None] = {}
+        self.queries = 0
+
+    def prime(self, item_id: int | None) -> None:
+        """Schedules an ID to be fetched with the next batch.
+
+        Args:
+            item_id (int | None): ID of an entity that is likely to be requested.
+        """
+        if item_id is not None and item_id not in self._cache:
+            self._pending.add(item_id)
+
+    def load(self, item_id: int | None) -> T | None:
+        """Returns an entity, fetching it together with all pending IDs if needed.
+
+        Args:
+            item_id (int | None): ID of the requested entity.
+
+        Returns:
+            T | None: The entity, or None if it does not exist.
+        """
+        if item_id is None:
+            return None
+        if item_id not in self._cache:
+            self._pending.add(item_id)
+            self._dispatch()
+        return self._cache[item_id]
+
+    def _dispatch(self) -> None:
+        """Fetches all pending IDs and memoizes the results."""
+        pending, self._pending = self._pending, set()
+        for chunk in batched(sorted(pending), self._max_batch_size):
+            self.queries += 1
+            found = {entity.id_: entity for entity in self._repository.find_by_ids(chunk)}
+            for item_id in chunk:
+                self._cache[item_id] = found.get(item_id)
+
+
+class RelationLoaderScope:
+    """Request scope in which violations load their related entities in batches.
+
+    Every `Violation` created inside the scope, e.g. by `find_all`, registers its
+    driver, camera and offense IDs. The first access to `violation.driver` then
+    fetches the drivers of all registered violations with one query, and the
+    same for cameras and offenses, so iterating over violations and their
+    relations does not issue a query per violation.
+
+    Example:
+        with RelationLoaderScope(driver_repository, speed_camera_repository, offense_repository):
+            for violation in violation_repository.find_all():
+                print(violation.driver.last_name, violation.offense.fine_amount)
+    """
+
+    def __init__(
+        self,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        max_batch_size: int = 1_000,
+    ):
+        """Initializes the scope.
+
+        Args:
+            driver_repository (DriverRepository): Repository for drivers.
+            speed_camera_repository (SpeedCameraRepository): Repository for speed cameras.
+            offense_repository (OffenseRepository): Repository for offenses.
+            max_batch_size (int): Maximum number of IDs fetched by one query.
+        """
+        self.drivers = BatchLoader[Driver](driver_repository, max_batch_size)
+        self.speed_cameras = BatchLoader[SpeedCamera](speed_camera_repository, max_batch_size)
+        self.offenses = BatchLoader[Offense](offense_repository, max_batch_size)
+        self._token: Token | None = None
+
+    def __enter__(self) -> Self:
+        self._token = active_relation_loader.set(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            active_relation_loader.reset(self._token)
+            self._token = None
+        logger.debug(
+            f'Relation loader scope used {self.drivers.queries + self.speed_cameras.queries + self.offenses.queries} '
+            f'queries'
+        )
+
+    def register(self, violation: Violation) -> None:
+        """Schedules the related IDs of a violation for the next batch.
+
+        Args:
+            violation (Violation): Violation created inside the scope.
+        """
+        self.drivers.prime(violation.driver_id)
+        self.speed_cameras.prime(violation.speed_camera_id)
+        self.offenses.prime(violation.offense_id)
+
+    def driver(self, driver_id: int | None) -> Driver | None:
+        """Returns the driver with the given ID, batching pending lookups."""
+        return self.drivers.load(driver_id)
+
+    def speed_camera(self, speed_camera_id: int | None) -> SpeedCamera | None:
+        """Returns the speed camera with the given ID, batching pending lookups."""
+        return self.speed_cameras.load(speed_camera_id)
+
+    def offense(self, offense_id: int | None) -> Offense | None:
+        """Returns the offense with the given ID, batching pending lookups."""
+        return self.offenses.load(offense_id)
@@ -0,0 +1,93 @@
+from typing import Iterable
+import threading
+
+PLATE_SEPARATORS = str.maketrans('', '', ' -')
+
+
+def normalize_plate(registration_number: str) -> str:
+    """Normalizes a registration number for lookups.
+
+    Args:
+        registration_number (str): Registration number as read or stored, e.g. `kr 4f2-a1`.
+
+    Returns:
+        str: Upper-case registration number without spaces and dashes, e.g. `KR4F2A1`.
+    """
+    return registration_number.translate(PLATE_SEPARATORS).upper()
+
+
+class PlateIndex:
+    """In-memory mapping from normalized registration number to driver ID.
+
+    Only the plate and the ID are kept, not whole `Driver` objects. A reverse
+    mapping allows updates and deletes by driver ID. Lookups do not take the
+    lock; writers hold it so concurrent updates stay consistent.
+
+    Attributes:
+        warmed (bool): Whether the index has been filled from the database.
+    """
+
+    def __init__(self) -> None:
+        self._driver_ids: dict[str, int] = {}
+        self._plates: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.warmed = False
+
+    def __len__(self) -> int:
+        return len(self._driver_ids)
+
+    def add(self, driver_id: int, registration_number: str) -> None:
+        """Indexes a driver's plate, replacing the driver's previous plate.
+
+        Args:
+            driver_id (int): ID of the driver.
+            registration_number (str): Registration number of the driver.
+        """
+        plate = normalize_plate(registration_number)
+        with self._lock:
+            self._discard(driver_id)
+            self._driver_ids[plate] = driver_id
+            self._plates[driver_id] = plate
+
+    def remove(self, driver_id: int) -> None:
+        """Removes a driver from the index.
+
+        Args:
+            driver_id (int): ID of the driver.
+        """
+        with self._lock:
+            self._discard(driver_id)
+
+    def resolve(self, registration_number: str) -> int | None:
+        """Looks up the driver ID of a single plate.
+
+        Args:
+            registration_number (str): Registration number in any formatting.
+
+        Returns:
+            int | None: Driver ID, or None if the plate is unknown.
+        """
+        return self._driver_ids.get(normalize_plate(registration_number))
+
+    def resolve_many(self, registration_numbers: Iterable[str]) -> dict[str, int]:
+        """Looks up driver IDs of many plates.
+
+        Args:
+            registration_numbers (Iterable[str]): Registration numbers in any formatting.
+
+        Returns:
+            dict[str, int]: Driver ID keyed by the registration number as given; unknown plates are omitted.
+        """
+        driver_ids = self._driver_ids
+        result: dict[str, int] = {}
+        for registration_number in registration_numbers:
+            driver_id = driver_ids.get(normalize_plate(registration_number))
+            if driver_id is not None:
+                result[registration_number] = driver_id
+        return result
+
+    def _discard(self, driver_id: int) -> None:
+        """Removes a driver's plate; the caller must hold the lock."""
+        plate = self._plates.pop(driver_id, None)
+        if plate is not None and self._driver_ids.get(plate) == driver_id:
+            del self._driver_ids[plate]
@@ -0,0 +1,253 @@
+from dataclasses import dataclass, replace
+from datetime import date
+from functools import lru_cache
+from typing import Self
+
+
+@dataclass(frozen=True, slots=True)
+class Eq:
+    """Matches rows whose column equals a value; a None value matches NULL columns.
+
+    Attributes:
+        column (str): Column to compare.
+        value (object): Expected value, or None to match `is null`.
+    """
+
+    column: str
+    value: object
+
+    def shape(self) -> tuple:
+        """Returns the part of the query shape contributed by the filter."""
+        return 'eq', self.column, self.value is None
+
+    def params(self) -> tuple:
+        """Returns the query parameters bound by the filter."""
+        return () if self.value is None else (self.value,)
+
+
+@dataclass(frozen=True, slots=True)
+class In:
+    """Matches rows whose column equals one of the given values.
+
+    Attributes:
+        column (str): Column to compare.
+        values (tuple): Accepted values; an empty tuple matches no rows.
+    """
+
+    column: str
+    values: tuple
+
+    def shape(self) -> tuple:
+        """Returns the part of the query shape contributed by the filter."""
+        return 'in', self.column, len(self.values)
+
+    def params(self) -> tuple:
+        """Returns the query parameters bound by the filter."""
+        return self.values
+
+
+@dataclass(frozen=True, slots=True)
+class Range:
+    """Matches rows whose column lies between inclusive bounds.
+
+    Attributes:
+        column (str): Column to compare.
+        low (object | None): Lower bound, or None for no lower bound.
+        high (object | None): Upper bound, or None for no upper bound.
+
+    Raises:
+        ValueError: If neither bound is given.
+    """
+
+    column: str
+    low: object | None = None
+    high: object | None = None
+
+    def __post_init__(self) -> None:
+        """Rejects a range without bounds, which would match every row."""
+        if self.low is None and self.high is None:
+            raise ValueError(f'Range on {self.column} needs a lower or an upper bound')
+
+    def shape(self) -> tuple:
+        """Returns the part of the query shape contributed by the filter."""
+        return 'range', self.column, self.low is not None, self.high is not None
+
+    def params(self) -> tuple:
+        """Returns the query parameters bound by the filter."""
+        return tuple(bound for bound in (self.low, self.high) if bound is not None)
+
+
+@dataclass(frozen=True, slots=True)
+class DateWindow:
+    """Matches rows whose date column lies in the half-open window `[start, end)`.
+
+    Attributes:
+        column (str): Date column to compare.
+        start (date | str): First date in the window.
+        end (date | str): First date after the window.
+    """
+
+    column: str
+    start: date | str
+    end: date | str
+
+    def shape(self) -> tuple:
+        """Returns the part of the query shape contributed by the filter."""
+        return 'window', self.column
+
+    def params(self) -> tuple:
+        """Returns the query parameters bound by the filter."""
+        return self.start, self.end
+
+
+type Filter = Eq | In | Range | DateWindow
+
+
+@dataclass(frozen=True, slots=True)
+class OrderBy:
+    """Sort key of a query.
+
+    Attributes:
+        column (str): Column to sort by.
+        descending (bool): Whether to sort from the largest value.
+    """
+
+    column: str
+    descending: bool = False
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """Specification of a repository read: filters, ordering, limit and projection.
+
+    Filters are combined with AND. Specifications with the same shape, i.e.
+    the same columns, filter kinds and number of `In` values, compile to the
+    same parameterized statement, which is cached.
+
+    Attributes:
+        filters (tuple[Filter, ...]): Conditions rows must satisfy.
+        order_by (tuple[OrderBy, ...]): Sort keys, most significant first.
+        limit (int | None): Maximum number of returned rows.
+        columns (tuple[str, ...] | None): Columns to fetch; None fetches all columns.
+    """
+
+    filters: tuple[Filter, ...] = ()
+    order_by: tuple[OrderBy, ...] = ()
+    limit: int | None = None
+    columns: tuple[str, ...] | None = None
+
+    def where(self, *filters: Filter) -> Self:
+        """Returns a copy of the specification with additional filters."""
+        return replace(self, filters=self.filters + filters)
+
+    def order(self, column: str, descending: bool = False) -> Self:
+        """Returns a copy of the specification with an additional sort key."""
+        return replace(self, order_by=self.order_by + (OrderBy(column, descending),))
+
+    def take(self, limit: int) -> Self:
+        """Returns a copy of the specification returning at most `limit` rows."""
+        return replace(self, limit=limit)
+
+    def select(self, *columns: str) -> Self:
+        """Returns a copy of the specification fetching only the given columns."""
+        return replace(self, columns=columns)
+
+    def shape(self) -> tuple:
+        """Returns the hashable shape identifying the compiled statement."""
+        return (
+            tuple(query_filter.shape() for query_filter in self.filters),
+            tuple((order.column, order.descending) for order in self.order_by),
+            self.limit is not None,
+            self.columns,
+        )
+
+    def params(self) -> tuple:
+        """Returns the query parameters in statement order."""
+        params = tuple(value for query_filter in self.filters for value in query_filter.params())
+        return params + ((self.limit,) if self.limit is not None else ())
+
+    def referenced_columns(self) -> set[str]:
+        """Returns every column referenced by the specification."""
+        return (
+            {query_filter.column for query_filter in self.filters}
+            | {order.column for order in self.order_by}
+            | set(self.columns or ())
+        )
+
+
+def compile_select(table: str, spec: QuerySpec) -> tuple[str, tuple]:
+    """Compiles a specification into a parameterized SELECT statement.
+
+    Column names are interpolated into the statement, so callers must validate
+    them against the table's columns first.
+
+    Args:
+        table (str): Table to read from.
+        spec (QuerySpec): Specification of the query.
+
+    Returns:
+        tuple[str, tuple]: SQL statement and its parameters.
+    """
+    return _compile_select(table, spec.shape()), spec.params()
+
+
+def compile_delete(table: str, spec: QuerySpec, limit: int) -> tuple[str, tuple]:
+    """Compiles the filters of a specification into a parameterized, limited DELETE statement.
+
+    Args:
+        table (str): Table to delete from.
+        spec (QuerySpec): Specification whose filters select the rows.
+        limit (int): Maximum number of rows deleted by one execution.
+
+    Returns:
+        tuple[str, tuple]: SQL statement and its parameters.
+
+    Raises:
+        ValueError: If the filters compile to no condition.
+    """
+    filter_shapes = tuple(query_filter.shape() for query_filter in spec.filters)
+    params = tuple(value for query_filter in spec.filters for value in query_filter.params())
+    return _compile_delete(table, filter_shapes), params + (limit,)
+
+
+@lru_cache(maxsize=512)
+def _compile_select(table: str, shape: tuple) -> str:
+    """Builds the statement for one query shape; cached per table and shape."""
+    filter_shapes, order_by, has_limit, columns = shape
+    sql = f'select {", ".join(columns) if columns else "*"} from {table}'
+    sql += _where_clause(filter_shapes)
+    if order_by:
+        sql += f' order by {", ".join(f"{column} desc" if descending else column for column, descending in order_by)}'
+    if has_limit:
+        sql += ' limit %s'
+    return sql
+
+
+@lru_cache(maxsize=512)
+def _compile_delete(table: str, filter_shapes: tuple) -> str:
+    """Builds the chunked delete statement for one filter shape; cached per table and shape."""
+    where_clause = _where_clause(filter_shapes)
+    if not where_clause:
+        raise ValueError('Refusing to delete without a condition')
+    return f'delete from {table}{where_clause} limit %s'
+
+
+def _where_clause(filter_shapes: tuple) -> str:
+    """Builds the WHERE clause for the given filter shapes, or an empty string without filters."""
+    conditions: list[str] = []
+    for kind, column, *details in filter_shapes:
+        match kind:
+            case 'eq':
+                conditions.append(f'{column} is null' if details[0] else f'{column} = %s')
+            case 'in':
+                count = details[0]
+                conditions.append(f'{column} in ({", ".join(["%s"] * count)})' if count else '1 = 0')
+            case 'range':
+                has_low, has_high = details
+                if has_low:
+                    conditions.append(f'{column} >= %s')
+                if has_high:
+                    conditions.append(f'{column} <= %s')
+            case 'window':
+                conditions.extend([f'{column} >= %s', f'{column} < %s'])
+    return f' where {" and ".join(conditions)}' if conditions else ''
@@ -1,12 +1,72 @@
-from src.domain.typed_dict import DriverOffensesDict, TopDriverDict, PopularSpeedCameraDict, SummaryStatisticDict
-from src.database.connection import MySQLConnectionManager, with_db_connection
-from src.domain.entity import Driver, Offense, Violation, SpeedCamera, Entity
-from mysql.connector.connection import MySQLCursor, MySQLConnection
-from typing import Type, cast
-import inflection
+from src.domain.typed_dict import (
+    DriverOffensesDict,
+    TopDriverDict,
+    PopularSpeedCameraDict,
+    SummaryStatisticDict,
+    ViolationFilterDict,
+    ViolationDict,
+    CombinedStatisticsDict,
+    FineNoticeDict,
+    ViolationRollupDict,
+    OutboxLagDict,
+)
+from src.analytics.aggregation import ViolationAggregate, ViolationAggregation
+from src.database.connection import MySQLConnectionManager, ConnectionHolder, with_db_connection
+from src.database.workload import WorkloadClass, workload
+from src.domain.entity import Driver, Offense, Violation, SpeedCamera, CameraSection, Entity
+from src.domain.fuzzy_plate_index import FuzzyPlateIndex, PlateMatch
+from src.domain.plate_index import PlateIndex
+from src.domain.query import QuerySpec, compile_select, compile_delete
+from typing import Callable, Collection, Iterable, Literal, Type, TYPE_CHECKING, cast
+from datetime import date, datetime
+from dataclasses import dataclass
+from functools import cache
+from itertools import batched
+
+if TYPE_CHECKING:
+    from mysql.connector import MySQLConnection
+from decimal import Decimal
+
+
+@dataclass(frozen=True)
+class TableMetadata:
+    """Table name and columns of an entity, derived once per entity type.
+
+    Attributes:
+        table_name (str): Pluralized, snake_case name of the entity's table.
+        columns (tuple[str, ...]): All columns, starting with `id_`.
+        insert_columns (tuple[str, ...]): Columns written by INSERT and UPDATE (excluding `id_`).
+        insert_column_list (str): Comma-separated `insert_columns`.
+    """
+
+    table_name: str
+    columns: tuple[str, ...]
+    insert_columns: tuple[str, ...]
+    insert_column_list: str
 
 
-class CrudRepository[T: Entity]:
+@cache
+def table_metadata(entity_type: Type[Entity]) -> TableMetadata:
+    """Derives the table metadata of an entity type.
+
+    Args:
+        entity_type (Type[Entity]): Entity class, e.g. `Driver`.
+
+    Returns:
+        TableMetadata: Table name and columns of the entity.
+    """
+    import inflection
+
+    insert_columns = tuple(field for field in entity_type.__annotations__ if field != 'id_')
+    return TableMetadata(
+        table_name=inflection.pluralize(inflection.underscore(entity_type.__name__)),
+        columns=('id_', *insert_columns),
+        insert_columns=insert_columns,
+        insert_column_list=', '.join(insert_columns),
+    )
+
+
+class CrudRepository[T: Entity](ConnectionHolder):
     """Generic repository providing basic CRUD operations for entities.
 
     This class defines reusable methods for interacting with MySQL tables
@@ -15,15 +75,14 @@ class CrudRepository[T: Entity]:
     Attributes:
         _connection_manager (MySQLConnectionManager): Manages pooled database connections.
         _entity_type (Type[T]): Entity class handled by the repository (e.g., `Driver`, `Offense`).
-        _cursor (MySQLCursor): Active database cursor for query execution.
-        _conn (MySQLConnection): Active MySQL connection object.
+        _cursor (MySQLCursor): Active database cursor for query execution, kept per thread.
+        _conn (MySQLConnection): Active MySQL connection object, kept per thread.
     """
 
     def __init__(self, connection_manager: MySQLConnectionManager, entity_type: Type[T]):
         self._connection_manager = connection_manager
         self._entity_type = entity_type
-        self._cursor: MySQLCursor
-        self._conn: MySQLConnection
+        self._metadata = table_metadata(entity_type)
 
     @with_db_connection
     def find_all(self) -> list[T]:
@@ -67,6 +126,58 @@ class CrudRepository[T: Entity]:
             return self._entity_type.from_row(self._convert_row_to_dict(columns, item))
         return None
 
+    @with_db_connection
+    def find_by_ids(self, item_ids: Collection[int]) -> list[T]:
+        """Finds all records whose primary key is in the given collection, in one query.
+
+        Args:
+            item_ids (Collection[int]): Identifiers of the entities to retrieve.
+
+        Returns:
+            list[T]: Matching entity instances, in no particular order.
+        """
+        if not item_ids:
+            return []
+
+        sql = f'select * from {self._table_name()} where id_ in ({", ".join(["%s"] * len(item_ids))})'
+        self._cursor.execute(sql, tuple(item_ids))
+        return self._fetch_entities()
+
+    @with_db_connection
+    def find(self, spec: QuerySpec) -> list[T]:
+        """Finds records matching a query specification.
+
+        Filtering, ordering, limiting and projection are done by the database.
+        Fields of columns left out of the projection are None.
+
+        Args:
+            spec (QuerySpec): Filters, ordering, limit and projected columns.
+
+        Returns:
+            list[T]: Matching entity instances.
+
+        Raises:
+            ValueError: If the specification references a column the entity does not have.
+        """
+        columns = self._metadata.columns
+        unknown = spec.referenced_columns().difference(columns)
+        if unknown:
+            raise ValueError(f'Unknown columns for {self._table_name()}: {", ".join(sorted(unknown))}')
+
+        sql, params = compile_select(self._table_name(), spec)
+        self._cursor.execute(sql, params)
+        if spec.columns is None:
+            return self._fetch_entities()
+
+        if not self._cursor.description:
+            return []  # pragma: no cover
+        fetched = [desc[0] for desc in self._cursor.description]
+        empty_row = dict.fromkeys(columns)
+        return [
+            self._entity_type.from_row(empty_row | self._convert_row_to_dict(fetched, row))
+            for row in self._cursor.fetchall()
+        ]
+
     @with_db_connection
     def insert(self, item: T) -> int | None:
         """Inserts a single entity record into the database.
@@ -97,6 +208,32 @@ class CrudRepository[T: Entity]:
                f'values {", ".join(self._values_for_insert_many(items))}')
         self._cursor.execute(sql)
 
+    @with_db_connection
+    def upsert_many(self, items: list[T], chunk_size: int = 1_000) -> int:
+        """Inserts records or updates the existing ones, in chunks within one transaction.
+
+        Rows colliding on the primary key (items with `id_` set) or on a unique
+        key are updated with the item's values; other rows are inserted.
+
+        Args:
+            items (list[T]): Entities to insert or update.
+            chunk_size (int): Maximum number of rows per statement.
+
+        Returns:
+            int: Affected rows as reported by MySQL: 1 per insert, 2 per changed update, 0 per unchanged row.
+        """
+        columns = self._metadata.columns
+        row_placeholder = f'({", ".join(["%s"] * len(columns))})'
+        assignments = ', '.join(f'{column} = new.{column}' for column in self._metadata.insert_columns)
+        affected = 0
+        for chunk in batched(items, chunk_size):
+            sql = (f'insert into {self._table_name()} ({", ".join(columns)}) '
+                   f'values {", ".join([row_placeholder] * len(chunk))} as new '
+                   f'on duplicate key update {assignments}')
+            self._cursor.execute(sql, tuple(getattr(item, column) for item in chunk for column in columns))
+            affected += self._cursor.rowcount
+        return affected
+
     @with_db_connection
     def update(self, item_id: int, item: T) -> None:
         """Updates an existing record in the database.
@@ -122,13 +259,104 @@ class CrudRepository[T: Entity]:
         self._cursor.execute(sql)
         return item_id
 
+    @with_db_connection
+    def update_many(self, item_ids: Collection[int], changes: dict[str, object], chunk_size: int = 1_000) -> int:
+        """Sets the same column values on many records, in chunks within one transaction.
+
+        Args:
+            item_ids (Collection[int]): IDs of the records to update.
+            changes (dict[str, object]): New values keyed by column name.
+            chunk_size (int): Maximum number of IDs per statement.
+
+        Returns:
+            int: Number of rows whose values changed.
+
+        Raises:
+            ValueError: If `changes` is empty or names a column the entity does not have.
+        """
+        unknown = set(changes).difference(self._metadata.insert_columns)
+        if not changes or unknown:
+            raise ValueError(f'Invalid update columns for {self._table_name()}: {", ".join(sorted(unknown))}')
+
+        assignments = ', '.join(f'{column} = %s' for column in changes)
+        affected = 0
+        for chunk in batched(item_ids, chunk_size):
+            sql = f'update {self._table_name()} set {assignments} where id_ in ({", ".join(["%s"] * len(chunk))})'
+            params: tuple = (*changes.values(), *chunk)
+            self._cursor.execute(sql, params)
+            affected += self._cursor.rowcount
+        return affected
+
+    @with_db_connection
+    def delete_many(self, item_ids: Collection[int], chunk_size: int = 1_000) -> int:
+        """Deletes many records by ID, in chunks within one transaction.
+
+        Args:
+            item_ids (Collection[int]): IDs of the records to delete.
+            chunk_size (int): Maximum number of IDs per statement.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        affected = 0
+        for chunk in batched(item_ids, chunk_size):
+            self._cursor.execute(
+                f'delete from {self._table_name()} where id_ in ({", ".join(["%s"] * len(chunk))})', chunk
+            )
+            affected += self._cursor.rowcount
+        return affected
+
+    def delete_where(self, spec: QuerySpec, chunk_size: int = 1_000, conn: 'MySQLConnection | None' = None) -> int:
+        """Deletes all records matching the filters of a specification, in limited chunks.
+
+        Each chunk deletes at most `chunk_size` rows and is committed on its
+        own, so row locks are held only briefly. With an external `conn`, the
+        chunks are left to the caller's transaction.
+
+        Args:
+            spec (QuerySpec): Specification whose filters select the rows to delete.
+            chunk_size (int): Maximum number of rows deleted per statement.
+            conn (MySQLConnection | None): External connection to run the chunks on.
+
+        Returns:
+            int: Number of deleted rows.
+
+        Raises:
+            ValueError: If the filters compile to no condition or reference an unknown column.
+        """
+        unknown = spec.referenced_columns().difference(self._metadata.columns)
+        if unknown:
+            raise ValueError(f'Unknown columns for {self._table_name()}: {", ".join(sorted(unknown))}')
+
+        sql, params = compile_delete(self._table_name(), spec, chunk_size)
+        deleted = 0
+        while True:
+            chunk_deleted = self._execute_delete_chunk(sql, params, conn=conn)
+            deleted += chunk_deleted
+            if chunk_deleted < chunk_size:
+                return deleted
+
+    @with_db_connection
+    def _execute_delete_chunk(self, sql: str, params: tuple) -> int:
+        """Executes one limited delete statement in its own transaction.
+
+        Args:
+            sql (str): DELETE statement ending with a `limit` placeholder.
+            params (tuple): Statement parameters.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        self._cursor.execute(sql, params)
+        return self._cursor.rowcount
+
     def _table_name(self) -> str:
         """Infers the table name based on the entity class name.
 
         Returns:
             str: Table name (pluralized, snake_case version of the entity name).
         """
-        return inflection.pluralize(inflection.underscore(self._entity_type.__name__))
+        return self._metadata.table_name
 
     def _column_names_for_insert(self) -> str:
         """Builds a comma-separated list of column names for an INSERT query.
@@ -136,7 +364,7 @@ class CrudRepository[T: Entity]:
         Returns:
             str: SQL-compatible list of column names (excluding `id_`).
         """
-        return ', '.join([field for field in self._entity_type.__annotations__.keys() if field != 'id_'])
+        return self._metadata.insert_column_list
 
     def _column_values_for_insert(self, item: T) -> str:
         """Builds a comma-separated list of column values for an INSERT query.
@@ -147,11 +375,10 @@ class CrudRepository[T: Entity]:
         Returns:
             str: SQL-compatible string of values for insertion.
         """
-        fields = [field for field in self._entity_type.__annotations__.keys() if field != 'id_']
         values = [
             str(getattr(item, field)) if isinstance(getattr(item, field), (int, float))
             else f"'{getattr(item, field)}'"
-            for field in fields
+            for field in self._metadata.insert_columns
         ]
         return ', '.join(values)
 
@@ -167,8 +394,7 @@ class CrudRepository[T: Entity]:
         return ', '.join([
             f"{field} = {str(getattr(item, field)) if isinstance(getattr(item, field), (int, float))
             else f"'{getattr(item, field)}'"}"
-            for field in self._entity_type.__annotations__.keys()
-            if field != 'id_'
+            for field in self._metadata.insert_columns
         ])
 
     def _values_for_insert_many(self, items: list[T]) -> list[str]:
@@ -182,6 +408,18 @@ class CrudRepository[T: Entity]:
         """
         return [f"({self._column_values_for_insert(item)})" for item in items]
 
+    def _fetch_entities(self) -> list[T]:
+        """Converts all rows of the last executed query into entities.
+
+        Returns:
+            list[T]: Entity instances. Empty list if the query returned no rows.
+        """
+        if not self._cursor.description:
+            return []  # pragma: no cover
+
+        columns = [desc[0] for desc in self._cursor.description]
+        return [self._entity_type.from_row(self._convert_row_to_dict(columns, row)) for row in self._cursor.fetchall()]
+
     @staticmethod
     def _convert_row_to_dict(columns: list[str], row: tuple) -> dict:
         """Converts a database row into a dictionary mapping columns to values.
@@ -219,10 +457,311 @@ class CrudRepository[T: Entity]:
 
 
 class DriverRepository(CrudRepository[Driver]):
-    """Repository for managing `Driver` entities."""
+    """Repository for managing `Driver` entities.
 
-    def __init__(self, connection_manager: MySQLConnectionManager):
+    Keeps an in-memory `PlateIndex` so plates can be resolved to driver IDs
+    without a query, and optionally a `FuzzyPlateIndex` for plates misread by
+    camera OCR. Once warmed, the write methods keep both indexes current.
+    Their changes are applied only after the write is committed; a write on
+    an external connection, which the caller may still roll back, drops the
+    indexes instead, so the next lookup warms them from the database.
+
+    Attributes:
+        plate_index (PlateIndex): Mapping from normalized registration number to driver ID.
+        fuzzy_plate_index (FuzzyPlateIndex | None): Approximate plate matching index, if enabled.
+    """
+
+    def __init__(self, connection_manager: MySQLConnectionManager, fuzzy_plates: bool = False):
+        """Initializes the repository.
+
+        Args:
+            connection_manager (MySQLConnectionManager): Manages pooled database connections.
+            fuzzy_plates (bool): Whether to also maintain a fuzzy plate matching index.
+        """
         super().__init__(connection_manager, Driver)
+        self.plate_index = PlateIndex()
+        self.fuzzy_plate_index = FuzzyPlateIndex() if fuzzy_plates else None
+
+    @with_db_connection
+    def warm_plate_index(self, chunk_size: int = 10_000) -> int:
+        """Loads all registration numbers into the plate indexes with a streamed scan.
+
+        Args:
+            chunk_size (int): Number of rows fetched from the server at a time.
+
+        Returns:
+            int: Number of indexed plates.
+        """
+        self._cursor.execute(f'select id_, registration_number from {self._table_name()} order by id_')
+
+        while chunk := self._cursor.fetchmany(chunk_size):
+            for driver_id, registration_number in chunk:
+                self._index_plate(int(str(driver_id)), str(registration_number))
+
+        self.plate_index.warmed = True
+        return len(self.plate_index)
+
+    def resolve_plate(self, registration_number: str, fuzzy: bool = False, max_distance: int = 1) -> int | None:
+        """Resolves a single plate to a driver ID, warming the indexes on first use.
+
+        Args:
+            registration_number (str): Registration number in any formatting.
+            fuzzy (bool): Whether to fall back to approximate matching when there is no exact match.
+            max_distance (int): Maximum confusion-aware edit distance of a fuzzy match.
+
+        Returns:
+            int | None: Driver ID, or None if no driver matches unambiguously.
+        """
+        return self.resolve_plates([registration_number], fuzzy, max_distance).get(registration_number)
+
+    def resolve_plates(
+        self,
+        registration_numbers: Iterable[str],
+        fuzzy: bool = False,
+        max_distance: int = 1,
+    ) -> dict[str, int]:
+        """Resolves many plates to driver IDs, warming the indexes on first use.
+
+        In fuzzy mode, plates without an exact match resolve to the closest
+        candidate of the fuzzy index, provided no other candidate is equally close.
+
+        Args:
+            registration_numbers (Iterable[str]): Registration numbers in any formatting.
+            fuzzy (bool): Whether to fall back to approximate matching when there is no exact match.
+            max_distance (int): Maximum confusion-aware edit distance of a fuzzy match.
+
+        Returns:
+            dict[str, int]: Driver ID keyed by the registration number as given; unresolved plates are omitted.
+        """
+        if not self.plate_index.warmed:
+            self.warm_plate_index()
+        plates = list(registration_numbers)
+        result = self.plate_index.resolve_many(plates)
+        if not fuzzy:
+            return result
+
+        unresolved = [plate for plate in plates if plate not in result]
+        for plate, matches in self.match_plates(unresolved, max_distance).items():
+            if len(matches) == 1 or matches[0].distance < matches[1].distance:
+                result[plate] = matches[0].driver_id
+        return result
+
+    def match_plates(self, registration_numbers: Iterable[str], max_distance: int = 1) -> dict[str, list[PlateMatch]]:
+        """Finds candidate drivers for possibly misread plates.
+
+        Args:
+            registration_numbers (Iterable[str]): Registration numbers as read by cameras.
+            max_distance (int): Maximum confusion-aware edit distance of returned candidates.
+
+        Returns:
+            dict[str, list[PlateMatch]]: Candidates ordered by distance, keyed by the registration
+                number as given; plates without candidates are omitted.
+
+        Raises:
+            ValueError: If the repository was created without `fuzzy_plates`.
+        """
+        if self.fuzzy_plate_index is None:
+            raise ValueError('Fuzzy plate matching is not enabled for this repository')
+        if not self.plate_index.warmed:
+            self.warm_plate_index()
+        return self.fuzzy_plate_index.match_many(registration_numbers, max_distance)
+
+    @with_db_connection
+    def insert(self, item: Driver) -> int | None:
+        """Inserts a driver and indexes its plate.
+
+        Args:
+            item (Driver): Driver to persist.
+
+        Returns:
+            int | None: The ID of the newly inserted driver, if available.
+        """
+        driver_id = super().insert(item, conn=self._conn)
+        plate = item.registration_number
+        if driver_id and plate is not None:
+            self._index_committed(lambda: self._index_plates({driver_id: plate}))
+        return driver_id
+
+    @with_db_connection
+    def insert_many(self, items: list[Driver]) -> None:
+        """Inserts drivers and indexes their plates.
+
+        The rows of a multi-row VALUES insert get their IDs as one block, as
+        described in `ViolationRepository.insert_many`, but the plates are read
+        back with one query when the index is warmed, the same way as after
+        `upsert_many`, whose inserts can leave gaps in the IDs.
+
+        Args:
+            items (list[Driver]): Drivers to persist.
+        """
+        super().insert_many(items, conn=self._conn)
+        self._index_stored_plates(items)
+
+    @with_db_connection
+    def upsert_many(self, items: list[Driver], chunk_size: int = 1_000) -> int:
+        """Inserts or updates drivers and re-indexes their plates.
+
+        Args:
+            items (list[Driver]): Drivers to insert or update.
+            chunk_size (int): Maximum number of rows per statement.
+
+        Returns:
+            int: Affected rows as reported by MySQL.
+        """
+        affected = super().upsert_many(items, chunk_size, conn=self._conn)
+        self._index_stored_plates(items)
+        return affected
+
+    @with_db_connection
+    def update(self, item_id: int, item: Driver) -> None:
+        """Updates a driver and re-indexes its plate.
+
+        Args:
+            item_id (int): ID of the driver to update.
+            item (Driver): Driver with new field values.
+        """
+        super().update(item_id, item, conn=self._conn)
+        plate = item.registration_number
+        if plate is not None:
+            self._index_committed(lambda: self._index_plates({item_id: plate}))
+
+    @with_db_connection
+    def delete(self, item_id: int) -> int:
+        """Deletes a driver and removes its plate from the index.
+
+        Args:
+            item_id (int): ID of the driver to delete.
+
+        Returns:
+            int: The ID of the deleted driver.
+        """
+        deleted_id = super().delete(item_id, conn=self._conn)
+        self._index_committed(lambda: self._unindex_plates([item_id]))
+        return deleted_id
+
+    @with_db_connection
+    def update_many(self, item_ids: Collection[int], changes: dict[str, object], chunk_size: int = 1_000) -> int:
+        """Updates many drivers and re-indexes their plates if the plate changed.
+
+        Args:
+            item_ids (Collection[int]): IDs of the drivers to update.
+            changes (dict[str, object]): New values keyed by column name.
+            chunk_size (int): Maximum number of IDs per statement.
+
+        Returns:
+            int: Number of rows whose values changed.
+        """
+        affected = super().update_many(item_ids, changes, chunk_size, conn=self._conn)
+        plate = changes.get('registration_number')
+        if isinstance(plate, str):
+            self._index_committed(lambda: self._index_plates(dict.fromkeys(item_ids, plate)))
+        return affected
+
+    @with_db_connection
+    def delete_many(self, item_ids: Collection[int], chunk_size: int = 1_000) -> int:
+        """Deletes many drivers and removes their plates from the index.
+
+        Args:
+            item_ids (Collection[int]): IDs of the drivers to delete.
+            chunk_size (int): Maximum number of IDs per statement.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        affected = super().delete_many(item_ids, chunk_size, conn=self._conn)
+        self._index_committed(lambda: self._unindex_plates(item_ids))
+        return affected
+
+    def delete_where(self, spec: QuerySpec, chunk_size: int = 1_000, conn: 'MySQLConnection | None' = None) -> int:
+        """Deletes matching drivers; with a warmed index, by ID so their plates can be removed.
+
+        Args:
+            spec (QuerySpec): Specification whose filters select the drivers to delete.
+            chunk_size (int): Maximum number of rows deleted per statement.
+            conn (MySQLConnection | None): External connection to run the deletes on.
+
+        Returns:
+            int: Number of deleted rows.
+
+        Raises:
+            ValueError: If the filters compile to no condition.
+        """
+        if not self.plate_index.warmed:
+            return super().delete_where(spec, chunk_size, conn=conn)
+        compile_delete(self._table_name(), spec, chunk_size)
+
+        deleted = 0
+        item_ids = [driver.id_ for driver in self.find(spec.select('id_'), conn=conn) if driver.id_ is not None]
+        for chunk in batched(item_ids, chunk_size):
+            deleted += self.delete_many(chunk, chunk_size, conn=conn)
+        return deleted
+
+    @workload(WorkloadClass.LOOKUP)
+    @with_db_connection
+    def find_by_registration_numbers(self, registration_numbers: Collection[str]) -> list[Driver]:
+        """Finds all drivers with one of the given registration numbers, in one query.
+
+        Args:
+            registration_numbers (Collection[str]): Registration numbers to look up.
+
+        Returns:
+            list[Driver]: Matching drivers, in no particular order.
+        """
+        if not registration_numbers:
+            return []
+
+        sql = (f'select * from {self._table_name()} '
+               f'where registration_number in ({", ".join(["%s"] * len(registration_numbers))})')
+        self._cursor.execute(sql, tuple(registration_numbers))
+        return self._fetch_entities()
+
+    def _index_plate(self, driver_id: int, registration_number: str) -> None:
+        """Adds or moves a driver's plate in the plate indexes."""
+        self.plate_index.add(driver_id, registration_number)
+        if self.fuzzy_plate_index is not None:
+            self.fuzzy_plate_index.add(driver_id, registration_number)
+
+    def _index_plates(self, plates: dict[int, str]) -> None:
+        """Adds or moves the plates of several drivers, keyed by driver ID, in the plate indexes."""
+        for driver_id, registration_number in plates.items():
+            self._index_plate(driver_id, registration_number)
+
+    def _unindex_plates(self, driver_ids: Iterable[int]) -> None:
+        """Removes drivers' plates from the plate indexes."""
+        for driver_id in driver_ids:
+            self.plate_index.remove(driver_id)
+            if self.fuzzy_plate_index is not None:
+                self.fuzzy_plate_index.remove(driver_id)
+
+    def _index_stored_plates(self, items: list[Driver]) -> None:
+        """Reads back the IDs of just written drivers in the running transaction and indexes them on commit."""
+        if not self.plate_index.warmed or not items:
+            return
+        stored: dict[int, str] = {}
+        if self._after_commit is not None:
+            plates = {item.registration_number for item in items if item.registration_number is not None}
+            stored = {
+                driver.id_: driver.registration_number
+                for driver in self.find_by_registration_numbers(plates, conn=self._conn)
+                if driver.id_ is not None and driver.registration_number is not None
+            }
+        self._index_committed(lambda: self._index_plates(stored))
+
+    def _index_committed(self, apply: Callable[[], None]) -> None:
+        """Applies index changes of the running call once its transaction is committed.
+
+        On an external connection the caller may still roll the writes back,
+        so the indexes are dropped instead and warmed again on the next lookup.
+        """
+        if not self.plate_index.warmed:
+            return
+        after_commit = self._after_commit
+        if after_commit is not None:
+            after_commit.append(apply)
+            return
+        self.plate_index = PlateIndex()
+        if self.fuzzy_plate_index is not None:
+            self.fuzzy_plate_index = FuzzyPlateIndex()
 
 
 class OffenseRepository(CrudRepository[Offense]):
@@ -239,22 +778,176 @@ class SpeedCameraRepository(CrudRepository[SpeedCamera]):
         super().__init__(connection_manager, SpeedCamera)
 
 
+class CameraSectionRepository(CrudRepository[CameraSection]):
+    """Repository for managing `CameraSection` entities."""
+
+    def __init__(self, connection_manager: MySQLConnectionManager):
+        super().__init__(connection_manager, CameraSection)
+
+
 class ViolationRepository(CrudRepository[Violation]):
-    """Repository for managing `Violation` entities and complex analytical queries."""
+    """Repository for managing `Violation` entities and complex analytical queries.
+
+    Only `insert` and `insert_many` feed the violation outbox. Rows written by
+    `upsert_many` or changed by `update_many` are not queued for subscribers,
+    so new violations must be stored through the insert methods.
+    """
 
     def __init__(self, connection_manager: MySQLConnectionManager):
         super().__init__(connection_manager, Violation)
 
-    def find_violations_with_offense_by_driver(self, registration_number: str | None) -> list[DriverOffensesDict]:
+    @with_db_connection
+    def insert(self, item: Violation) -> int | None:
+        """Inserts a violation and queues it for every outbox subscription in the same transaction.
+
+        Args:
+            item (Violation): Violation to persist.
+
+        Returns:
+            int | None: The ID of the newly inserted violation, if available.
+        """
+        violation_id = super().insert(item, conn=self._conn)
+        if violation_id:
+            self._append_to_outbox([violation_id])
+        return violation_id
+
+    @with_db_connection
+    def insert_many(self, items: list[Violation]) -> None:
+        """Inserts violations and queues them for every outbox subscription in the same transaction.
+
+        A multi-row VALUES insert is a simple insert, for which InnoDB reserves
+        the auto-increment IDs of all rows as one block in every lock mode;
+        only bulk inserts such as INSERT ... SELECT and inserts with ON
+        DUPLICATE KEY UPDATE can leave gaps. The block starts at the ID
+        reported for the first row and advances by the session's
+        `auto_increment_increment`, which is read on the same connection, so
+        the inserted IDs are listed explicitly rather than assumed to be
+        adjacent.
+
+        Args:
+            items (list[Violation]): Violations to persist.
+        """
+        super().insert_many(items, conn=self._conn)
+        first_id = self._cursor.lastrowid
+        if not items or not first_id:
+            return
+
+        self._cursor.execute('select @@session.auto_increment_increment')
+        row = self._cursor.fetchone()
+        step = int(str(row[0])) if row else 1
+        self._append_to_outbox([first_id + step * offset for offset in range(len(items))])
+
+    def _append_to_outbox(self, violation_ids: list[int]) -> None:
+        """Adds one outbox entry per subscription for each of the given violations."""
+        self._cursor.execute(
+            'insert into violation_outbox (subscription, violation_id) '
+            'select s.name, v.id_ from outbox_subscriptions s join violations v '
+            f'on v.id_ in ({", ".join(["%s"] * len(violation_ids))})',
+            tuple(violation_ids)
+        )
+
+    @with_db_connection
+    def find_with_relations(self, violation_filter: ViolationFilterDict | None = None) -> list[Violation]:
+        """Fetches violations with their driver, camera and offense in one JOIN query.
+
+        Related entities are hydrated through an identity map, so violations of
+        the same driver, camera or offense share one instance of it.
+
+        Args:
+            violation_filter (ViolationFilterDict | None): Optional selection criteria.
+
+        Returns:
+            list[Violation]: Violations, ordered by ID, with related entities attached.
+        """
+        relations: list[tuple[str, Type[Entity]]] = [
+            ('v', Violation), ('d', Driver), ('s', SpeedCamera), ('o', Offense)
+        ]
+        select = ', '.join(
+            f'{alias}.{column} as {alias}__{column}'
+            for alias, entity_type in relations
+            for column in table_metadata(entity_type).columns
+        )
+        where, params = self._violation_filter_clause(violation_filter or {})
+        sql = (f'select {select} from violations v '
+               f'left join drivers d on d.id_ = v.driver_id '
+               f'left join speed_cameras s on s.id_ = v.speed_camera_id '
+               f'left join offenses o on o.id_ = v.offense_id '
+               f'{where} order by v.id_')
+        self._cursor.execute(sql, params)
+        if not self._cursor.description:
+            return []  # pragma: no cover
+
+        columns = [desc[0] for desc in self._cursor.description]
+        identity_map: dict[tuple[str, int], Entity] = {}
+
+        def hydrate[E: Entity](alias: str, entity_type: Type[E], row: dict) -> E | None:
+            entity_id = row[f'{alias}__id_']
+            if entity_id is None:
+                return None
+            key = (alias, entity_id)
+            if key not in identity_map:
+                prefix = f'{alias}__'
+                identity_map[key] = entity_type.from_row(
+                    {name[len(prefix):]: value for name, value in row.items() if name.startswith(prefix)}
+                )
+            return cast(E, identity_map[key])
+
+        violations: list[Violation] = []
+        for values in self._cursor.fetchall():
+            row = self._convert_row_to_dict(columns, values)
+            violation = Violation.from_row({
+                name[len('v__'):]: value for name, value in row.items() if name.startswith('v__')
+            })  # type: ignore[arg-type]
+            violation.attach_relations(
+                hydrate('d', Driver, row),
+                hydrate('s', SpeedCamera, row),
+                hydrate('o', Offense, row),
+            )
+            violations.append(violation)
+        return violations
+
+    @staticmethod
+    def _violation_filter_clause(violation_filter: ViolationFilterDict) -> tuple[str, tuple]:
+        """Builds a parameterized WHERE clause over the `v` and `d` aliases.
+
+        Args:
+            violation_filter (ViolationFilterDict): Selection criteria.
+
+        Returns:
+            tuple[str, tuple]: WHERE clause (empty if there are no criteria) and its parameters.
+        """
+        conditions = {
+            'driver_id': 'v.driver_id = %s',
+            'speed_camera_id': 'v.speed_camera_id = %s',
+            'offense_id': 'v.offense_id = %s',
+            'registration_number': 'd.registration_number = %s',
+            'date_from': 'v.violation_date >= %s',
+            'date_to': 'v.violation_date <= %s',
+        }
+        used = [key for key in conditions if key in violation_filter]
+        if not used:
+            return '', ()
+        return (
+            'where ' + ' and '.join(conditions[key] for key in used),
+            tuple(violation_filter[key] for key in used),  # type: ignore[literal-required]
+        )
+
+    @workload(WorkloadClass.LOOKUP)
+    def find_violations_with_offense_by_driver(
+        self,
+        registration_number: str | None,
+        include_archived: bool = False,
+    ) -> list[DriverOffensesDict]:
         """Fetches all offenses committed by a specific driver, including totals.
 
         Args:
             registration_number (str | None): Driver's registration number.
+            include_archived (bool): Whether to also read violations moved to `violations_archive`.
 
         Returns:
             list[DriverOffensesDict]: List of offenses with penalty summaries.
         """
-        sql = """
+        sql = f"""
               SELECT d.first_name, 
                      d.last_name, 
                      d.registration_number, 
@@ -263,22 +956,26 @@ class ViolationRepository(CrudRepository[Violation]):
                      o.penalty_points, 
                      o.fine_amount, 
                      SUM(o.penalty_points) OVER (PARTITION BY d.id_) AS total_points, SUM(o.fine_amount) OVER (PARTITION BY d.id_) AS total_amount
-              FROM violations v
+              FROM {self._violations_source(include_archived)} v
                        JOIN drivers d ON v.driver_id = d.id_
                        JOIN offenses o ON v.offense_id = o.id_
               WHERE d.registration_number = %s; 
               """
         return [cast(DriverOffensesDict, row) for row in self._execute_query(sql, (registration_number,))]
 
-    def get_driver_points(self) -> list[TopDriverDict]:
+    @workload(WorkloadClass.REPORT)
+    def get_driver_points(self, include_archived: bool = False) -> list[TopDriverDict]:
         """Calculates total penalty points for each driver.
 
+        Args:
+            include_archived (bool): Whether to also read violations moved to `violations_archive`.
+
         Returns:
             list[TopDriverDict]: Drivers ordered by total penalty points (descending).
         """
-        sql = """
+        sql = f"""
               SELECT d.id_, d.first_name, d.last_name, sum(o.penalty_points) as total_points 
-              FROM violations v 
+              FROM {self._violations_source(include_archived)} v 
                        JOIN offenses o ON v.offense_id = o.id_ 
                        JOIN drivers d ON v.driver_id = d.id_
               GROUP BY d.id_, d.first_name, d.last_name
@@ -286,32 +983,40 @@ class ViolationRepository(CrudRepository[Violation]):
               """
         return [cast(TopDriverDict, row) for row in self._execute_query(sql)]
 
-    def get_most_popular_speed_camera(self) -> list[PopularSpeedCameraDict]:
+    @workload(WorkloadClass.REPORT)
+    def get_most_popular_speed_camera(self, include_archived: bool = False) -> list[PopularSpeedCameraDict]:
         """Finds the most frequently triggered speed cameras.
 
+        Args:
+            include_archived (bool): Whether to also read violations moved to `violations_archive`.
+
         Returns:
             list[PopularSpeedCameraDict]: Cameras with violation counts, ordered by frequency.
         """
-        sql = """
+        sql = f"""
               SELECT 
                 s.location, 
                 count(v.speed_camera_id) as total_count
               FROM speed_cameras s
-              LEFT JOIN violations v ON v.speed_camera_id = s.id_
+              LEFT JOIN {self._violations_source(include_archived)} v ON v.speed_camera_id = s.id_
               group by s.location, s.id_
               order by total_count desc; 
               """
         return [cast(PopularSpeedCameraDict, row) for row in self._execute_query(sql)]
 
-    def summary_statistics(self) -> list[SummaryStatisticDict]:
+    @workload(WorkloadClass.REPORT)
+    def summary_statistics(self, include_archived: bool = False) -> list[SummaryStatisticDict]:
         """Generates overall violation and offense statistics.
 
+        Args:
+            include_archived (bool): Whether to also read violations moved to `violations_archive`.
+
         Returns:
             list[SummaryStatisticDict]: Summary metrics including totals and averages.
         """
-        sql = """
+        sql = f"""
               SELECT 
-                COUNT(v.driver_id)              as total_drivers, 
+                COUNT(DISTINCT v.driver_id)     as total_drivers, 
                 count(v.offense_id)             as total_offenses, 
                 sum(o.penalty_points)           as total_points, 
                 round(avg(o.penalty_points), 2) as average_points, 
@@ -319,7 +1024,716 @@ class ViolationRepository(CrudRepository[Violation]):
                 max(o.fine_amount)              as max_fine_amount, 
                 min(o.fine_amount)              as min_fine_amount
 
-                from violations v
+                from {self._violations_source(include_archived)} v
                 JOIN offenses o ON v.offense_id = o.id_ 
               """
-        return [cast(SummaryStatisticDict, row) for row in self._execute_query(sql)]
\ No newline at end of file
+        return [cast(SummaryStatisticDict, row) for row in self._execute_query(sql)]
+
+    @with_db_connection
+    def archivable_id_range(self, cutoff: date) -> tuple[int, int] | None:
+        """Finds the lowest and highest IDs of violations dated before a cutoff.
+
+        Args:
+            cutoff (date): First date that is kept in the hot table.
+
+        Returns:
+            tuple[int, int] | None: Lowest and highest such ID, or None if there is nothing to archive.
+        """
+        self._cursor.execute('select min(id_), max(id_) from violations where violation_date < %s', (cutoff,))
+        row = self._cursor.fetchone()
+        if not row or row[0] is None:
+            return None
+        return int(str(row[0])), int(str(row[1]))
+
+    @with_db_connection
+    def archive_range(self, first_id: int, last_id: int, cutoff: date) -> int:
+        """Moves violations of an ID range dated before a cutoff into `violations_archive`.
+
+        The copy and the delete run in the same transaction, so a violation is
+        never in both tables or in neither.
+
+        Args:
+            first_id (int): Lowest ID of the range.
+            last_id (int): Highest ID of the range.
+            cutoff (date): First date that is kept in the hot table.
+
+        Returns:
+            int: Number of moved violations.
+        """
+        params = (first_id, last_id, cutoff)
+        self._cursor.execute(
+            'insert into violations_archive (id_, violation_date, driver_id, speed_camera_id, offense_id) '
+            'select id_, violation_date, driver_id, speed_camera_id, offense_id from violations '
+            'where id_ between %s and %s and violation_date < %s',
+            params,
+        )
+        self._cursor.execute('delete from violations where id_ between %s and %s and violation_date < %s', params)
+        return self._cursor.rowcount
+
+    @staticmethod
+    def _violations_source(include_archived: bool) -> str:
+        """Returns the table expression to read violations from.
+
+        Args:
+            include_archived (bool): Whether to combine hot and archived violations.
+
+        Returns:
+            str: `violations`, or a derived table over both tables.
+        """
+        if not include_archived:
+            return 'violations'
+        columns = 'id_, violation_date, driver_id, speed_camera_id, offense_id'
+        return f'(select {columns} from violations union all select {columns} from violations_archive)'
+
+    @workload(WorkloadClass.REPORT)
+    @with_db_connection
+    def combined_statistics(self, chunk_size: int = 10_000, include_archived: bool = False) -> CombinedStatisticsDict:
+        """Computes driver points, camera counts and summary statistics with one scan of violations.
+
+        Violations are read once, grouped by (driver, camera) in the database,
+        streamed in chunks and rolled up in Python. The results match
+        `get_driver_points`, `get_most_popular_speed_camera` and
+        `summary_statistics`, which scan the violations once each.
+
+        Args:
+            chunk_size (int): Number of grouped rows fetched at a time.
+            include_archived (bool): Whether to also read violations moved to `violations_archive`.
+
+        Returns:
+            CombinedStatisticsDict: Driver ranking, camera popularity and summary statistics.
+        """
+        aggregation, driver_names = self._scan_groups(self._violations_source(include_archived), '', (), chunk_size)
+        return self._combined_from(aggregation, driver_names)
+
+    @workload(WorkloadClass.REPORT)
+    @with_db_connection
+    def stream_fine_notices(
+        self,
+        day: date,
+        consumer: Callable[[list[FineNoticeDict]], None],
+        chunk_size: int = 1_000,
+        include_archived: bool = False,
+    ) -> int:
+        """Streams the fine notices of a day's violations in chunks.
+
+        Points collected by the day's drivers before the day are read with one
+        grouped query. The day's violations are then read ordered by driver and
+        ID, so each driver's running points total is computed in the same pass.
+        Violations without a known driver or offense get no notice.
+
+        Args:
+            day (date): Date of the violations.
+            consumer (Callable[[list[FineNoticeDict]], None]): Called with every chunk of notices.
+            chunk_size (int): Number of notices passed to one `consumer` call.
+            include_archived (bool): Whether points of archived violations count towards the totals.
+
+        Returns:
+            int: Number of streamed notices.
+        """
+        self._cursor.execute(
+            'select v.driver_id, sum(o.penalty_points) '
+            f'from {self._violations_source(include_archived)} v '
+            'join offenses o on o.id_ = v.offense_id '
+            'where v.violation_date < %s '
+            'and v.driver_id in (select driver_id from violations where violation_date = %s) '
+            'group by v.driver_id',
+            (day, day)
+        )
+        points = {driver_id: int(total) for driver_id, total in cast(list[tuple], self._cursor.fetchall())}
+
+        self._cursor.execute(
+            'select v.id_, v.violation_date, d.id_, d.first_name, d.last_name, d.registration_number, '
+            'o.description, o.penalty_points, o.fine_amount '
+            'from violations v '
+            'join drivers d on d.id_ = v.driver_id '
+            'join offenses o on o.id_ = v.offense_id '
+            'where v.violation_date = %s '
+            'order by v.driver_id, v.id_',
+            (day,)
+        )
+        streamed = 0
+        while rows := self._cursor.fetchmany(chunk_size):
+            notices: list[FineNoticeDict] = []
+            for (violation_id, violation_date, driver_id, first_name, last_name, registration_number,
+                 description, penalty_points, fine_amount) in cast(list[tuple], rows):
+                points[driver_id] = points.get(driver_id, 0) + penalty_points
+                notices.append({
+                    'violation_id': violation_id,
+                    'violation_date': violation_date,
+                    'driver_id': driver_id,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'registration_number': registration_number,
+                    'description': description,
+                    'penalty_points': penalty_points,
+                    'fine_amount': fine_amount,
+                    'total_points': points[driver_id],
+                })
+            consumer(notices)
+            streamed += len(notices)
+        return streamed
+
+    @workload(WorkloadClass.REPORT)
+    @with_db_connection
+    def violation_id_bounds(self, include_archived: bool = False) -> tuple[int, int] | None:
+        """Finds the lowest and highest violation IDs.
+
+        Args:
+            include_archived (bool): Whether to also consider violations moved to `violations_archive`.
+
+        Returns:
+            tuple[int, int] | None: Lowest and highest ID, or None if there are no violations.
+        """
+        self._cursor.execute(f'select min(id_), max(id_) from {self._violations_source(include_archived)} v')
+        row = self._cursor.fetchone()
+        if not row or row[0] is None:
+            return None
+        return int(str(row[0])), int(str(row[1]))
+
+    @workload(WorkloadClass.REPORT)
+    @with_db_connection
+    def aggregate_id_range(
+        self,
+        first_id: int,
+        last_id: int,
+        chunk_size: int = 10_000,
+        include_archived: bool = False,
+    ) -> tuple[ViolationAggregation, dict[int, tuple[str, str]]]:
+        """Aggregates the violations of an ID range, as one partition of `combined_statistics`.
+
+        Args:
+            first_id (int): Lowest ID of the range.
+            last_id (int): Highest ID of the range.
+            chunk_size (int): Number of grouped rows fetched at a time.
+            include_archived (bool): Whether to also read violations moved to `violations_archive`.
+
+        Returns:
+            tuple[ViolationAggregation, dict[int, tuple[str, str]]]: Totals of the range and the
+                first and last names of its drivers keyed by driver ID.
+        """
+        return self._scan_groups(
+            self._violations_source(include_archived), 'where v.id_ between %s and %s ', (first_id, last_id), chunk_size
+        )
+
+    @workload(WorkloadClass.REPORT)
+    @with_db_connection
+    def statistics_from_aggregation(
+        self,
+        aggregation: ViolationAggregation,
+        driver_names: dict[int, tuple[str, str]],
+    ) -> CombinedStatisticsDict:
+        """Builds the `combined_statistics` reports from totals aggregated elsewhere.
+
+        Args:
+            aggregation (ViolationAggregation): Totals over all violations, e.g. merged partitions.
+            driver_names (dict[int, tuple[str, str]]): First and last names keyed by driver ID.
+
+        Returns:
+            CombinedStatisticsDict: Driver ranking, camera popularity and summary statistics.
+        """
+        return self._combined_from(aggregation, driver_names)
+
+    def _scan_groups(
+        self,
+        source: str,
+        where: str,
+        params: tuple,
+        chunk_size: int,
+    ) -> tuple[ViolationAggregation, dict[int, tuple[str, str]]]:
+        """Streams violations grouped by (driver, camera) and rolls the groups up in Python."""
+        self._cursor.execute(
+            'select v.driver_id, v.speed_camera_id, d.first_name, d.last_name, '
+            'count(*), count(o.id_), count(case when o.id_ is not null then v.driver_id end), '
+            'sum(o.penalty_points), sum(o.fine_amount), max(o.fine_amount), min(o.fine_amount) '
+            f'from {source} v '
+            'left join offenses o on o.id_ = v.offense_id '
+            'left join drivers d on d.id_ = v.driver_id '
+            f'{where}'
+            'group by v.driver_id, v.speed_camera_id, d.id_, d.first_name, d.last_name',
+            params
+        )
+        aggregation = ViolationAggregation()
+        driver_names: dict[int, tuple[str, str]] = {}
+        while rows := self._cursor.fetchmany(chunk_size):
+            for (driver_id, speed_camera_id, first_name, last_name, violations, offense_violations,
+                 driver_violations, total_points, total_fine_amount, max_fine_amount, min_fine_amount
+                 ) in cast(list[tuple], rows):
+                if first_name is not None:
+                    driver_names[driver_id] = (first_name, last_name)
+                aggregation.add(driver_id, speed_camera_id, ViolationAggregate(
+                    violations=violations,
+                    offense_violations=offense_violations,
+                    driver_violations=driver_violations,
+                    total_points=int(total_points or 0),
+                    total_fine_amount=total_fine_amount or Decimal(0),
+                    max_fine_amount=max_fine_amount,
+                    min_fine_amount=min_fine_amount,
+                ))
+        return aggregation, driver_names
+
+    def _combined_from(
+        self,
+        aggregation: ViolationAggregation,
+        driver_names: dict[int, tuple[str, str]],
+    ) -> CombinedStatisticsDict:
+        """Reads the cameras and builds all three reports from aggregated totals."""
+        self._cursor.execute('select id_, location from speed_cameras')
+        cameras = cast(list[tuple], self._cursor.fetchall())
+        return {
+            'top_drivers': self._top_drivers(aggregation, driver_names),
+            'popular_speed_cameras': self._popular_speed_cameras(aggregation, cameras),
+            'summary': [self._summary(aggregation)],
+        }
+
+    @staticmethod
+    def _top_drivers(aggregation: ViolationAggregation, driver_names: dict[int, tuple[str, str]]) -> list[TopDriverDict]:
+        """Ranks known drivers with at least one offense by their total penalty points."""
+        ranked = sorted(
+            ((driver_id, aggregate) for driver_id, aggregate in aggregation.by_driver.items()
+             if driver_id in driver_names and aggregate.offense_violations),
+            key=lambda item: (-item[1].total_points, item[0]),
+        )
+        return [
+            cast(TopDriverDict, {'first_name': driver_names[driver_id][0], 'last_name': driver_names[driver_id][1],
+                                 'total_points': aggregate.total_points})
+            for driver_id, aggregate in ranked
+        ]
+
+    @staticmethod
+    def _popular_speed_cameras(aggregation: ViolationAggregation, cameras: list[tuple]) -> list[PopularSpeedCameraDict]:
+        """Orders all cameras, including those without violations, by their violation count."""
+        counts = [
+            (location, aggregation.by_camera[camera_id].violations if camera_id in aggregation.by_camera else 0)
+            for camera_id, location in cameras
+        ]
+        return [
+            cast(PopularSpeedCameraDict, {'location': location, 'total_count': count})
+            for location, count in sorted(counts, key=lambda camera: -camera[1])
+        ]
+
+    @staticmethod
+    def _summary(aggregation: ViolationAggregation) -> SummaryStatisticDict:
+        """Converts overall totals into the row returned by `summary_statistics`."""
+        overall = aggregation.overall
+        has_offenses = overall.offense_violations > 0
+        return cast(SummaryStatisticDict, {
+            'total_drivers': sum(1 for aggregate in aggregation.by_driver.values() if aggregate.driver_violations),
+            'total_offenses': overall.offense_violations,
+            'total_points': overall.total_points if has_offenses else None,
+            'average_points': overall.average_points,
+            'total_fine_amount': overall.total_fine_amount if has_offenses else None,
+            'max_fine_amount': overall.max_fine_amount,
+            'min_fine_amount': overall.min_fine_amount,
+        })
+
+class CheckpointRepository(ConnectionHolder):
+    """Repository for named progress markers of background jobs.
+
+    A checkpoint stores how far a job has progressed (e.g. a spool offset or the
+    last processed ID). Saving it with the same external connection as the job's
+    writes makes the progress commit atomically with the data.
+
+    Attributes:
+        _connection_manager (MySQLConnectionManager): Manages pooled database connections.
+        _cursor (MySQLCursor): Active database cursor for query execution, kept per thread.
+        _conn (MySQLConnection): Active MySQL connection object, kept per thread.
+    """
+
+    def __init__(self, connection_manager: MySQLConnectionManager):
+        self._connection_manager = connection_manager
+
+    @with_db_connection
+    def get(self, name: str) -> int | None:
+        """Reads the position stored under a checkpoint name.
+
+        Args:
+            name (str): Name of the checkpoint.
+
+        Returns:
+            int | None: Stored position, or None if the checkpoint does not exist.
+        """
+        self._cursor.execute('select position from checkpoints where name = %s', (name,))
+        row = self._cursor.fetchone()
+        return int(str(row[0])) if row else None
+
+    @with_db_connection
+    def save(self, name: str, position: int) -> None:
+        """Creates or moves a checkpoint.
+
+        Args:
+            name (str): Name of the checkpoint.
+            position (int): New position.
+        """
+        self._cursor.execute(
+            'insert into checkpoints (name, position) values (%s, %s) as new '
+            'on duplicate key update position = new.position',
+            (name, position)
+        )
+
+
+ROLLUP_TABLES = {'day': 'violation_daily_rollups', 'month': 'violation_monthly_rollups'}
+
+ROLLUP_PERIOD_STARTS = {'day': 'v.violation_date', 'month': 'last_day(v.violation_date - interval 1 month) + interval 1 day'}
+
+
+class ViolationRollupRepository(ConnectionHolder):
+    """Repository for pre-aggregated violation counts per day and per month.
+
+    Rollups count violations per (period, speed camera, offense). They are
+    filled incrementally by ID range and read instead of grouping the raw
+    violations. Violations already rolled up are not subtracted when they are
+    deleted, unless their day is recounted by `recount_days`; archived
+    violations still count, since the rollups read both the hot and the
+    archive table.
+
+    Attributes:
+        _connection_manager (MySQLConnectionManager): Manages pooled database connections.
+        _cursor (MySQLCursor): Active database cursor for query execution, kept per thread.
+        _conn (MySQLConnection): Active MySQL connection object, kept per thread.
+    """
+
+    def __init__(self, connection_manager: MySQLConnectionManager):
+        self._connection_manager = connection_manager
+
+    @with_db_connection
+    def max_violation_id(self) -> int:
+        """Returns the highest violation ID in the hot and the archive table, or 0 if there are none."""
+        self._cursor.execute(f'select max(id_) from {ViolationRepository._violations_source(True)} v')
+        row = self._cursor.fetchone()
+        return int(str(row[0])) if row and row[0] is not None else 0
+
+    @with_db_connection
+    def roll_up_range(self, first_id: int, last_id: int) -> int:
+        """Adds the violations of an ID range to the daily and monthly rollups.
+
+        Args:
+            first_id (int): Lowest ID of the range.
+            last_id (int): Highest ID of the range.
+
+        Returns:
+            int: Number of rolled up violations.
+        """
+        for granularity, table in ROLLUP_TABLES.items():
+            self._cursor.execute(
+                f'insert into {table} (period_start, speed_camera_id, offense_id, violation_count) '
+                'select * from ('
+                f'select {ROLLUP_PERIOD_STARTS[granularity]} as period_start, '
+                'coalesce(v.speed_camera_id, 0) as speed_camera_id, coalesce(v.offense_id, 0) as offense_id, '
+                'count(*) as added '
+                f'from {ViolationRepository._violations_source(True)} v '
+                'where v.id_ between %s and %s '
+                'group by 1, 2, 3'
+                ') as counted on duplicate key update violation_count = violation_count + counted.added',
+                (first_id, last_id)
+            )
+        self._cursor.execute(
+            f'select count(*) from {ViolationRepository._violations_source(True)} v where v.id_ between %s and %s',
+            (first_id, last_id)
+        )
+        row = self._cursor.fetchone()
+        return int(str(row[0])) if row else 0
+
+    @with_db_connection
+    def recount_days(self, first_id: int, last_id: int) -> int:
+        """Recounts the days of the violations in an ID range and the months they fall in.
+
+        The rollups of every day with a violation in the range are replaced by
+        a fresh count of that day's violations up to `last_id`, and the monthly
+        rollups of those days' months are summed again from the daily ones.
+        Unlike `roll_up_range` this is idempotent, so it picks up violations
+        committed after their IDs were rolled up without counting others twice.
+
+        Args:
+            first_id (int): Lowest ID of the range.
+            last_id (int): Highest ID of the range and of the counted violations; must not
+                exceed the high-water mark.
+
+        Returns:
+            int: Number of recounted days.
+        """
+        source = ViolationRepository._violations_source(True)
+        self._cursor.execute(
+            f'select distinct v.violation_date from {source} v where v.id_ between %s and %s',
+            (first_id, last_id)
+        )
+        days = sorted({row[0] for row in cast(list[tuple], self._cursor.fetchall())})
+        if not days:
+            return 0
+
+        placeholders = ', '.join(['%s'] * len(days))
+        daily_table = ROLLUP_TABLES['day']
+        self._cursor.execute(f'delete from {daily_table} where period_start in ({placeholders})', days)
+        self._cursor.execute(
+            f'insert into {daily_table} (period_start, speed_camera_id, offense_id, violation_count) '
+            'select v.violation_date, coalesce(v.speed_camera_id, 0), coalesce(v.offense_id, 0), count(*) '
+            f'from {source} v '
+            f'where v.violation_date in ({placeholders}) and v.id_ <= %s '
+            'group by 1, 2, 3',
+            (*days, last_id)
+        )
+
+        monthly_table = ROLLUP_TABLES['month']
+        for month in sorted({day.replace(day=1) for day in days}):
+            self._cursor.execute(f'delete from {monthly_table} where period_start = %s', (month,))
+            self._cursor.execute(
+                f'insert into {monthly_table} (period_start, speed_camera_id, offense_id, violation_count) '
+                'select %s, speed_camera_id, offense_id, sum(violation_count) '
+                f'from {daily_table} '
+                'where period_start >= %s and period_start < %s + interval 1 month '
+                'group by speed_camera_id, offense_id',
+                (month, month, month)
+            )
+        return len(days)
+
+    @with_db_connection
+    def clear(self) -> None:
+        """Deletes all rollups."""
+        for table in ROLLUP_TABLES.values():
+            self._cursor.execute(f'delete from {table}')
+
+    @with_db_connection
+    def violation_counts(
+        self,
+        start: date,
+        end: date,
+        group_by: Literal['speed_camera_id', 'offense_id'] = 'speed_camera_id',
+        granularity: Literal['day', 'month'] | None = None,
+    ) -> list[ViolationRollupDict]:
+        """Reads violation counts per period for the half-open date range `[start, end)`.
+
+        Without an explicit granularity the coarsest one covering the range
+        exactly is used: months when both bounds are first days of a month,
+        days otherwise.
+
+        Args:
+            start (date): First day of the range.
+            end (date): First day after the range.
+            group_by (Literal['speed_camera_id', 'offense_id']): Column counted separately.
+            granularity (Literal['day', 'month'] | None): Period of the returned counts.
+
+        Returns:
+            list[ViolationRollupDict]: Counts ordered by period and grouped column.
+
+        Raises:
+            ValueError: If the grouped column or granularity is unknown, or monthly counts
+                are requested for a range not made of whole months.
+        """
+        if group_by not in ('speed_camera_id', 'offense_id'):
+            raise ValueError(f'Cannot group violation counts by {group_by}')
+        month_aligned = start.day == 1 and end.day == 1
+        if granularity is None:
+            granularity = 'month' if month_aligned else 'day'
+        if granularity not in ROLLUP_TABLES:
+            raise ValueError(f'Unknown rollup granularity {granularity}')
+        if granularity == 'month' and not month_aligned:
+            raise ValueError('Monthly counts need a range starting and ending on the first day of a month')
+
+        self._cursor.execute(
+            f'select period_start, {group_by}, sum(violation_count) as violation_count '
+            f'from {ROLLUP_TABLES[granularity]} '
+            'where period_start >= %s and period_start < %s '
+            f'group by period_start, {group_by} '
+            f'order by period_start, {group_by}',
+            (start, end)
+        )
+        return [
+            cast(ViolationRollupDict, {'period_start': period_start, group_by: key, 'violation_count': int(count)})
+            for period_start, key, count in cast(list[tuple], self._cursor.fetchall())
+        ]
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """A violation delivered to an outbox subscription.
+
+    Attributes:
+        entry_id (int): ID of the outbox entry, used to acknowledge it.
+        violation (Violation): The new violation.
+        created_at (datetime): When the violation was queued.
+        attempts (int): Number of deliveries including this one; above 1 it is a redelivery.
+        lag_seconds (float): Time from queueing to this delivery, measured by the database clock.
+    """
+
+    entry_id: int
+    violation: Violation
+    created_at: datetime
+    attempts: int
+    lag_seconds: float
+
+
+class ViolationOutboxRepository(ConnectionHolder):
+    """Repository for the change feed of new violations.
+
+    `ViolationRepository.insert` and `insert_many` add an entry per
+    subscription for every violation in the transaction that stores it;
+    violations written by `upsert_many` and changes made by `update_many`
+    are not announced. A
+    consumer claims a batch with `SELECT ... FOR UPDATE SKIP LOCKED`, so
+    concurrent consumers of a subscription skip each other's rows instead of
+    waiting, and leases the claimed entries by moving their `available_at`
+    forward. Entries are deleted when acknowledged; entries of a consumer
+    that dies become visible again when the lease expires, so every
+    violation is delivered at least once.
+
+    Attributes:
+        _connection_manager (MySQLConnectionManager): Manages pooled database connections.
+        _cursor (MySQLCursor): Active database cursor for query execution, kept per thread.
+        _conn (MySQLConnection): Active MySQL connection object, kept per thread.
+    """
+
+    def __init__(self, connection_manager: MySQLConnectionManager):
+        self._connection_manager = connection_manager
+
+    @with_db_connection
+    def subscribe(self, subscription: str) -> None:
+        """Registers a subscription; violations inserted afterwards are queued for it.
+
+        Args:
+            subscription (str): Name of the subscription, e.g. `'points_registry'`.
+        """
+        self._cursor.execute('insert ignore into outbox_subscriptions (name) values (%s)', (subscription,))
+
+    @with_db_connection
+    def unsubscribe(self, subscription: str) -> int:
+        """Removes a subscription together with its unacknowledged entries.
+
+        Args:
+            subscription (str): Name of the subscription.
+
+        Returns:
+            int: Number of dropped entries.
+        """
+        self._cursor.execute('delete from outbox_subscriptions where name = %s', (subscription,))
+        self._cursor.execute('delete from violation_outbox where subscription = %s', (subscription,))
+        return self._cursor.rowcount
+
+    @with_db_connection
+    def claim(self, subscription: str, batch_size: int = 500, lease_seconds: float = 60.0) -> list[OutboxEntry]:
+        """Claims the oldest available entries of a subscription for a lease.
+
+        Entries locked or leased by other consumers are skipped. Violations
+        moved to `violations_archive` are still delivered; entries whose
+        violation no longer exists in either table are acknowledged right away,
+        and further entries are claimed in their place, so an empty result
+        means the subscription has nothing available.
+
+        Args:
+            subscription (str): Name of the subscription.
+            batch_size (int): Maximum number of claimed entries.
+            lease_seconds (float): Time after which unacknowledged entries are delivered again.
+
+        Returns:
+            list[OutboxEntry]: Claimed entries in queueing order.
+        """
+        while True:
+            self._cursor.execute(
+                'select id_, violation_id from violation_outbox where subscription = %s and available_at <= now(6) '
+                'order by id_ limit %s for update skip locked',
+                (subscription, batch_size)
+            )
+            claimed = [(int(str(row[0])), int(str(row[1]))) for row in cast(list[tuple], self._cursor.fetchall())]
+            if not claimed:
+                return []
+
+            entry_ids = [entry_id for entry_id, _ in claimed]
+            entries = self._lease(entry_ids, [violation_id for _, violation_id in claimed], lease_seconds)
+            orphaned = set(entry_ids).difference(entry.entry_id for entry in entries)
+            if orphaned:
+                self._delete_entries(orphaned)
+            if entries:
+                return entries
+
+    @with_db_connection
+    def acknowledge(self, entry_ids: Collection[int]) -> int:
+        """Deletes delivered entries.
+
+        Args:
+            entry_ids (Collection[int]): IDs of the processed entries.
+
+        Returns:
+            int: Number of deleted entries; lower if some were acknowledged before.
+        """
+        return self._delete_entries(entry_ids)
+
+    @with_db_connection
+    def release(self, entry_ids: Collection[int]) -> None:
+        """Ends the lease of entries a consumer failed to process, making them available at once.
+
+        Args:
+            entry_ids (Collection[int]): IDs of the entries to deliver again.
+        """
+        if entry_ids:
+            self._cursor.execute(
+                f'update violation_outbox set available_at = now(6) '
+                f'where id_ in ({", ".join(["%s"] * len(entry_ids))})',
+                tuple(entry_ids)
+            )
+
+    @with_db_connection
+    def lag(self) -> list[OutboxLagDict]:
+        """Reports the backlog of every subscription.
+
+        Returns:
+            list[OutboxLagDict]: Unacknowledged and in-flight entries and the age of the oldest one.
+        """
+        self._cursor.execute(
+            'select s.name, count(o.id_), coalesce(sum(o.available_at > now(6)), 0), '
+            'coalesce(timestampdiff(microsecond, min(o.created_at), now(6)), 0) / 1000000, '
+            'coalesce(max(o.attempts), 0) '
+            'from outbox_subscriptions s left join violation_outbox o on o.subscription = s.name '
+            'group by s.name order by s.name'
+        )
+        return [
+            cast(OutboxLagDict, {
+                'subscription': subscription,
+                'pending': int(pending),
+                'in_flight': int(in_flight),
+                'oldest_seconds': float(oldest_seconds),
+                'max_attempts': int(max_attempts),
+            })
+            for subscription, pending, in_flight, oldest_seconds, max_attempts
+            in cast(list[tuple], self._cursor.fetchall())
+        ]
+
+    def _lease(self, entry_ids: list[int], violation_ids: list[int], lease_seconds: float) -> list[OutboxEntry]:
+        """Moves the availability of locked entries past the lease and reads their violations from both tables."""
+        entry_placeholders = ', '.join(['%s'] * len(entry_ids))
+        self._cursor.execute(
+            f'update violation_outbox set available_at = now(6) + interval %s microsecond, attempts = attempts + 1 '
+            f'where id_ in ({entry_placeholders})',
+            (int(lease_seconds * 1_000_000), *entry_ids)
+        )
+        violation_placeholders = ', '.join(['%s'] * len(violation_ids))
+        columns = 'id_, violation_date, driver_id, speed_camera_id, offense_id'
+        source = (f'(select {columns} from violations where id_ in ({violation_placeholders}) '
+                  f'union all select {columns} from violations_archive where id_ in ({violation_placeholders}))')
+        self._cursor.execute(
+            f'select o.id_ as entry_id, o.created_at, o.attempts, '
+            f'timestampdiff(microsecond, o.created_at, now(6)) / 1000000 as lag_seconds, '
+            f'v.id_, v.violation_date, v.driver_id, v.speed_camera_id, v.offense_id '
+            f'from violation_outbox o join {source} v on v.id_ = o.violation_id '
+            f'where o.id_ in ({entry_placeholders}) order by o.id_',
+            (*violation_ids, *violation_ids, *entry_ids)
+        )
+        columns_read = [desc[0] for desc in self._cursor.description or ()]
+        entries = []
+        for row in cast(list[tuple], self._cursor.fetchall()):
+            values = dict(zip(columns_read, row))
+            entries.append(OutboxEntry(
+                entry_id=values['entry_id'],
+                violation=Violation.from_row(cast(ViolationDict, values)),
+                created_at=values['created_at'],
+                attempts=values['attempts'],
+                lag_seconds=float(values['lag_seconds']),
+            ))
+        return entries
+
+    def _delete_entries(self, entry_ids: Collection[int]) -> int:
+        """Deletes outbox entries by ID with the current cursor."""
+        if not entry_ids:
+            return 0
+        self._cursor.execute(
+            f'delete from violation_outbox where id_ in ({", ".join(["%s"] * len(entry_ids))})',
+            tuple(entry_ids)
+        )
+        return self._cursor.rowcount
@@ -1,5 +1,6 @@
 from typing import TypedDict
 from datetime import date
+from decimal import Decimal
 
 
 class DriverDict(TypedDict, total=False):
@@ -30,6 +31,25 @@ class SpeedCameraDict(TypedDict, total=False):
     allowed_speed: int
 
 
+class CameraSectionDict(TypedDict, total=False):
+    """Dictionary representation of a `CameraSection` entity.
+
+    Attributes:
+        id_ (int): Unique identifier of the section.
+        entry_camera_id (int): ID of the speed camera at the start of the section.
+        exit_camera_id (int): ID of the speed camera at the end of the section.
+        distance_m (int): Road distance between the cameras in meters.
+        speed_limit (int): Maximum allowed average speed (km/h) over the section.
+        max_travel_seconds (int): Longest travel time still matched as one passage.
+    """
+    id_: int
+    entry_camera_id: int
+    exit_camera_id: int
+    distance_m: int
+    speed_limit: int
+    max_travel_seconds: int
+
+
 class OffenseDict(TypedDict, total=False):
     """Dictionary representation of an `Offense` entity.
 
@@ -89,7 +109,7 @@ class SummaryStatisticDict(TypedDict, total=False):
     """Summary of system-wide traffic violation statistics.
 
     Attributes:
-        total_drivers (int): Total number of drivers involved in violations.
+        total_drivers (int): Number of distinct drivers involved in violations.
         total_offenses (int): Total number of recorded offenses.
         total_points (int): Total sum of all penalty points.
         average_points (float): Average penalty points per violation.
@@ -127,4 +147,95 @@ class PopularSpeedCameraDict(TypedDict, total=False):
         total_count (int): Total number of violations recorded by the camera.
     """
     location: str
-    total_count: int
\ No newline at end of file
+    total_count: int
+
+
+class ViolationFilterDict(TypedDict, total=False):
+    """Optional criteria for selecting violations; omitted keys do not filter.
+
+    Attributes:
+        driver_id (int): ID of the driver.
+        speed_camera_id (int): ID of the speed camera.
+        offense_id (int): ID of the offense.
+        registration_number (str): Registration number of the driver.
+        date_from (date): First violation date to include.
+        date_to (date): Last violation date to include.
+    """
+    driver_id: int
+    speed_camera_id: int
+    offense_id: int
+    registration_number: str
+    date_from: date
+    date_to: date
+
+
+class CombinedStatisticsDict(TypedDict):
+    """Driver ranking, camera popularity and summary statistics computed together.
+
+    Attributes:
+        top_drivers (list[TopDriverDict]): Drivers ordered by total penalty points (descending).
+        popular_speed_cameras (list[PopularSpeedCameraDict]): Cameras ordered by violation count.
+        summary (list[SummaryStatisticDict]): Single row of summary statistics.
+    """
+    top_drivers: list[TopDriverDict]
+    popular_speed_cameras: list[PopularSpeedCameraDict]
+    summary: list[SummaryStatisticDict]
+
+
+class FineNoticeDict(TypedDict):
+    """Data of a fine notice for one violation.
+
+    Attributes:
+        violation_id (int): ID of the violation.
+        violation_date (date): Date of the violation.
+        driver_id (int): ID of the driver.
+        first_name (str): Driver's first name.
+        last_name (str): Driver's last name.
+        registration_number (str): Driver's vehicle registration number.
+        description (str): Description of the offense.
+        penalty_points (int): Penalty points of the offense.
+        fine_amount (Decimal): Fine of the offense.
+        total_points (int): Driver's penalty points including this violation.
+    """
+    violation_id: int
+    violation_date: date
+    driver_id: int
+    first_name: str
+    last_name: str
+    registration_number: str
+    description: str
+    penalty_points: int
+    fine_amount: Decimal
+    total_points: int
+
+
+class ViolationRollupDict(TypedDict, total=False):
+    """Number of violations in one period, per speed camera or per offense.
+
+    Attributes:
+        period_start (date): First day of the day or month.
+        speed_camera_id (int): ID of the speed camera; 0 for violations without a camera.
+        offense_id (int): ID of the offense; 0 for violations without an offense.
+        violation_count (int): Number of violations.
+    """
+    period_start: date
+    speed_camera_id: int
+    offense_id: int
+    violation_count: int
+
+
+class OutboxLagDict(TypedDict, total=False):
+    """Backlog of one outbox subscription.
+
+    Attributes:
+        subscription (str): Name of the subscription.
+        pending (int): Entries not acknowledged yet, including claimed ones.
+        in_flight (int): Entries claimed by a consumer whose lease has not expired.
+        oldest_seconds (float): Age of the oldest unacknowledged entry.
+        max_attempts (int): Highest number of deliveries of an unacknowledged entry.
+    """
+    subscription: str
+    pending: int
+    in_flight: int
+    oldest_seconds: float
+    max_attempts: int
@@ -0,0 +1,228 @@
+from src.domain.repository import ViolationRepository
+from src.ingestion.spool import ViolationSpool
+from src.domain.entity import Violation
+from dataclasses import dataclass
+from collections import deque
+from statistics import quantiles
+from typing import Self, cast
+from src.config import logger
+import asyncio
+import time
+
+
+@dataclass
+class BatchWriterMetrics:
+    """Snapshot of the state of an `AsyncBatchWriter`.
+
+    Attributes:
+        queue_depth (int): Violations waiting in the queue.
+        enqueued (int): Violations accepted since the writer was created.
+        written (int): Violations stored in the database.
+        spooled (int): Violations handed to the spool after every flush attempt failed.
+        failed (int): Violations lost because every flush attempt failed and no spool was configured.
+        retries (int): Flush attempts repeated after a failure.
+        flushes (int): Number of executed flushes.
+        flush_latency_p50_ms (float): Median flush latency over recent flushes.
+        flush_latency_p95_ms (float): 95th percentile flush latency over recent flushes.
+        flush_latency_max_ms (float): Slowest recent flush.
+    """
+
+    queue_depth: int = 0
+    enqueued: int = 0
+    written: int = 0
+    spooled: int = 0
+    failed: int = 0
+    retries: int = 0
+    flushes: int = 0
+    flush_latency_p50_ms: float = 0.0
+    flush_latency_p95_ms: float = 0.0
+    flush_latency_max_ms: float = 0.0
+
+
+class AsyncBatchWriter:
+    """Micro-batching writer storing violations with one transaction per flush.
+
+    Producers `put` violations into a bounded asyncio queue. A single writer task
+    collects them and flushes when the batch reaches `max_batch_size` or its
+    oldest violation is `max_batch_age` seconds old. Each flush is a single
+    `insert_many` call, so many violations share one connection checkout and one
+    commit. When the database falls behind, the queue fills up and `put` blocks,
+    which slows producers down instead of buffering without limit.
+
+    A failed flush is retried with exponential backoff, and the queue keeps
+    filling meanwhile, so a short outage slows producers down rather than
+    losing violations. A batch whose attempts are all spent is appended to
+    the `ViolationSpool`, if one is given, for a `SpoolReplayer` to store later.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        violation_repository: ViolationRepository,
+        max_batch_size: int = 500,
+        max_batch_age: float = 0.5,
+        max_queue_size: int = 10_000,
+        latency_window: int = 1_000,
+        max_attempts: int = 5,
+        retry_delay: float = 0.1,
+        max_retry_delay: float = 5.0,
+        spool: ViolationSpool | None = None,
+    ):
+        """Initializes the writer.
+
+        Args:
+            violation_repository (ViolationRepository): Repository used for flushing.
+            max_batch_size (int): Number of violations that triggers a flush.
+            max_batch_age (float): Seconds after which a partial batch is flushed.
+            max_queue_size (int): Capacity of the queue; producers wait when it is full.
+            latency_window (int): Number of recent flushes kept for latency metrics.
+            max_attempts (int): Flush attempts per batch before it is spooled or dropped.
+            retry_delay (float): Seconds to wait before the first retry; doubled for every further one.
+            max_retry_delay (float): Longest wait between two attempts.
+            spool (ViolationSpool | None): Receives batches whose attempts are all spent.
+
+        Raises:
+            ValueError: If `max_attempts` is smaller than 1.
+        """
+        if max_attempts < 1:
+            raise ValueError(f'max_attempts must be at least 1, got {max_attempts}')
+        self._violation_repository = violation_repository
+        self._max_batch_size = max_batch_size
+        self._max_batch_age = max_batch_age
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._spool = spool
+        self._queue: asyncio.Queue[Violation | object] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: asyncio.Task | None = None
+        self._flush_latencies: deque[float] = deque(maxlen=latency_window)
+        self._enqueued = 0
+        self._written = 0
+        self._spooled = 0
+        self._failed = 0
+        self._retries = 0
+        self._flushes = 0
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Starts the writer task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name='violation-batch-writer')
+
+    async def stop(self) -> None:
+        """Flushes all queued violations and stops the writer task."""
+        if self._task is None:
+            return
+        await self._queue.put(self._STOP)
+        await self._task
+        self._task = None
+
+    async def put(self, violation: Violation) -> None:
+        """Queues a violation, waiting while the queue is full.
+
+        Args:
+            violation (Violation): Violation to store.
+        """
+        await self._queue.put(violation)
+        self._enqueued += 1
+
+    async def put_many(self, violations: list[Violation]) -> None:
+        """Queues several violations, waiting while the queue is full.
+
+        Args:
+            violations (list[Violation]): Violations to store.
+        """
+        for violation in violations:
+            await self.put(violation)
+
+    @property
+    def metrics(self) -> BatchWriterMetrics:
+        """Returns the current queue depth, counters and flush latencies."""
+        latencies = sorted(latency * 1000 for latency in self._flush_latencies)
+
+        def percentile(pct: int) -> float:
+            if len(latencies) < 2:
+                return latencies[0] if latencies else 0.0
+            return quantiles(latencies, n=100, method='inclusive')[pct - 1]
+
+        return BatchWriterMetrics(
+            queue_depth=self._queue.qsize(),
+            enqueued=self._enqueued,
+            written=self._written,
+            spooled=self._spooled,
+            failed=self._failed,
+            retries=self._retries,
+            flushes=self._flushes,
+            flush_latency_p50_ms=percentile(50),
+            flush_latency_p95_ms=percentile(95),
+            flush_latency_max_ms=latencies[-1] if latencies else 0.0,
+        )
+
+    async def _run(self) -> None:
+        """Collects batches from the queue and flushes them until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is self._STOP:
+                break
+
+            batch = [cast(Violation, item)]
+            deadline = loop.time() + self._max_batch_age
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except TimeoutError:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(cast(Violation, item))
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[Violation]) -> None:
+        """Stores a batch in one transaction without blocking the event loop, retrying with backoff."""
+        start = time.perf_counter()
+        try:
+            for attempt in range(1, self._max_attempts + 1):
+                try:
+                    await asyncio.to_thread(self._violation_repository.insert_many, batch)
+                except Exception as e:
+                    if attempt == self._max_attempts:
+                        await self._give_up(batch, e)
+                        return
+                    delay = min(self._retry_delay * 2 ** (attempt - 1), self._max_retry_delay)
+                    logger.warning(f'Failed to flush {len(batch)} violations, retrying in {delay:.2f} s: {e}')
+                    self._retries += 1
+                    await asyncio.sleep(delay)
+                else:
+                    self._written += len(batch)
+                    return
+        finally:
+            self._flushes += 1
+            self._flush_latencies.append(time.perf_counter() - start)
+
+    async def _give_up(self, batch: list[Violation], error: Exception) -> None:
+        """Hands a batch that could not be stored to the spool, or drops it if there is none."""
+        if self._spool is not None:
+            try:
+                await asyncio.to_thread(self._spool.append, batch)
+            except Exception as e:
+                logger.error(f'Failed to spool {len(batch)} violations after {self._max_attempts} attempts: {e}')
+            else:
+                self._spooled += len(batch)
+                logger.warning(f'Spooled {len(batch)} violations after {self._max_attempts} failed flushes: {error}')
+                return
+        self._failed += len(batch)
+        logger.error(f'Dropped {len(batch)} violations after {self._max_attempts} failed flushes: {error}')
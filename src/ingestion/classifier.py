@@ -0,0 +1,175 @@
+from src.ingestion.reading import SpeedReading, OverspeedBand
+from src.ingestion.section import SectionPassage
+from src.domain.entity import Violation
+from dataclasses import dataclass, field
+from bisect import bisect_right
+
+
+@dataclass
+class ClassificationResult:
+    """Outcome of classifying a batch of speed readings.
+
+    Attributes:
+        violations (list[Violation]): Violations created from readings above the limit.
+        within_limit (int): Readings that did not exceed any overspeed band.
+        unknown_cameras (int): Readings from cameras that are not registered.
+        unknown_drivers (int): Violating readings whose plate did not resolve to a driver.
+    """
+
+    violations: list[Violation] = field(default_factory=list)
+    within_limit: int = 0
+    unknown_cameras: int = 0
+    unknown_drivers: int = 0
+
+
+class OverspeedClassifier:
+    """Classifies speed readings into violations using a table of overspeed bands.
+
+    The band thresholds are kept in a sorted list, so classifying a reading is a
+    single binary search and no database access happens during classification.
+    """
+
+    def __init__(self, bands: list[OverspeedBand]):
+        """Initializes the classifier.
+
+        Args:
+            bands (list[OverspeedBand]): Overspeed bands, in any order.
+
+        Raises:
+            ValueError: If no bands are given, a band starts at or below 0 km/h,
+                or two bands share the same threshold.
+        """
+        if not bands:
+            raise ValueError('At least one overspeed band is required')
+        ordered = sorted(bands, key=lambda band: band.min_excess)
+        thresholds = [band.min_excess for band in ordered]
+        if thresholds[0] <= 0:
+            raise ValueError('Overspeed bands must start above 0 km/h')
+        if len(set(thresholds)) != len(thresholds):
+            raise ValueError('Overspeed band thresholds must be unique')
+
+        self._thresholds = thresholds
+        self._offense_ids = [band.offense_id for band in ordered]
+
+    def offense_for(self, excess: int) -> int | None:
+        """Returns the offense for a given overspeed.
+
+        Args:
+            excess (int): Speed over the limit in km/h.
+
+        Returns:
+            int | None: ID of the matching offense, or None if no band applies.
+        """
+        position = bisect_right(self._thresholds, excess)
+        return self._offense_ids[position - 1] if position else None
+
+    def violating_plates(self, readings: list[SpeedReading], allowed_speeds: dict[int, int]) -> set[str]:
+        """Collects registration numbers of readings that fall into any overspeed band.
+
+        Only these plates need to be resolved to drivers before classification.
+
+        Args:
+            readings (list[SpeedReading]): Readings to inspect.
+            allowed_speeds (dict[int, int]): Allowed speed keyed by speed camera ID.
+
+        Returns:
+            set[str]: Registration numbers of violating readings.
+        """
+        lowest = self._thresholds[0]
+        return {
+            reading.registration_number
+            for reading in readings
+            if reading.speed_camera_id in allowed_speeds
+            and reading.measured_speed - allowed_speeds[reading.speed_camera_id] >= lowest
+        }
+
+    def classify(
+        self,
+        readings: list[SpeedReading],
+        allowed_speeds: dict[int, int],
+        driver_ids: dict[str, int],
+    ) -> ClassificationResult:
+        """Classifies a batch of readings against preloaded reference data.
+
+        Args:
+            readings (list[SpeedReading]): Readings to classify.
+            allowed_speeds (dict[int, int]): Allowed speed keyed by speed camera ID.
+            driver_ids (dict[str, int]): Driver ID keyed by registration number.
+
+        Returns:
+            ClassificationResult: Created violations and counts of discarded readings.
+        """
+        result = ClassificationResult()
+        thresholds = self._thresholds
+        offense_ids = self._offense_ids
+
+        for reading in readings:
+            allowed_speed = allowed_speeds.get(reading.speed_camera_id)
+            if allowed_speed is None:
+                result.unknown_cameras += 1
+                continue
+
+            position = bisect_right(thresholds, reading.measured_speed - allowed_speed)
+            if not position:
+                result.within_limit += 1
+                continue
+
+            driver_id = driver_ids.get(reading.registration_number)
+            if driver_id is None:
+                result.unknown_drivers += 1
+                continue
+
+            result.violations.append(Violation(
+                violation_date=reading.timestamp.date().isoformat(),
+                driver_id=driver_id,
+                speed_camera_id=reading.speed_camera_id,
+                offense_id=offense_ids[position - 1],
+            ))
+
+        return result
+
+    def violating_passage_plates(self, passages: list[SectionPassage]) -> set[str]:
+        """Collects registration numbers of section passages that fall into any overspeed band.
+
+        Args:
+            passages (list[SectionPassage]): Matched section passages.
+
+        Returns:
+            set[str]: Registration numbers of violating passages.
+        """
+        lowest = self._thresholds[0]
+        return {passage.registration_number for passage in passages if passage.excess >= lowest}
+
+    def classify_passages(self, passages: list[SectionPassage], driver_ids: dict[str, int]) -> ClassificationResult:
+        """Classifies section passages by their average speed.
+
+        Violations are attributed to the section's exit camera and dated by
+        the exit reading.
+
+        Args:
+            passages (list[SectionPassage]): Matched section passages.
+            driver_ids (dict[str, int]): Driver ID keyed by registration number.
+
+        Returns:
+            ClassificationResult: Created violations and counts of discarded passages.
+        """
+        result = ClassificationResult()
+        for passage in passages:
+            offense_id = self.offense_for(passage.excess)
+            if offense_id is None:
+                result.within_limit += 1
+                continue
+
+            driver_id = driver_ids.get(passage.registration_number)
+            if driver_id is None:
+                result.unknown_drivers += 1
+                continue
+
+            result.violations.append(Violation(
+                violation_date=passage.exit_time.date().isoformat(),
+                driver_id=driver_id,
+                speed_camera_id=passage.section.exit_camera_id,
+                offense_id=offense_id,
+            ))
+
+        return result
@@ -0,0 +1,114 @@
+from src.ingestion.reading import SpeedReading
+from dataclasses import dataclass
+
+
+@dataclass
+class DeduplicationStats:
+    """Counters of a `DetectionDeduplicator`.
+
+    Attributes:
+        accepted (int): Readings passed on as first detections.
+        duplicates (int): Readings dropped as repeated detections.
+        late (int): Readings older than the retained window, passed on unchecked.
+        overflow (int): Readings passed on unrecorded because their bucket was full.
+    """
+
+    accepted: int = 0
+    duplicates: int = 0
+    late: int = 0
+    overflow: int = 0
+
+
+class DetectionDeduplicator:
+    """Drops repeated detections of the same plate by the same camera.
+
+    Readings are keyed on (registration number, camera, time bucket). Each bucket
+    keeps an exact set of keys; only the newest `retained_buckets` buckets are
+    kept and older ones are dropped as time advances, so memory is bounded by
+    `retained_buckets * max_keys_per_bucket` keys. Readings belonging to dropped
+    buckets and readings arriving when their bucket is full are passed on
+    rather than risk dropping a genuine violation.
+    """
+
+    def __init__(self, bucket_seconds: int = 10, retained_buckets: int = 6, max_keys_per_bucket: int = 1_000_000):
+        """Initializes the deduplicator.
+
+        Args:
+            bucket_seconds (int): Width of a time bucket in seconds.
+            retained_buckets (int): Number of most recent buckets kept in memory.
+            max_keys_per_bucket (int): Maximum number of keys recorded per bucket.
+        """
+        if bucket_seconds <= 0 or retained_buckets <= 0 or max_keys_per_bucket <= 0:
+            raise ValueError('Deduplicator bucket width, retention and capacity must be positive')
+        self._bucket_seconds = bucket_seconds
+        self._retained_buckets = retained_buckets
+        self._max_keys_per_bucket = max_keys_per_bucket
+        self._buckets: dict[int, set[tuple[str, int]]] = {}
+        self._newest_bucket: int | None = None
+        self.stats = DeduplicationStats()
+
+    @property
+    def size(self) -> int:
+        """Returns the number of keys currently held in memory."""
+        return sum(len(keys) for keys in self._buckets.values())
+
+    def filter(self, readings: list[SpeedReading]) -> list[SpeedReading]:
+        """Returns the readings that are not repeated detections, preserving order.
+
+        Args:
+            readings (list[SpeedReading]): Readings to screen.
+
+        Returns:
+            list[SpeedReading]: First detections and readings that could not be checked.
+        """
+        accepted: list[SpeedReading] = []
+        append = accepted.append
+        buckets = self._buckets
+        bucket_seconds = self._bucket_seconds
+        max_keys = self._max_keys_per_bucket
+        stats = self.stats
+
+        for reading in readings:
+            bucket = int(reading.timestamp.timestamp()) // bucket_seconds
+            keys = buckets.get(bucket)
+            if keys is None:
+                keys = self._open_bucket(bucket)
+                if keys is None:
+                    stats.late += 1
+                    append(reading)
+                    continue
+
+            key = (reading.registration_number, reading.speed_camera_id)
+            if key in keys:
+                stats.duplicates += 1
+                continue
+            if len(keys) < max_keys:
+                keys.add(key)
+            else:
+                stats.overflow += 1
+            stats.accepted += 1
+            append(reading)
+
+        return accepted
+
+    def _open_bucket(self, bucket: int) -> set[tuple[str, int]] | None:
+        """Creates a bucket and drops buckets that fell out of the retained window.
+
+        Args:
+            bucket (int): Index of the bucket to create.
+
+        Returns:
+            set[tuple[str, int]] | None: The new bucket, or None if it is older than the window.
+        """
+        if self._newest_bucket is not None and bucket <= self._newest_bucket - self._retained_buckets:
+            return None
+
+        if self._newest_bucket is None or bucket > self._newest_bucket:
+            self._newest_bucket = bucket
+            oldest_retained = bucket - self._retained_buckets + 1
+            for expired in [index for index in self._buckets if index < oldest_retained]:
+                del self._buckets[expired]
+
+        keys: set[tuple[str, int]] = set()
+        self._buckets[bucket] = keys
+        return keys
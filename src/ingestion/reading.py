@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class SpeedReading:
+    """Raw measurement reported by a speed camera.
+
+    Attributes:
+        speed_camera_id (int): ID of the camera that took the measurement.
+        registration_number (str): Registration number read from the vehicle plate.
+        measured_speed (int): Measured speed in km/h.
+        timestamp (datetime): Moment of the measurement.
+    """
+
+    speed_camera_id: int
+    registration_number: str
+    measured_speed: int
+    timestamp: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class OverspeedBand:
+    """Maps a range of overspeed to the offense it constitutes.
+
+    A band applies when the speed over the camera's limit is at least
+    `min_excess` and below the `min_excess` of the next band.
+
+    Attributes:
+        min_excess (int): Lowest overspeed (in km/h) covered by the band.
+        offense_id (int): ID of the `Offense` assigned to readings in this band.
+    """
+
+    min_excess: int
+    offense_id: int
@@ -0,0 +1,163 @@
+from src.domain.plate_index import normalize_plate
+from src.ingestion.reading import SpeedReading
+from src.domain.entity import CameraSection
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class SectionPassage:
+    """A vehicle's matched passage through a camera section.
+
+    Attributes:
+        section (CameraSection): Section the vehicle passed through.
+        registration_number (str): Registration number as read by the exit camera.
+        entry_time (datetime): Moment the entry camera read the plate.
+        exit_time (datetime): Moment the exit camera read the plate.
+        average_speed (float): Average speed over the section in km/h.
+    """
+
+    section: CameraSection
+    registration_number: str
+    entry_time: datetime
+    exit_time: datetime
+    average_speed: float
+
+    @property
+    def excess(self) -> int:
+        """Returns the whole km/h by which the average speed exceeds the section limit."""
+        return int(self.average_speed - (self.section.speed_limit or 0))
+
+
+@dataclass
+class SectionMatchStats:
+    """Counters of a `SectionSpeedMatcher`.
+
+    Attributes:
+        entries (int): Plates recorded at entry cameras.
+        matched (int): Exit readings matched with an entry.
+        unmatched_exits (int): Exit readings without a pending entry of the plate.
+        expired (int): Entries dropped because no exit was read within the section's time window.
+        evicted (int): Entries dropped because their section reached its pending limit.
+    """
+
+    entries: int = 0
+    matched: int = 0
+    unmatched_exits: int = 0
+    expired: int = 0
+    evicted: int = 0
+
+
+class SectionSpeedMatcher:
+    """Matches entry and exit readings of camera sections and computes average speeds.
+
+    This is an expiring hash join keyed by plate: every section keeps its
+    pending entries in an insertion-ordered dictionary from normalized plate
+    to entry time. An exit reading looks its plate up in O(1). Because the
+    readings arrive roughly in time order, the oldest entries are at the front
+    of the dictionary, and those older than the section's `max_travel_seconds`
+    are dropped as the stream advances. Each section also holds at most
+    `max_pending_per_section` entries; the oldest is evicted first, so memory
+    stays bounded even when exits are never read.
+    """
+
+    def __init__(self, sections: Iterable[CameraSection], max_pending_per_section: int = 1_000_000):
+        """Initializes the matcher.
+
+        Args:
+            sections (Iterable[CameraSection]): Sections to enforce.
+            max_pending_per_section (int): Maximum number of unmatched entries kept per section.
+
+        Raises:
+            ValueError: If a section lacks a camera, has a non-positive distance, limit
+                or time window, or the pending limit is not positive.
+        """
+        if max_pending_per_section <= 0:
+            raise ValueError('Pending entry limit must be positive')
+        self._max_pending = max_pending_per_section
+        self._by_entry: dict[int, list[CameraSection]] = {}
+        self._by_exit: dict[int, list[CameraSection]] = {}
+        self._pending: dict[tuple[int, int], OrderedDict[str, datetime]] = {}
+        self.stats = SectionMatchStats()
+
+        for section in sections:
+            if section.entry_camera_id is None or section.exit_camera_id is None:
+                raise ValueError('Camera section needs an entry and an exit camera')
+            if not (section.distance_m or 0) > 0 or not (section.speed_limit or 0) > 0 \
+                    or not (section.max_travel_seconds or 0) > 0:
+                raise ValueError('Camera section distance, speed limit and time window must be positive')
+            self._by_entry.setdefault(section.entry_camera_id, []).append(section)
+            self._by_exit.setdefault(section.exit_camera_id, []).append(section)
+            self._pending[self._key(section)] = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """Returns the number of unmatched entries currently held in memory."""
+        return sum(len(pending) for pending in self._pending.values())
+
+    def match(self, readings: Iterable[SpeedReading]) -> list[SectionPassage]:
+        """Feeds readings into the join and returns the completed passages.
+
+        A reading from a camera that ends one section and starts the next is
+        used as both an exit and an entry.
+
+        Args:
+            readings (Iterable[SpeedReading]): Readings in approximate time order.
+
+        Returns:
+            list[SectionPassage]: Passages completed by exit readings in the batch.
+        """
+        passages: list[SectionPassage] = []
+        stats = self.stats
+        for reading in readings:
+            exits = self._by_exit.get(reading.speed_camera_id)
+            entries = self._by_entry.get(reading.speed_camera_id)
+            if exits is None and entries is None:
+                continue
+            plate = normalize_plate(reading.registration_number)
+
+            for section in exits or ():
+                pending = self._expire(section, reading.timestamp)
+                entry_time = pending.get(plate)
+                if entry_time is None or entry_time >= reading.timestamp:
+                    stats.unmatched_exits += 1
+                    continue
+                del pending[plate]
+                travel_seconds = (reading.timestamp - entry_time).total_seconds()
+                stats.matched += 1
+                passages.append(SectionPassage(
+                    section=section,
+                    registration_number=reading.registration_number,
+                    entry_time=entry_time,
+                    exit_time=reading.timestamp,
+                    average_speed=(section.distance_m or 0) / travel_seconds * 3.6,
+                ))
+
+            for section in entries or ():
+                pending = self._expire(section, reading.timestamp)
+                if pending.pop(plate, None) is None and len(pending) >= self._max_pending:
+                    pending.popitem(last=False)
+                    stats.evicted += 1
+                pending[plate] = reading.timestamp
+                stats.entries += 1
+
+        return passages
+
+    def _expire(self, section: CameraSection, now: datetime) -> OrderedDict[str, datetime]:
+        """Drops a section's entries too old to be matched at `now` and returns the rest."""
+        pending = self._pending[self._key(section)]
+        horizon = now - timedelta(seconds=section.max_travel_seconds or 0)
+        while pending:
+            oldest_plate = next(iter(pending))
+            if pending[oldest_plate] >= horizon:
+                break
+            del pending[oldest_plate]
+            self.stats.expired += 1
+        return pending
+
+    @staticmethod
+    def _key(section: CameraSection) -> tuple[int, int]:
+        """Returns the key of a section's pending entries."""
+        return section.entry_camera_id or 0, section.exit_camera_id or 0
@@ -0,0 +1,349 @@
+from src.domain.repository import ViolationRepository, CheckpointRepository
+from src.database.connection import MySQLConnectionManager
+from src.domain.entity import Violation
+from datetime import date
+from pathlib import Path
+from src.config import logger
+import threading
+import struct
+import mmap
+import zlib
+
+RECORD_HEADER = struct.Struct('<II')
+VIOLATION_PAYLOAD = struct.Struct('<iiii')
+SEGMENT_SUFFIX = '.seg'
+
+
+class SpoolSegment:
+    """A preallocated, memory-mapped file holding a contiguous range of spool records.
+
+    Every record is framed as `<payload length><crc32 of payload><payload>`.
+    The unused tail of the file is zero-filled, so a zero length marks the end
+    of the written data.
+    """
+
+    def __init__(self, path: Path, base_offset: int, size: int):
+        """Opens or creates the segment file and finds the end of its valid records.
+
+        Args:
+            path (Path): Location of the segment file.
+            base_offset (int): Spool offset of the first byte of the segment.
+            size (int): Size of the segment file in bytes.
+        """
+        self.path = path
+        self.base_offset = base_offset
+        if not path.exists():
+            with open(path, 'wb') as segment_file:
+                segment_file.truncate(size)
+        self._file = open(path, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self.size = len(self._map)
+        self.end = self._recover()
+
+    @property
+    def end_offset(self) -> int:
+        """Returns the spool offset right after the last valid record."""
+        return self.base_offset + self.end
+
+    def append(self, payload: bytes) -> bool:
+        """Writes a record at the end of the segment.
+
+        Args:
+            payload (bytes): Record payload.
+
+        Returns:
+            bool: False if the record does not fit into the remaining space.
+        """
+        record_end = self.end + RECORD_HEADER.size + len(payload)
+        if record_end + RECORD_HEADER.size > self.size:
+            return False
+        self._map[self.end + RECORD_HEADER.size:record_end] = payload
+        RECORD_HEADER.pack_into(self._map, self.end, len(payload), zlib.crc32(payload))
+        self.end = record_end
+        return True
+
+    def read(self, position: int, max_records: int) -> tuple[list[bytes], int]:
+        """Reads consecutive records starting at a position within the segment.
+
+        Args:
+            position (int): Position of the first record, relative to the segment start.
+            max_records (int): Maximum number of records to return.
+
+        Returns:
+            tuple[list[bytes], int]: Record payloads and the position after the last one.
+        """
+        payloads: list[bytes] = []
+        while position < self.end and len(payloads) < max_records:
+            length, _ = RECORD_HEADER.unpack_from(self._map, position)
+            start = position + RECORD_HEADER.size
+            payloads.append(self._map[start:start + length])
+            position = start + length
+        return payloads, position
+
+    def flush(self) -> None:
+        """Forces written records to disk."""
+        self._map.flush()
+
+    def close(self) -> None:
+        """Unmaps and closes the segment file."""
+        self._map.close()
+        self._file.close()
+
+    def _recover(self) -> int:
+        """Finds the end of the valid records and discards a torn trailing write.
+
+        Returns:
+            int: Position right after the last record with a valid checksum.
+        """
+        position = 0
+        while position + RECORD_HEADER.size <= self.size:
+            length, checksum = RECORD_HEADER.unpack_from(self._map, position)
+            if length == 0:
+                return position
+            start = position + RECORD_HEADER.size
+            if start + length > self.size or zlib.crc32(self._map[start:start + length]) != checksum:
+                logger.warning(f'Discarding corrupted spool records in {self.path} from position {position}')
+                self._map[position:] = bytes(self.size - position)
+                return position
+            position = start + length
+        return position
+
+
+class ViolationSpool:
+    """Local append-only log of violations waiting to be stored in the database.
+
+    Appending only copies bytes into a memory-mapped segment, so its latency
+    does not depend on the database. Offsets are byte positions in the logical
+    log; segments are named after the offset of their first byte and deleted
+    once every record in them has been committed to the database.
+    """
+
+    def __init__(self, directory: str | Path, segment_size: int = 64 * 1024 * 1024):
+        """Opens the spool, recovering existing segments.
+
+        Args:
+            directory (str | Path): Directory holding the segment files.
+            segment_size (int): Size of newly created segment files in bytes.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segment_size = segment_size
+        self._lock = threading.Lock()
+        self._segments = [
+            SpoolSegment(path, int(path.stem), segment_size)
+            for path in sorted(self._directory.glob(f'*{SEGMENT_SUFFIX}'), key=lambda path: int(path.stem))
+        ]
+        if not self._segments:
+            self._segments.append(self._create_segment(0))
+
+    @property
+    def start_offset(self) -> int:
+        """Returns the offset of the oldest record still kept in the spool."""
+        with self._lock:
+            return self._segments[0].base_offset
+
+    @property
+    def end_offset(self) -> int:
+        """Returns the offset right after the newest record."""
+        with self._lock:
+            return self._segments[-1].end_offset
+
+    def append(self, violations: list[Violation], sync: bool = True) -> int:
+        """Appends violations to the spool.
+
+        Args:
+            violations (list[Violation]): Violations to store.
+            sync (bool): Whether to force the records to disk before returning.
+
+        Returns:
+            int: Offset right after the last appended record.
+        """
+        with self._lock:
+            for violation in violations:
+                payload = self._encode(violation)
+                if not self._segments[-1].append(payload):
+                    self._segments[-1].flush()
+                    self._segments.append(self._create_segment(self._segments[-1].end_offset))
+                    if not self._segments[-1].append(payload):
+                        raise ValueError(f'Spool record of {len(payload)} bytes exceeds the segment size')
+            if sync:
+                self._segments[-1].flush()
+            return self._segments[-1].end_offset
+
+    def read(self, offset: int, max_records: int) -> tuple[list[Violation], int]:
+        """Reads violations starting at an offset.
+
+        Args:
+            offset (int): Offset of the first record to read.
+            max_records (int): Maximum number of violations to return.
+
+        Returns:
+            tuple[list[Violation], int]: Violations and the offset after the last one.
+        """
+        violations: list[Violation] = []
+        with self._lock:
+            offset = max(offset, self._segments[0].base_offset)
+            for index, segment in enumerate(self._segments):
+                is_last = index == len(self._segments) - 1
+                if offset >= segment.end_offset and not is_last:
+                    continue
+                payloads, position = segment.read(offset - segment.base_offset, max_records - len(violations))
+                violations.extend(self._decode(payload) for payload in payloads)
+                offset = segment.base_offset + position
+                if len(violations) >= max_records:
+                    break
+        return violations, offset
+
+    def release(self, offset: int) -> None:
+        """Deletes segments whose records all lie before a committed offset.
+
+        Args:
+            offset (int): Offset up to which records are stored in the database.
+        """
+        with self._lock:
+            while len(self._segments) > 1 and self._segments[1].base_offset <= offset:
+                segment = self._segments.pop(0)
+                segment.close()
+                segment.path.unlink()
+
+    def close(self) -> None:
+        """Flushes and closes all segments."""
+        with self._lock:
+            for segment in self._segments:
+                segment.flush()
+                segment.close()
+
+    def _create_segment(self, base_offset: int) -> SpoolSegment:
+        """Creates a new segment starting at the given offset."""
+        return SpoolSegment(self._directory / f'{base_offset:020d}{SEGMENT_SUFFIX}', base_offset, self._segment_size)
+
+    @staticmethod
+    def _encode(violation: Violation) -> bytes:
+        """Packs a violation into a fixed-size binary payload; missing IDs are stored as 0."""
+        violation_date = date.fromisoformat(violation.violation_date) if violation.violation_date else None
+        return VIOLATION_PAYLOAD.pack(
+            violation_date.toordinal() if violation_date else 0,
+            violation.driver_id or 0,
+            violation.speed_camera_id or 0,
+            violation.offense_id or 0,
+        )
+
+    @staticmethod
+    def _decode(payload: bytes) -> Violation:
+        """Unpacks a violation stored by `_encode`."""
+        ordinal, driver_id, speed_camera_id, offense_id = VIOLATION_PAYLOAD.unpack(payload)
+        return Violation(
+            violation_date=date.fromordinal(ordinal).isoformat() if ordinal else None,
+            driver_id=driver_id or None,
+            speed_camera_id=speed_camera_id or None,
+            offense_id=offense_id or None,
+        )
+
+
+class SpoolReplayer:
+    """Background thread draining a `ViolationSpool` into the database.
+
+    Each batch of violations is inserted together with the new spool offset in
+    one transaction, so after a crash or a failed commit the batch is either
+    fully stored with its offset or replayed from the previous offset. This
+    makes replay idempotent without requiring a natural key on `violations`.
+    """
+
+    def __init__(
+        self,
+        spool: ViolationSpool,
+        connection_manager: MySQLConnectionManager,
+        checkpoint_name: str = 'violation_spool',
+        batch_size: int = 1_000,
+        poll_interval: float = 0.2,
+        retry_interval: float = 1.0,
+    ):
+        """Initializes the replayer.
+
+        Args:
+            spool (ViolationSpool): Spool to drain.
+            connection_manager (MySQLConnectionManager): Provides pooled connections.
+            checkpoint_name (str): Name of the checkpoint storing the committed offset.
+            batch_size (int): Maximum number of violations per transaction.
+            poll_interval (float): Seconds to wait when the spool is drained.
+            retry_interval (float): Seconds to wait after a failed batch.
+        """
+        self._spool = spool
+        self._connection_manager = connection_manager
+        self._violation_repository = ViolationRepository(connection_manager)
+        self._checkpoint_repository = CheckpointRepository(connection_manager)
+        self._checkpoint_name = checkpoint_name
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._retry_interval = retry_interval
+        self._committed_offset: int | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def committed_offset(self) -> int:
+        """Returns the spool offset up to which violations are stored in the database."""
+        if self._committed_offset is None:
+            offset = self._checkpoint_repository.get(self._checkpoint_name) or 0
+            if offset > self._spool.end_offset:
+                logger.warning(f'Checkpoint {self._checkpoint_name} is ahead of the spool, replaying it from the start')
+                offset = self._spool.start_offset
+            self._committed_offset = offset
+        return self._committed_offset
+
+    @property
+    def lag(self) -> int:
+        """Returns the number of spooled bytes not yet stored in the database."""
+        return self._spool.end_offset - self.committed_offset
+
+    def start(self) -> None:
+        """Starts draining the spool in a daemon thread."""
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='violation-spool-replayer', daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread after its current batch."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def replay_once(self) -> int:
+        """Stores the next batch of spooled violations and commits the new offset.
+
+        Returns:
+            int: Number of stored violations; 0 if the spool is drained.
+        """
+        violations, next_offset = self._spool.read(self.committed_offset, self._batch_size)
+        if not violations:
+            return 0
+
+        conn = self._connection_manager.get_connection()
+        try:
+            self._violation_repository.insert_many(violations, conn=conn)
+            self._checkpoint_repository.save(self._checkpoint_name, next_offset, conn=conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        self._committed_offset = next_offset
+        self._spool.release(next_offset)
+        return len(violations)
+
+    def _run(self) -> None:
+        """Drains the spool until stopped, backing off while the database fails."""
+        while not self._stop_event.is_set():
+            try:
+                stored = self.replay_once()
+            except Exception as e:
+                self._committed_offset = None
+                logger.error(f'Failed to replay spooled violations: {e}')
+                self._stop_event.wait(self._retry_interval)
+                continue
+            if not stored:
+                self._stop_event.wait(self._poll_interval)
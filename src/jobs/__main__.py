@@ -0,0 +1,78 @@
+from src.database.connection import MySQLConnectionManager
+from src.jobs.driver_sync import DriverRegistrySync
+from src.jobs.retention import ViolationArchiver
+from src.jobs.notices import FineNoticeGenerator, NOTICE_TEMPLATE
+from src.jobs.rollups import ViolationRollupJob
+from src.domain.repository import DriverRepository, ViolationRepository, ViolationOutboxRepository
+from datetime import date, timedelta
+import argparse
+
+
+def main() -> None:
+    """Runs a maintenance job.
+
+    Examples:
+        python -m src.jobs driver-sync registry.csv --snapshot var/drivers.snapshot
+        python -m src.jobs archive-violations --keep-days 365
+        python -m src.jobs fine-notices --day 2025-10-14 --output var/notices
+        python -m src.jobs rollup-violations --backfill
+        python -m src.jobs outbox-lag
+    """
+    parser = argparse.ArgumentParser(prog='python -m src.jobs')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    sync_parser = subparsers.add_parser('driver-sync', help='apply a full driver registry file, writing only changes')
+    sync_parser.add_argument('registry', help='CSV file with registration_number, first_name and last_name columns')
+    sync_parser.add_argument('--snapshot', default='var/drivers.snapshot')
+    sync_parser.add_argument('--chunk-size', type=int, default=1_000)
+    sync_parser.add_argument('--rebuild-snapshot', action='store_true', help='re-read driver hashes from the database')
+
+    archive_parser = subparsers.add_parser('archive-violations', help='move old violations to violations_archive')
+    cutoff_group = archive_parser.add_mutually_exclusive_group(required=True)
+    cutoff_group.add_argument('--before', type=date.fromisoformat, help='archive violations dated before this day')
+    cutoff_group.add_argument('--keep-days', type=int, help='archive violations older than this many days')
+    archive_parser.add_argument('--chunk-size', type=int, default=1_000)
+    archive_parser.add_argument('--pause', type=float, default=0.1, help='seconds to wait between chunks')
+
+    notices_parser = subparsers.add_parser('fine-notices', help="write fine notices for a day's violations")
+    notices_parser.add_argument('--day', type=date.fromisoformat, help='date of the violations; defaults to yesterday')
+    notices_parser.add_argument('--output', default='var/notices')
+    notices_parser.add_argument('--template', help='file with a $field template replacing the default one')
+    notices_parser.add_argument('--workers', type=int, help='rendering processes; defaults to the number of CPUs')
+    notices_parser.add_argument('--chunk-size', type=int, default=1_000, help='notices per output file')
+
+    rollup_parser = subparsers.add_parser('rollup-violations', help='update daily and monthly violation counts')
+    rollup_parser.add_argument('--chunk-size', type=int, default=10_000)
+    rollup_parser.add_argument('--backfill', action='store_true', help='rebuild the rollups from the whole history')
+    rollup_parser.add_argument('--recount-window', type=int, default=10_000, help='trailing IDs recounted per run')
+
+    subparsers.add_parser('outbox-lag', help='show the backlog of every violation outbox subscription')
+
+    args = parser.parse_args()
+    connection_manager = MySQLConnectionManager()
+
+    if args.command == 'driver-sync':
+        sync = DriverRegistrySync(DriverRepository(connection_manager), args.snapshot, args.chunk_size)
+        if args.rebuild_snapshot:
+            sync.rebuild_snapshot()
+        print(sync.sync(args.registry))
+    elif args.command == 'archive-violations':
+        cutoff = args.before or date.today() - timedelta(days=args.keep_days)
+        archiver = ViolationArchiver(connection_manager, args.chunk_size, args.pause)
+        print(archiver.run(cutoff))
+    elif args.command == 'fine-notices':
+        template = open(args.template).read() if args.template else NOTICE_TEMPLATE
+        generator = FineNoticeGenerator(
+            ViolationRepository(connection_manager), args.output, template, args.workers, args.chunk_size
+        )
+        print(generator.generate(args.day or date.today() - timedelta(days=1)))
+    elif args.command == 'rollup-violations':
+        job = ViolationRollupJob(connection_manager, args.chunk_size, recount_window=args.recount_window)
+        print(job.backfill() if args.backfill else job.run())
+    elif args.command == 'outbox-lag':
+        for lag in ViolationOutboxRepository(connection_manager).lag():
+            print(lag)
+
+
+if __name__ == '__main__':
+    main()
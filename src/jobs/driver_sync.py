@@ -0,0 +1,216 @@
+from src.domain.repository import DriverRepository
+from src.domain.entity import Driver
+from src.domain.query import QuerySpec
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+from src.config import logger
+import hashlib
+import time
+import csv
+import os
+
+REGISTRY_COLUMNS = ('registration_number', 'first_name', 'last_name')
+
+
+def driver_hash(first_name: str | None, last_name: str | None) -> str:
+    """Computes the content hash of the mutable fields of a driver.
+
+    Args:
+        first_name (str | None): Driver's first name.
+        last_name (str | None): Driver's last name.
+
+    Returns:
+        str: Hex digest identifying the field values.
+    """
+    content = f'{first_name or ""}\x1f{last_name or ""}'.encode()
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+@dataclass
+class DriverSyncSummary:
+    """Summary of a driver registry synchronization.
+
+    Attributes:
+        read (int): Registry rows read.
+        duplicates (int): Rows skipped because their plate already appeared in the registry.
+        inserted (int): Drivers added to the database.
+        updated (int): Existing drivers whose names changed.
+        unchanged (int): Rows skipped because their hash matched the snapshot.
+        missing (int): Known drivers absent from the registry; they are kept.
+        elapsed_seconds (float): Wall-clock duration of the run.
+    """
+
+    read: int = 0
+    duplicates: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    missing: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class DriverRegistrySync:
+    """Applies a full driver registry file to the `drivers` table, writing only changes.
+
+    A local snapshot maps every registration number to its driver ID and the
+    hash of its names. The registry is streamed row by row and compared with
+    the snapshot; only new and changed drivers are written, with chunked
+    `upsert_many` calls. Plates unknown to the snapshot are checked against
+    the database before they are inserted, so a stale snapshot does not
+    duplicate drivers. The snapshot is rebuilt from the database when it is
+    missing and rewritten atomically after every run, including a failed one,
+    so drivers written before a failure are not inserted again.
+    """
+
+    def __init__(self, driver_repository: DriverRepository, snapshot_path: str | Path, chunk_size: int = 1_000):
+        """Initializes the synchronization.
+
+        Args:
+            driver_repository (DriverRepository): Repository used to read and write drivers.
+            snapshot_path (str | Path): Location of the local snapshot file.
+            chunk_size (int): Number of changed drivers written per statement.
+        """
+        self._driver_repository = driver_repository
+        self._snapshot_path = Path(snapshot_path)
+        self._chunk_size = chunk_size
+
+    def sync(self, registry_path: str | Path) -> DriverSyncSummary:
+        """Synchronizes the drivers with a registry CSV file.
+
+        The file needs a header with `registration_number`, `first_name` and
+        `last_name` columns.
+
+        Args:
+            registry_path (str | Path): Location of the registry file.
+
+        Returns:
+            DriverSyncSummary: Counts of read, written and skipped rows.
+        """
+        start = time.perf_counter()
+        snapshot = self._load_snapshot()
+        summary = DriverSyncSummary()
+        seen: set[str] = set()
+        pending: list[Driver] = []
+
+        try:
+            for driver in self._read_registry(registry_path):
+                summary.read += 1
+                plate = driver.registration_number or ''
+                if plate in seen:
+                    summary.duplicates += 1
+                    continue
+                seen.add(plate)
+                known = snapshot.get(plate)
+                if known is not None and known[1] == driver_hash(driver.first_name, driver.last_name):
+                    summary.unchanged += 1
+                    continue
+
+                if known is not None:
+                    driver.id_ = known[0]
+                pending.append(driver)
+                if len(pending) >= self._chunk_size:
+                    self._write(pending, snapshot, summary)
+                    pending = []
+
+            if pending:
+                self._write(pending, snapshot, summary)
+        finally:
+            self._save_snapshot(snapshot)
+
+        summary.missing = len(snapshot.keys() - seen)
+        summary.elapsed_seconds = time.perf_counter() - start
+        logger.info(f'Synchronized driver registry: {summary}')
+        return summary
+
+    def rebuild_snapshot(self) -> dict[str, tuple[int, str]]:
+        """Recreates the snapshot from the drivers stored in the database.
+
+        Returns:
+            dict[str, tuple[int, str]]: Driver ID and name hash keyed by registration number.
+        """
+        snapshot = {
+            driver.registration_number: (driver.id_, driver_hash(driver.first_name, driver.last_name))
+            for driver in self._driver_repository.find(
+                QuerySpec().select('id_', 'first_name', 'last_name', 'registration_number')
+            )
+            if driver.id_ is not None and driver.registration_number is not None
+        }
+        self._save_snapshot(snapshot)
+        return snapshot
+
+    def _write(self, drivers: list[Driver], snapshot: dict[str, tuple[int, str]], summary: DriverSyncSummary) -> None:
+        """Upserts changed drivers and records their IDs and hashes in the snapshot.
+
+        `registration_number` is not a unique key, so the upsert alone cannot
+        tell a new driver from one the snapshot does not know yet, e.g. after
+        a failed run or a write by another process. Plates missing from the
+        snapshot are therefore looked up first and their drivers updated;
+        only plates absent from the database are inserted, which makes the
+        read-back of their IDs unambiguous.
+        """
+        new_drivers = [driver for driver in drivers if driver.id_ is None]
+        stored_ids = self._find_ids({driver.registration_number or '' for driver in new_drivers})
+        for driver in new_drivers:
+            driver.id_ = stored_ids.get(driver.registration_number or '')
+
+        self._driver_repository.upsert_many(drivers, self._chunk_size)
+        inserted_plates = {driver.registration_number or '' for driver in new_drivers if driver.id_ is None}
+        inserted_ids = self._find_ids(inserted_plates)
+        summary.inserted += len(inserted_plates)
+        summary.updated += len(drivers) - len(inserted_plates)
+        for driver in drivers:
+            plate = driver.registration_number or ''
+            driver_id = driver.id_ if driver.id_ is not None else inserted_ids.get(plate)
+            if driver_id is not None:
+                snapshot[plate] = (driver_id, driver_hash(driver.first_name, driver.last_name))
+
+    def _find_ids(self, plates: set[str]) -> dict[str, int]:
+        """Reads the IDs of stored drivers by plate, keeping the lowest ID of a plate stored more than once."""
+        if not plates:
+            return {}
+        ids: dict[str, int] = {}
+        for driver in self._driver_repository.find_by_registration_numbers(plates):
+            plate = driver.registration_number
+            if driver.id_ is None or plate is None:
+                continue
+            if plate in ids:
+                logger.warning(f'Registration number {plate} is stored for drivers {ids[plate]} and {driver.id_}')
+            ids[plate] = min(driver.id_, ids.get(plate, driver.id_))
+        return ids
+
+    @staticmethod
+    def _read_registry(registry_path: str | Path) -> Iterator[Driver]:
+        """Streams drivers from the registry file."""
+        with open(registry_path, newline='') as registry_file:
+            reader = csv.DictReader(registry_file)
+            missing_columns = set(REGISTRY_COLUMNS).difference(reader.fieldnames or ())
+            if missing_columns:
+                raise ValueError(f'Registry file lacks columns: {", ".join(sorted(missing_columns))}')
+            for row in reader:
+                yield Driver(
+                    first_name=row['first_name'],
+                    last_name=row['last_name'],
+                    registration_number=row['registration_number'],
+                )
+
+    def _load_snapshot(self) -> dict[str, tuple[int, str]]:
+        """Reads the snapshot file, rebuilding it from the database if it does not exist."""
+        if not self._snapshot_path.exists():
+            logger.info(f'Driver snapshot {self._snapshot_path} not found, rebuilding it from the database')
+            return self.rebuild_snapshot()
+
+        snapshot: dict[str, tuple[int, str]] = {}
+        with open(self._snapshot_path, newline='') as snapshot_file:
+            for plate, driver_id, content_hash in csv.reader(snapshot_file, delimiter='\t'):
+                snapshot[plate] = (int(driver_id), content_hash)
+        return snapshot
+
+    def _save_snapshot(self, snapshot: dict[str, tuple[int, str]]) -> None:
+        """Writes the snapshot to a temporary file and atomically replaces the old one."""
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self._snapshot_path.with_suffix(self._snapshot_path.suffix + '.tmp')
+        with open(temporary_path, 'w', newline='') as snapshot_file:
+            writer = csv.writer(snapshot_file, delimiter='\t')
+            writer.writerows((plate, driver_id, content_hash) for plate, (driver_id, content_hash) in snapshot.items())
+        os.replace(temporary_path, self._snapshot_path)
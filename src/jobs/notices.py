@@ -0,0 +1,141 @@
+from src.domain.repository import ViolationRepository
+from src.domain.typed_dict import FineNoticeDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from collections import deque
+from string import Template
+from datetime import date
+from pathlib import Path
+from src.config import logger
+import time
+import os
+
+NOTICE_TEMPLATE = '''FINE NOTICE No. $violation_id
+Date of violation: $violation_date
+Driver: $first_name $last_name
+Vehicle registration number: $registration_number
+Offense: $description
+Fine: $fine_amount PLN
+Penalty points: $penalty_points (total: $total_points)
+'''
+
+NOTICE_SEPARATOR = '\f\n'
+
+
+def render_notices(template: str, notices: list[FineNoticeDict]) -> str:
+    """Renders notices with a `string.Template`, separated by form feeds.
+
+    Args:
+        template (str): Template text with `$field` placeholders of `FineNoticeDict`.
+        notices (list[FineNoticeDict]): Notices to render.
+
+    Returns:
+        str: Rendered notices.
+    """
+    compiled = Template(template)
+    return NOTICE_SEPARATOR.join(compiled.substitute(notice) for notice in notices)
+
+
+def write_notice_file(template: str, notices: list[FineNoticeDict], path: Path) -> int:
+    """Renders a chunk of notices into one file, replacing it atomically.
+
+    Args:
+        template (str): Template text with `$field` placeholders of `FineNoticeDict`.
+        notices (list[FineNoticeDict]): Notices to render.
+        path (Path): Location of the output file.
+
+    Returns:
+        int: Number of written notices.
+    """
+    temporary_path = path.with_suffix(path.suffix + '.tmp')
+    temporary_path.write_text(render_notices(template, notices))
+    os.replace(temporary_path, path)
+    return len(notices)
+
+
+@dataclass
+class NoticeRunSummary:
+    """Summary of a fine notice generation run.
+
+    Attributes:
+        day (date): Date of the violations.
+        notices (int): Written notices.
+        files (int): Written output files.
+        elapsed_seconds (float): Wall-clock duration of the run.
+    """
+
+    day: date
+    notices: int = 0
+    files: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class FineNoticeGenerator:
+    """Generates the fine notices of a day's violations.
+
+    The day's notices, with each driver's running points total, are streamed
+    from the database in chunks by one query. Every chunk is rendered and
+    written to its own file by a pool of worker processes while the next
+    chunk is read; the number of chunks in flight is bounded, so memory does
+    not grow with the size of the day.
+    """
+
+    def __init__(
+        self,
+        violation_repository: ViolationRepository,
+        output_dir: str | Path,
+        template: str = NOTICE_TEMPLATE,
+        max_workers: int | None = None,
+        chunk_size: int = 1_000,
+    ):
+        """Initializes the generator.
+
+        Args:
+            violation_repository (ViolationRepository): Repository streaming the notices.
+            output_dir (str | Path): Directory receiving one subdirectory of notice files per day.
+            template (str): Template text with `$field` placeholders of `FineNoticeDict`.
+            max_workers (int | None): Number of rendering processes; defaults to the number of CPUs.
+            chunk_size (int): Number of notices per output file.
+        """
+        self._violation_repository = violation_repository
+        self._output_dir = Path(output_dir)
+        self._template = template
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+
+    def generate(self, day: date, include_archived: bool = False) -> NoticeRunSummary:
+        """Writes the notices of all violations of a day.
+
+        Files of a previous run for the same day are replaced.
+
+        Args:
+            day (date): Date of the violations.
+            include_archived (bool): Whether points of archived violations count towards the totals.
+
+        Returns:
+            NoticeRunSummary: Counts of written notices and files.
+        """
+        start = time.perf_counter()
+        summary = NoticeRunSummary(day)
+        day_dir = self._output_dir / day.isoformat()
+        day_dir.mkdir(parents=True, exist_ok=True)
+        for stale_file in day_dir.glob('notices-*.txt'):
+            stale_file.unlink()
+
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            pending: deque[Future[int]] = deque()
+
+            def submit(notices: list[FineNoticeDict]) -> None:
+                if len(pending) >= 2 * self._max_workers:
+                    summary.notices += pending.popleft().result()
+                summary.files += 1
+                path = day_dir / f'notices-{summary.files:05d}.txt'
+                pending.append(executor.submit(write_notice_file, self._template, notices, path))
+
+            self._violation_repository.stream_fine_notices(day, submit, self._chunk_size, include_archived)
+            while pending:
+                summary.notices += pending.popleft().result()
+
+        summary.elapsed_seconds = time.perf_counter() - start
+        logger.info(f'Generated fine notices: {summary}')
+        return summary
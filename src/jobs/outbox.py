@@ -0,0 +1,117 @@
+from src.domain.repository import OutboxEntry, ViolationOutboxRepository
+from src.database.connection import MySQLConnectionManager
+from dataclasses import dataclass
+from typing import Callable
+from src.config import logger
+import threading
+
+
+@dataclass
+class OutboxConsumerStats:
+    """Counters of a `ViolationOutboxConsumer`.
+
+    Attributes:
+        batches (int): Claimed non-empty batches.
+        delivered (int): Entries passed to the handler, including redeliveries.
+        acknowledged (int): Entries deleted after the handler succeeded.
+        redelivered (int): Delivered entries that had been delivered before.
+        failed_batches (int): Batches whose handler raised; their entries are delivered again.
+        last_lag_seconds (float): Longest time an entry of the last batch waited for delivery.
+    """
+
+    batches: int = 0
+    delivered: int = 0
+    acknowledged: int = 0
+    redelivered: int = 0
+    failed_batches: int = 0
+    last_lag_seconds: float = 0.0
+
+
+class ViolationOutboxConsumer:
+    """Drains one outbox subscription, passing batches of new violations to a handler.
+
+    Any number of consumers of the same subscription, in threads or separate
+    processes, can run side by side: each claims a disjoint batch with
+    `SELECT ... FOR UPDATE SKIP LOCKED`. A batch is acknowledged only after the
+    handler returns, so a crash or an error means the batch is delivered again
+    and handlers must tolerate duplicates.
+    """
+
+    def __init__(
+        self,
+        connection_manager: MySQLConnectionManager,
+        subscription: str,
+        handler: Callable[[list[OutboxEntry]], None],
+        batch_size: int = 500,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 1.0,
+    ):
+        """Initializes the consumer and registers its subscription.
+
+        Args:
+            connection_manager (MySQLConnectionManager): Provides pooled connections.
+            subscription (str): Name of the subscription to drain.
+            handler (Callable[[list[OutboxEntry]], None]): Processes a batch; raising leaves it unacknowledged.
+            batch_size (int): Maximum number of entries claimed at once.
+            lease_seconds (float): Time after which entries of a stalled consumer are delivered again;
+                must exceed the handler's running time.
+            poll_interval (float): Seconds to wait after finding the subscription empty.
+        """
+        self._outbox_repository = ViolationOutboxRepository(connection_manager)
+        self._subscription = subscription
+        self._handler = handler
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._poll_interval = poll_interval
+        self.stats = OutboxConsumerStats()
+        self._outbox_repository.subscribe(subscription)
+
+    def poll(self) -> int:
+        """Claims one batch, hands it to the handler and acknowledges it.
+
+        Returns:
+            int: Number of acknowledged entries; 0 if the subscription had none available.
+
+        Raises:
+            Exception: Whatever the handler raised, after the batch was released for redelivery.
+        """
+        entries = self._outbox_repository.claim(self._subscription, self._batch_size, self._lease_seconds)
+        if not entries:
+            return 0
+
+        stats = self.stats
+        stats.batches += 1
+        stats.delivered += len(entries)
+        stats.redelivered += sum(1 for entry in entries if entry.attempts > 1)
+        stats.last_lag_seconds = max(entry.lag_seconds for entry in entries)
+        entry_ids = [entry.entry_id for entry in entries]
+        try:
+            self._handler(entries)
+        except Exception:
+            stats.failed_batches += 1
+            self._outbox_repository.release(entry_ids)
+            raise
+
+        acknowledged = self._outbox_repository.acknowledge(entry_ids)
+        stats.acknowledged += acknowledged
+        return acknowledged
+
+    def run(self, stop: threading.Event) -> OutboxConsumerStats:
+        """Polls until stopped, waiting `poll_interval` whenever the subscription is drained.
+
+        A failed batch is logged and retried on a later poll.
+
+        Args:
+            stop (threading.Event): Ends the loop once set.
+
+        Returns:
+            OutboxConsumerStats: Counters of the consumer.
+        """
+        while not stop.is_set():
+            try:
+                if self.poll():
+                    continue
+            except Exception as e:
+                logger.error(f'Outbox subscription {self._subscription} failed to process a batch: {e}')
+            stop.wait(self._poll_interval)
+        return self.stats
@@ -0,0 +1,111 @@
+from src.domain.repository import ViolationRepository, CheckpointRepository
+from src.database.connection import MySQLConnectionManager
+from dataclasses import dataclass
+from datetime import date
+from src.config import logger
+import time
+
+
+@dataclass
+class RetentionSummary:
+    """Summary of a violation archival run.
+
+    Attributes:
+        cutoff (date): Violations dated before this day were archived.
+        archived (int): Violations moved to `violations_archive`.
+        chunks (int): Committed ID-range chunks.
+        last_id (int): Highest ID covered by the run; 0 if there was nothing to archive.
+        elapsed_seconds (float): Wall-clock duration of the run.
+    """
+
+    cutoff: date
+    archived: int = 0
+    chunks: int = 0
+    last_id: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class ViolationArchiver:
+    """Moves violations older than a cutoff from `violations` to `violations_archive`.
+
+    The IDs between the lowest and the highest archivable one are walked in
+    fixed ranges of the primary key. Every range is copied and deleted in one short READ COMMITTED
+    transaction together with the checkpoint, so the job holds no gap locks
+    that would block live ingestion and an interrupted run resumes after the
+    last committed range. A pause after every range that moved rows keeps the
+    load throttled; ranges left empty by earlier runs are skipped without one.
+    """
+
+    def __init__(
+        self,
+        connection_manager: MySQLConnectionManager,
+        chunk_size: int = 1_000,
+        pause_seconds: float = 0.1,
+        checkpoint_name: str = 'violation_retention',
+    ):
+        """Initializes the archiver.
+
+        Args:
+            connection_manager (MySQLConnectionManager): Provides pooled connections.
+            chunk_size (int): Width of the ID range moved per transaction.
+            pause_seconds (float): Seconds to wait between ranges.
+            checkpoint_name (str): Name of the checkpoint storing the last archived ID.
+        """
+        self._connection_manager = connection_manager
+        self._violation_repository = ViolationRepository(connection_manager)
+        self._checkpoint_repository = CheckpointRepository(connection_manager)
+        self._chunk_size = chunk_size
+        self._pause_seconds = pause_seconds
+        self._checkpoint_name = checkpoint_name
+
+    def run(self, cutoff: date) -> RetentionSummary:
+        """Archives all violations dated before a cutoff.
+
+        A completed run resets the checkpoint, so the next run with a later
+        cutoff starts again at the lowest ID still in `violations`.
+
+        Args:
+            cutoff (date): First date that stays in `violations`.
+
+        Returns:
+            RetentionSummary: Counts of archived violations and chunks.
+        """
+        start = time.perf_counter()
+        summary = RetentionSummary(cutoff)
+        id_range = self._violation_repository.archivable_id_range(cutoff)
+        checkpoint = self._checkpoint_repository.get(self._checkpoint_name) or 0
+        if checkpoint:
+            logger.info(f'Resuming violation archival after ID {checkpoint}')
+
+        first_id, last_id = id_range or (0, 0)
+        position = max(checkpoint, first_id - 1)
+        archived = 0
+        while position < last_id:
+            if archived:
+                time.sleep(self._pause_seconds)
+            chunk_end = min(position + self._chunk_size, last_id)
+            archived = self._archive_chunk(position + 1, chunk_end, cutoff)
+            summary.archived += archived
+            summary.chunks += 1
+            position = chunk_end
+
+        self._checkpoint_repository.save(self._checkpoint_name, 0)
+        summary.last_id = last_id
+        summary.elapsed_seconds = time.perf_counter() - start
+        logger.info(f'Archived violations: {summary}')
+        return summary
+
+    def _archive_chunk(self, first_id: int, last_id: int, cutoff: date) -> int:
+        """Moves one ID range and advances the checkpoint in the same transaction."""
+        conn = self._connection_manager.get_connection()
+        try:
+            conn.start_transaction(isolation_level='READ COMMITTED')
+            archived = self._violation_repository.archive_range(first_id, last_id, cutoff, conn=conn)
+            self._checkpoint_repository.save(self._checkpoint_name, last_id, conn=conn)
+            conn.commit()
+            return archived
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
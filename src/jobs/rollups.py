@@ -0,0 +1,136 @@
+from src.domain.repository import ViolationRollupRepository, CheckpointRepository
+from src.database.connection import MySQLConnectionManager
+from dataclasses import dataclass
+from src.config import logger
+import time
+
+
+@dataclass
+class RollupSummary:
+    """Summary of a violation rollup run.
+
+    Attributes:
+        rolled_up (int): Violations added to the rollups.
+        chunks (int): Committed ID-range chunks.
+        recounted_days (int): Days below the high-water mark counted again.
+        high_water_mark (int): Highest violation ID included in the rollups after the run.
+        elapsed_seconds (float): Wall-clock duration of the run.
+    """
+
+    rolled_up: int = 0
+    chunks: int = 0
+    recounted_days: int = 0
+    high_water_mark: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class ViolationRollupJob:
+    """Keeps the daily and monthly violation rollups up to date.
+
+    A checkpoint holds the high-water mark, the highest violation ID already
+    rolled up. Each run adds the violations above it in ID-range chunks; every
+    chunk updates the rollups and moves the mark in one transaction, so a
+    failed run neither loses nor repeats chunks.
+
+    Auto-increment IDs are allocated before the inserting transaction
+    commits, so when a run reads the highest ID, lower IDs may still be
+    uncommitted and are passed by the mark. Each run therefore first
+    recounts the days of the last `recount_window` IDs below the mark, which
+    counts such violations once they have committed. A violation whose
+    transaction stays open while more than `recount_window` later IDs are
+    rolled up is still missed; `backfill` recounts everything.
+    """
+
+    def __init__(
+        self,
+        connection_manager: MySQLConnectionManager,
+        chunk_size: int = 10_000,
+        checkpoint_name: str = 'violation_rollups',
+        recount_window: int = 10_000,
+    ):
+        """Initializes the job.
+
+        Args:
+            connection_manager (MySQLConnectionManager): Provides pooled connections.
+            chunk_size (int): Width of the ID range rolled up per transaction.
+            checkpoint_name (str): Name of the checkpoint storing the high-water mark.
+            recount_window (int): Number of IDs below the high-water mark whose days are
+                recounted on every run; must exceed the IDs allocated while the longest
+                violation-inserting transaction is open.
+        """
+        self._connection_manager = connection_manager
+        self._rollup_repository = ViolationRollupRepository(connection_manager)
+        self._checkpoint_repository = CheckpointRepository(connection_manager)
+        self._chunk_size = chunk_size
+        self._checkpoint_name = checkpoint_name
+        self._recount_window = recount_window
+
+    def run(self) -> RollupSummary:
+        """Rolls up all violations added since the previous run.
+
+        Returns:
+            RollupSummary: Counts of rolled up violations and chunks.
+        """
+        start = time.perf_counter()
+        summary = RollupSummary()
+        position = self._checkpoint_repository.get(self._checkpoint_name) or 0
+        if position > 0 and self._recount_window > 0:
+            summary.recounted_days = self._recount(max(position - self._recount_window + 1, 1), position)
+        last_id = self._rollup_repository.max_violation_id()
+
+        while position < last_id:
+            chunk_end = min(position + self._chunk_size, last_id)
+            summary.rolled_up += self._roll_up_chunk(position + 1, chunk_end)
+            summary.chunks += 1
+            position = chunk_end
+
+        summary.high_water_mark = position
+        summary.elapsed_seconds = time.perf_counter() - start
+        logger.info(f'Rolled up violations: {summary}')
+        return summary
+
+    def backfill(self) -> RollupSummary:
+        """Rebuilds the rollups from the whole violation history.
+
+        Returns:
+            RollupSummary: Counts of rolled up violations and chunks.
+        """
+        conn = self._connection_manager.get_connection()
+        try:
+            self._rollup_repository.clear(conn=conn)
+            self._checkpoint_repository.save(self._checkpoint_name, 0, conn=conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        logger.info('Cleared violation rollups, rebuilding them')
+        return self.run()
+
+    def _recount(self, first_id: int, last_id: int) -> int:
+        """Recounts the days of an ID range below the high-water mark in one transaction."""
+        conn = self._connection_manager.get_connection()
+        try:
+            recounted_days = self._rollup_repository.recount_days(first_id, last_id, conn=conn)
+            conn.commit()
+            return recounted_days
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _roll_up_chunk(self, first_id: int, last_id: int) -> int:
+        """Rolls up one ID range and moves the high-water mark in the same transaction."""
+        conn = self._connection_manager.get_connection()
+        try:
+            rolled_up = self._rollup_repository.roll_up_range(first_id, last_id, conn=conn)
+            self._checkpoint_repository.save(self._checkpoint_name, last_id, conn=conn)
+            conn.commit()
+            return rolled_up
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
@@ -1,10 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self
 from src.domain.typed_dict import (
     DriverOffensesDict,
     SummaryStatisticDict,
     TopDriverDict,
     PopularSpeedCameraDict,
+    CombinedStatisticsDict,
 )
 
 
@@ -59,7 +60,7 @@ class SummaryStatisticDto:
     """Data Transfer Object representing summary statistics of all violations.
 
     Attributes:
-        total_drivers (int | None): Total number of drivers involved in violations.
+        total_drivers (int | None): Number of distinct drivers involved in violations.
         total_offenses (int | None): Total number of offenses recorded.
         total_points (int | None): Total penalty points across all offenses.
         average_points (float | None): Average penalty points per offense.
@@ -153,4 +154,90 @@ class PopularSpeedCameraDto:
         return cls(
             location=row["location"],
             total_count=row["total_count"],
-        )
\ No newline at end of file
+        )
+
+@dataclass
+class IngestionSummaryDto:
+    """Data Transfer Object summarizing the ingestion of a batch of speed readings.
+
+    Attributes:
+        received (int): Number of readings in the batch.
+        duplicates (int): Repeated detections dropped before classification.
+        violations (int): Number of violations created and stored.
+        within_limit (int): Readings that did not exceed any overspeed band.
+        unknown_cameras (int): Readings from cameras that are not registered.
+        unknown_drivers (int): Violating readings and passages whose plate did not resolve to a driver.
+        section_passages (int): Passages through camera sections completed by the batch.
+        section_violations (int): Violations of section average speed limits, included in `violations`.
+    """
+
+    received: int = 0
+    duplicates: int = 0
+    violations: int = 0
+    within_limit: int = 0
+    unknown_cameras: int = 0
+    unknown_drivers: int = 0
+    section_passages: int = 0
+    section_violations: int = 0
+
+
+@dataclass
+class CombinedStatisticsDto:
+    """Data Transfer Object holding the reports computed by one scan of violations.
+
+    Attributes:
+        top_drivers (list[TopDriverDto]): Drivers ranked by penalty points.
+        speed_camera_statistic (list[PopularSpeedCameraDto]): Violation counts per speed camera.
+        summary (list[SummaryStatisticDto]): Summary statistics of all violations.
+    """
+
+    top_drivers: list[TopDriverDto] = field(default_factory=list)
+    speed_camera_statistic: list[PopularSpeedCameraDto] = field(default_factory=list)
+    summary: list[SummaryStatisticDto] = field(default_factory=list)
+
+    @classmethod
+    def from_row(cls, row: CombinedStatisticsDict) -> Self:
+        """Create a `CombinedStatisticsDto` from combined repository results.
+
+        Args:
+            row (CombinedStatisticsDict): Driver ranking, camera popularity and summary rows.
+
+        Returns:
+            Self: Instance of `CombinedStatisticsDto` populated with the converted rows.
+        """
+        return cls(
+            top_drivers=[TopDriverDto.from_row(driver) for driver in row["top_drivers"]],
+            speed_camera_statistic=[PopularSpeedCameraDto.from_row(camera) for camera in row["popular_speed_cameras"]],
+            summary=[SummaryStatisticDto.from_row(summary) for summary in row["summary"]],
+        )
+
+
+@dataclass
+class DashboardDto:
+    """Data Transfer Object combining all violation reports of the dashboard.
+
+    A report that failed is left as None and its error message is recorded,
+    so the remaining reports can still be shown.
+
+    Attributes:
+        offenses_by_driver (list[DriverOffensesDto] | None): Offenses of the requested driver.
+        top_drivers (list[TopDriverDto] | None): Drivers ranked by penalty points.
+        speed_camera_statistic (list[PopularSpeedCameraDto] | None): Violation counts per speed camera.
+        summary (list[SummaryStatisticDto] | None): Summary statistics of all violations.
+        timings (dict[str, float]): Duration of each report in seconds, keyed by report name.
+        errors (dict[str, str]): Error messages of failed reports, keyed by report name.
+        elapsed (float): Wall-clock duration of the whole dashboard in seconds.
+    """
+
+    offenses_by_driver: list[DriverOffensesDto] | None = None
+    top_drivers: list[TopDriverDto] | None = None
+    speed_camera_statistic: list[PopularSpeedCameraDto] | None = None
+    summary: list[SummaryStatisticDto] | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """Returns whether every report succeeded."""
+        return not self.errors
@@ -0,0 +1,153 @@
+from src.domain.repository import DriverRepository, SpeedCameraRepository, ViolationRepository
+from src.ingestion.classifier import OverspeedClassifier
+from src.service.dto import IngestionSummaryDto
+from src.ingestion.reading import SpeedReading
+from src.ingestion.dedup import DetectionDeduplicator
+from src.ingestion.spool import ViolationSpool
+from src.ingestion.section import SectionSpeedMatcher
+from src.analytics.sketches import ViolationSketches
+from src.database.workload import WorkloadClass, workload
+from src.config import logger
+import time
+
+
+class IngestionService:
+    """Service turning raw speed camera readings into stored violations.
+
+    A batch is processed with a fixed number of queries regardless of its size:
+    allowed speeds of cameras not seen before are loaded with one query, IDs
+    the database does not know are remembered for `unknown_camera_ttl` seconds
+    so a misconfigured camera does not cost a query per batch, plates
+    of violating readings are resolved through the in-memory plate index of the
+    driver repository, and the resulting violations are stored with one
+    multi-row insert, or appended to a local spool when one is configured.
+
+    Attributes:
+        driver_repository (DriverRepository): Repository used to resolve plates to drivers.
+        speed_camera_repository (SpeedCameraRepository): Repository providing allowed speeds.
+        violation_repository (ViolationRepository): Repository storing created violations.
+        classifier (OverspeedClassifier): Maps overspeed to offenses.
+        spool (ViolationSpool | None): Optional local spool written instead of the database.
+        deduplicator (DetectionDeduplicator | None): Optional filter of repeated detections.
+        sketches (ViolationSketches | None): Optional approximate analytics fed with every batch.
+        section_matcher (SectionSpeedMatcher | None): Optional average-speed enforcement over camera sections.
+    """
+
+    def __init__(
+        self,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        violation_repository: ViolationRepository,
+        classifier: OverspeedClassifier,
+        spool: ViolationSpool | None = None,
+        deduplicator: DetectionDeduplicator | None = None,
+        sketches: ViolationSketches | None = None,
+        section_matcher: SectionSpeedMatcher | None = None,
+        unknown_camera_ttl: float = 60.0,
+    ):
+        """Initialize the IngestionService with its dependencies.
+
+        Args:
+            driver_repository (DriverRepository): Repository for driver data.
+            speed_camera_repository (SpeedCameraRepository): Repository for speed camera data.
+            violation_repository (ViolationRepository): Repository for violation data.
+            classifier (OverspeedClassifier): Classifier with the configured overspeed bands.
+            spool (ViolationSpool | None): Local spool receiving violations instead of the
+                database; a `SpoolReplayer` then stores them in the background.
+            deduplicator (DetectionDeduplicator | None): Drops repeated detections before
+                classification.
+            sketches (ViolationSketches | None): Approximate analytics updated with the
+                readings and violations of every batch.
+            section_matcher (SectionSpeedMatcher | None): Matches readings of section cameras
+                into passages whose average speed is classified as well.
+            unknown_camera_ttl (float): Seconds before a camera ID missing from the database
+                is looked up again.
+        """
+        self.driver_repository = driver_repository
+        self.speed_camera_repository = speed_camera_repository
+        self.violation_repository = violation_repository
+        self.classifier = classifier
+        self.spool = spool
+        self.deduplicator = deduplicator
+        self.sketches = sketches
+        self.section_matcher = section_matcher
+        self._unknown_camera_ttl = unknown_camera_ttl
+        self._allowed_speeds: dict[int, int] = {}
+        self._unknown_cameras: dict[int, float] = {}
+
+    @workload(WorkloadClass.INGESTION)
+    def ingest(self, readings: list[SpeedReading]) -> IngestionSummaryDto:
+        """Classify a batch of readings and store the resulting violations.
+
+        Args:
+            readings (list[SpeedReading]): Raw readings reported by speed cameras.
+
+        Returns:
+            IngestionSummaryDto: Counts of created violations and discarded readings.
+        """
+        if not readings:
+            return IngestionSummaryDto()
+
+        received = len(readings)
+        if self.deduplicator is not None:
+            readings = self.deduplicator.filter(readings)
+
+        allowed_speeds = self._load_allowed_speeds({reading.speed_camera_id for reading in readings})
+        plates = self.classifier.violating_plates(readings, allowed_speeds)
+        passages = self.section_matcher.match(readings) if self.section_matcher is not None else []
+        if passages:
+            plates |= self.classifier.violating_passage_plates(passages)
+        driver_ids = self.driver_repository.resolve_plates(plates)
+
+        result = self.classifier.classify(readings, allowed_speeds, driver_ids)
+        section_result = self.classifier.classify_passages(passages, driver_ids)
+        result.violations.extend(section_result.violations)
+        result.unknown_drivers += section_result.unknown_drivers
+        if self.spool is not None:
+            self.spool.append(result.violations)
+        else:
+            self.violation_repository.insert_many(result.violations)
+        if self.sketches is not None:
+            self.sketches.observe(readings, result.violations)
+
+        if result.unknown_cameras or result.unknown_drivers:
+            logger.info(
+                f'Discarded {result.unknown_cameras} readings from unknown cameras '
+                f'and {result.unknown_drivers} violations of unknown drivers'
+            )
+        return IngestionSummaryDto(
+            received=received,
+            duplicates=received - len(readings),
+            violations=len(result.violations),
+            within_limit=result.within_limit,
+            unknown_cameras=result.unknown_cameras,
+            unknown_drivers=result.unknown_drivers,
+            section_passages=len(passages),
+            section_violations=len(section_result.violations),
+        )
+
+    def _load_allowed_speeds(self, speed_camera_ids: set[int]) -> dict[int, int]:
+        """Return allowed speeds of cameras, querying only those neither cached nor recently found unknown.
+
+        Args:
+            speed_camera_ids (set[int]): IDs of cameras present in the batch.
+
+        Returns:
+            dict[int, int]: Allowed speed keyed by camera ID, for all known cameras.
+        """
+        now = time.monotonic()
+        missing = {
+            camera_id for camera_id in speed_camera_ids - self._allowed_speeds.keys()
+            if self._unknown_cameras.get(camera_id, now) <= now
+        }
+        if missing:
+            for camera in self.speed_camera_repository.find_by_ids(missing):
+                if camera.id_ is not None and camera.allowed_speed is not None:
+                    self._allowed_speeds[camera.id_] = camera.allowed_speed
+            self._unknown_cameras = {
+                camera_id: expires for camera_id, expires in self._unknown_cameras.items() if expires > now
+            }
+            expires = now + self._unknown_camera_ttl
+            for camera_id in missing - self._allowed_speeds.keys():
+                self._unknown_cameras[camera_id] = expires
+        return self._allowed_speeds
@@ -9,8 +9,18 @@ from src.service.dto import (
     TopDriverDto,
     PopularSpeedCameraDto,
     SummaryStatisticDto,
+    DashboardDto,
+    CombinedStatisticsDto,
 )
+from src.database.workload import WorkloadClass, workload
+from src.database.deadline import with_time_budget
+from src.database.profiling import profiled
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from functools import partial
 from src.config import logger
+import contextvars
+import time
 
 
 class ViolationService:
@@ -26,6 +36,8 @@ class ViolationService:
         speed_camera_repository (SpeedCameraRepository): Repository for accessing speed camera data.
         offense_repository (OffenseRepository): Repository for accessing offense data.
         violation_repository (ViolationRepository): Repository for accessing violation data.
+        timeouts (dict[str, float]): Time budget in seconds per method name; methods
+            without an entry are unbounded.
     """
 
     def __init__(
@@ -33,7 +45,8 @@ class ViolationService:
         driver_repository: DriverRepository,
         speed_camera_repository: SpeedCameraRepository,
         offense_repository: OffenseRepository,
-        violation_repository: ViolationRepository
+        violation_repository: ViolationRepository,
+        timeouts: dict[str, float] | None = None,
     ):
         """Initialize the ViolationService with repository dependencies.
 
@@ -42,13 +55,23 @@ class ViolationService:
             speed_camera_repository (SpeedCameraRepository): Repository for speed camera data.
             offense_repository (OffenseRepository): Repository for offense data.
             violation_repository (ViolationRepository): Repository for violation data.
+            timeouts (dict[str, float] | None): Time budget in seconds per method name,
+                e.g. `{'get_generate_report': 5.0}`.
         """
         self.driver_repository = driver_repository
         self.speed_camera_repository = speed_camera_repository
         self.offense_repository = offense_repository
         self.violation_repository = violation_repository
+        self.timeouts = timeouts or {}
 
-    def get_offenses_by_driver(self, driver_number_registration: str) -> list[DriverOffensesDto]:
+    @workload(WorkloadClass.LOOKUP)
+    @with_time_budget
+    @profiled
+    def get_offenses_by_driver(
+        self,
+        driver_number_registration: str,
+        include_archived: bool = False,
+    ) -> list[DriverOffensesDto]:
         """Retrieve all offenses committed by a specific driver.
 
         Fetches violation and offense data for a given driver registration number
@@ -56,12 +79,15 @@ class ViolationService:
 
         Args:
             driver_number_registration (str): The registration number of the driver.
+            include_archived (bool): Whether to include violations moved to the archive.
 
         Returns:
             list[DriverOffensesDto]: A list of offenses associated with the driver.
         """
         result: list[DriverOffensesDto] = []
-        violation = self.violation_repository.find_violations_with_offense_by_driver(driver_number_registration)
+        violation = self.violation_repository.find_violations_with_offense_by_driver(
+            driver_number_registration, include_archived=include_archived
+        )
         if not violation:
             logger.info(f'Driver {driver_number_registration} has no violations')
         for v in violation:
@@ -69,16 +95,22 @@ class ViolationService:
 
         return result
 
-    def get_top_drivers_by_points(self) -> list[TopDriverDto]:
+    @workload(WorkloadClass.REPORT)
+    @with_time_budget
+    @profiled
+    def get_top_drivers_by_points(self, include_archived: bool = False) -> list[TopDriverDto]:
         """Retrieve a ranking of drivers based on accumulated penalty points.
 
         Returns a list of drivers sorted by their total penalty points in
         descending order.
 
+        Args:
+            include_archived (bool): Whether to include violations moved to the archive.
+
         Returns:
             list[TopDriverDto]: A list of top drivers with their total points.
         """
-        violation = self.violation_repository.get_driver_points()
+        violation = self.violation_repository.get_driver_points(include_archived=include_archived)
         result: list[TopDriverDto] = []
         if not violation:
             logger.info('No driver points')
@@ -86,16 +118,22 @@ class ViolationService:
             result.append(TopDriverDto.from_row(v))
         return result
 
-    def get_speed_camera_statistic(self) -> list[PopularSpeedCameraDto]:
+    @workload(WorkloadClass.REPORT)
+    @with_time_budget
+    @profiled
+    def get_speed_camera_statistic(self, include_archived: bool = False) -> list[PopularSpeedCameraDto]:
         """Retrieve statistics about the most frequently triggered speed cameras.
 
         Returns a list of speed cameras and the number of violations recorded by each.
 
+        Args:
+            include_archived (bool): Whether to include violations moved to the archive.
+
         Returns:
             list[PopularSpeedCameraDto]: A list of speed cameras with violation counts.
         """
         result = []
-        violation = self.violation_repository.get_most_popular_speed_camera()
+        violation = self.violation_repository.get_most_popular_speed_camera(include_archived=include_archived)
         if not violation:
             logger.info(f'Speed camera has no violations')
 
@@ -104,18 +142,102 @@ class ViolationService:
 
         return result
 
-    def get_generate_report(self) -> list[SummaryStatisticDto]:
+    @workload(WorkloadClass.REPORT)
+    @with_time_budget
+    @profiled
+    def get_generate_report(self, include_archived: bool = False) -> list[SummaryStatisticDto]:
         """Generate a summary report of all recorded traffic violations.
 
         Aggregates statistics such as total drivers, offenses, penalty points,
         and fine amounts.
 
+        Args:
+            include_archived (bool): Whether to include violations moved to the archive.
+
         Returns:
             list[SummaryStatisticDto]: A list containing summarized violation statistics.
         """
         result: list[SummaryStatisticDto] = []
-        violation = self.violation_repository.summary_statistics()
+        violation = self.violation_repository.summary_statistics(include_archived=include_archived)
 
         for v in violation:
             result.append(SummaryStatisticDto.from_row(v))
-        return result
\ No newline at end of file
+        return result
+
+    @workload(WorkloadClass.REPORT)
+    @with_time_budget
+    @profiled
+    def get_combined_statistics(self, include_archived: bool = False) -> CombinedStatisticsDto:
+        """Compute driver ranking, camera statistics and the summary report with one scan.
+
+        Returns the same data as `get_top_drivers_by_points`,
+        `get_speed_camera_statistic` and `get_generate_report` while reading
+        the violations only once.
+
+        Args:
+            include_archived (bool): Whether to include violations moved to the archive.
+
+        Returns:
+            CombinedStatisticsDto: All three reports.
+        """
+        return CombinedStatisticsDto.from_row(
+            self.violation_repository.combined_statistics(include_archived=include_archived)
+        )
+
+    @with_time_budget
+    @profiled
+    def get_dashboard(
+        self,
+        driver_number_registration: str,
+        max_workers: int = 4,
+        raise_on_error: bool = False,
+        include_archived: bool = False,
+    ) -> DashboardDto:
+        """Runs all violation reports concurrently and combines their results.
+
+        Each report runs in its own worker thread on its own pooled connection,
+        so the dashboard takes about as long as its slowest report. `max_workers`
+        should not exceed the size of the connection pool. An active deadline
+        also bounds every report; a report that runs out of time fails alone.
+
+        Args:
+            driver_number_registration (str): Registration number for the driver offenses report.
+            max_workers (int): Maximum number of reports running at the same time.
+            raise_on_error (bool): Whether a failed report fails the whole dashboard
+                instead of being recorded in `errors`.
+            include_archived (bool): Whether the reports include violations moved to the archive.
+
+        Returns:
+            DashboardDto: Results, per-report timings and errors of the reports.
+        """
+        reports: dict[str, Callable[[], list[Any]]] = {
+            'offenses_by_driver': partial(self.get_offenses_by_driver, driver_number_registration, include_archived),
+            'top_drivers': partial(self.get_top_drivers_by_points, include_archived),
+            'speed_camera_statistic': partial(self.get_speed_camera_statistic, include_archived),
+            'summary': partial(self.get_generate_report, include_archived),
+        }
+        dashboard = DashboardDto()
+
+        def run_timed(name: str, report: Callable[[], list[Any]]) -> list[Any]:
+            report_start = time.perf_counter()
+            try:
+                return report()
+            finally:
+                dashboard.timings[name] = time.perf_counter() - report_start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dashboard') as executor:
+            futures = {
+                name: executor.submit(contextvars.copy_context().run, run_timed, name, report)
+                for name, report in reports.items()
+            }
+            for name, future in futures.items():
+                try:
+                    setattr(dashboard, name, future.result())
+                except Exception as e:
+                    if raise_on_error:
+                        raise
+                    logger.error(f'Dashboard report {name} failed: {e}')
+                    dashboard.errors[name] = str(e)
+        dashboard.elapsed = time.perf_counter() - start
+        return dashboard
@@ -0,0 +1,75 @@
+from src.simulation.data_generator import SyntheticDataGenerator, SyntheticDataSeeder
+from src.database.connection import MySQLConnectionManager
+from src.simulation.load_test import WriteLoadTester
+from src.domain.query import QuerySpec
+from src.domain.repository import (
+    DriverRepository,
+    SpeedCameraRepository,
+    OffenseRepository,
+    ViolationRepository,
+)
+import argparse
+
+
+def main() -> None:
+    """Seeds synthetic data or runs the concurrent write load test.
+
+    Examples:
+        python -m src.simulation seed --drivers 100000 --violations 1000000
+        python -m src.simulation load --cameras 8 --violations-per-camera 10000
+    """
+    parser = argparse.ArgumentParser(prog='python -m src.simulation')
+    parser.add_argument('--seed', type=int, default=42)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = subparsers.add_parser('seed', help='insert generated drivers, cameras, offenses and violations')
+    seed_parser.add_argument('--drivers', type=int, default=1_000)
+    seed_parser.add_argument('--cameras', type=int, default=50)
+    seed_parser.add_argument('--violations', type=int, default=10_000)
+    seed_parser.add_argument('--batch-size', type=int, default=1_000)
+
+    load_parser = subparsers.add_parser('load', help='simulate cameras writing violations concurrently')
+    load_parser.add_argument('--cameras', type=int, default=4)
+    load_parser.add_argument('--violations-per-camera', type=int, default=1_000)
+    load_parser.add_argument('--batch-size', type=int, default=100)
+
+    args = parser.parse_args()
+    connection_manager = MySQLConnectionManager()
+    driver_repository = DriverRepository(connection_manager)
+    speed_camera_repository = SpeedCameraRepository(connection_manager)
+    offense_repository = OffenseRepository(connection_manager)
+    violation_repository = ViolationRepository(connection_manager)
+
+    if args.command == 'seed':
+        generator = SyntheticDataGenerator(
+            seed=args.seed,
+            driver_count=args.drivers,
+            speed_camera_count=args.cameras,
+            violation_count=args.violations,
+        )
+        seeder = SyntheticDataSeeder(
+            generator,
+            driver_repository,
+            speed_camera_repository,
+            offense_repository,
+            violation_repository,
+            batch_size=args.batch_size,
+        )
+        print(seeder.seed())
+        return
+
+    ids_only = QuerySpec().select('id_')
+    tester = WriteLoadTester(
+        connection_manager,
+        SyntheticDataGenerator(seed=args.seed),
+        driver_ids=[driver.id_ for driver in driver_repository.find(ids_only) if driver.id_ is not None],
+        speed_camera_ids=[camera.id_ for camera in speed_camera_repository.find(ids_only) if camera.id_ is not None],
+        offense_ids=[offense.id_ for offense in offense_repository.find(ids_only) if offense.id_ is not None],
+    )
+    result = tester.run(args.cameras, args.violations_per_camera, args.batch_size)
+    print(result)
+    print(f'{result.rows_per_second:.0f} rows/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+from src.domain.repository import (
+    CrudRepository,
+    DriverRepository,
+    SpeedCameraRepository,
+    OffenseRepository,
+    ViolationRepository,
+)
+from src.domain.entity import Driver, SpeedCamera, Offense, Violation, Entity
+from src.domain.query import QuerySpec
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate, batched
+from typing import Iterable, Iterator
+from src.config import logger
+import random
+import string
+import time
+
+FIRST_NAMES = [
+    'Adam', 'Agnieszka', 'Anna', 'Bartosz', 'Emily', 'Ewa', 'Jakub', 'Jane', 'John', 'Julia',
+    'Kamil', 'Katarzyna', 'Krzysztof', 'Magdalena', 'Marek', 'Maria', 'Michal', 'Monika',
+    'Pawel', 'Piotr', 'Robert', 'Tomasz', 'Zofia', 'Zuzanna',
+]
+
+LAST_NAMES = [
+    'Brown', 'Doe', 'Jones', 'Kaminski', 'Kowalczyk', 'Kowalski', 'Lewandowski', 'Mazur',
+    'Nowak', 'Smith', 'Szymanski', 'Wisniewski', 'Wojcik', 'Wozniak', 'Zielinski',
+]
+
+LOCATIONS = [
+    'Bialystok', 'Bydgoszcz', 'Gdansk', 'Gdynia', 'Katowice', 'Kielce', 'Krakow', 'Lodz',
+    'Lublin', 'Olsztyn', 'Opole', 'Poznan', 'Rzeszow', 'Szczecin', 'Torun', 'Warsaw', 'Wroclaw',
+]
+
+STREET_TYPES = ['Main St', 'Ring Rd', 'Bypass', 'Bridge', 'Exit', 'Avenue']
+
+ALLOWED_SPEEDS = [30, 40, 50, 50, 50, 60, 70, 90, 100, 120, 140]
+
+PLATE_PREFIXES = ['WA', 'WB', 'KR', 'KK', 'GD', 'GA', 'PO', 'PZ', 'DW', 'LU', 'EL', 'SK', 'ZS', 'BI']
+
+OFFENSE_CATALOGUE: list[tuple[str, int, int]] = [
+    ('Speeding up to 10 km/h', 1, 50),
+    ('Speeding over 10 km/h', 2, 100),
+    ('Speeding over 20 km/h', 3, 200),
+    ('Speeding over 30 km/h', 5, 300),
+    ('Speeding over 40 km/h', 9, 800),
+    ('Speeding over 50 km/h', 13, 1500),
+    ('Red light violation', 4, 200),
+    ('No seatbelt', 2, 50),
+]
+
+
+@dataclass
+class SeedSummary:
+    """Summary of a synthetic data seeding run.
+
+    Attributes:
+        drivers (int): Number of inserted drivers.
+        speed_cameras (int): Number of inserted speed cameras.
+        offenses (int): Number of inserted offenses.
+        violations (int): Number of inserted violations.
+        elapsed_seconds (float): Wall-clock duration of the run.
+    """
+
+    drivers: int = 0
+    speed_cameras: int = 0
+    offenses: int = 0
+    violations: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Returns the overall insert throughput of the run."""
+        total = self.drivers + self.speed_cameras + self.offenses + self.violations
+        return total / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class ZipfSampler:
+    """Draws indexes from a bounded Zipf distribution.
+
+    Index `0` is the most frequent one, index `size - 1` the least frequent.
+    Cumulative weights are computed once, so every draw is a binary search.
+    """
+
+    def __init__(self, size: int, exponent: float, rng: random.Random):
+        """Initializes the sampler.
+
+        Args:
+            size (int): Number of distinct indexes that may be drawn.
+            exponent (float): Skew of the distribution; `0` gives a uniform distribution.
+            rng (random.Random): Random number generator used for sampling.
+        """
+        if size <= 0:
+            raise ValueError('Zipf sampler size must be positive')
+        self._population = range(size)
+        self._cum_weights = list(accumulate(1.0 / (rank ** exponent) for rank in range(1, size + 1)))
+        self._rng = rng
+
+    def sample(self, k: int = 1) -> list[int]:
+        """Draws `k` indexes from the distribution.
+
+        Args:
+            k (int): Number of indexes to draw.
+
+        Returns:
+            list[int]: Drawn indexes.
+        """
+        return self._rng.choices(self._population, cum_weights=self._cum_weights, k=k)
+
+
+class SyntheticDataGenerator:
+    """Produces deterministic, realistic-looking data for every domain entity.
+
+    Each entity kind uses its own random stream derived from the seed, so the
+    output of one method does not depend on whether or in which order the other
+    methods were called. Violations are Zipf-skewed: a few cameras and a few
+    repeat offenders account for most of them.
+    """
+
+    def __init__(
+        self,
+        seed: int = 42,
+        driver_count: int = 1_000,
+        speed_camera_count: int = 50,
+        violation_count: int = 10_000,
+        camera_skew: float = 1.1,
+        driver_skew: float = 0.9,
+        start_date: date = date(2024, 1, 1),
+        days: int = 365,
+    ):
+        """Initializes the generator.
+
+        Args:
+            seed (int): Seed of all random streams.
+            driver_count (int): Number of drivers to generate.
+            speed_camera_count (int): Number of speed cameras to generate.
+            violation_count (int): Number of violations to generate.
+            camera_skew (float): Zipf exponent of violations per camera.
+            driver_skew (float): Zipf exponent of violations per driver.
+            start_date (date): First possible violation date.
+            days (int): Number of days violation dates are spread over.
+        """
+        self.seed = seed
+        self.driver_count = driver_count
+        self.speed_camera_count = speed_camera_count
+        self.violation_count = violation_count
+        self.camera_skew = camera_skew
+        self.driver_skew = driver_skew
+        self.start_date = start_date
+        self.days = days
+
+    def drivers(self) -> Iterator[Driver]:
+        """Generates drivers with unique registration numbers.
+
+        Yields:
+            Driver: Driver entity without an ID.
+        """
+        rng = self._rng('drivers')
+        plates: set[str] = set()
+        for _ in range(self.driver_count):
+            plate = self._registration_number(rng)
+            while plate in plates:
+                plate = self._registration_number(rng)
+            plates.add(plate)
+            yield Driver(
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=rng.choice(LAST_NAMES),
+                registration_number=plate,
+            )
+
+    def speed_cameras(self) -> Iterator[SpeedCamera]:
+        """Generates speed cameras.
+
+        Yields:
+            SpeedCamera: Speed camera entity without an ID.
+        """
+        rng = self._rng('speed_cameras')
+        for number in range(1, self.speed_camera_count + 1):
+            yield SpeedCamera(
+                location=f'{rng.choice(LOCATIONS)} {rng.choice(STREET_TYPES)} {number}',
+                allowed_speed=rng.choice(ALLOWED_SPEEDS),
+            )
+
+    @staticmethod
+    def offenses() -> Iterator[Offense]:
+        """Generates the offense catalogue.
+
+        Yields:
+            Offense: Offense entity without an ID.
+        """
+        for description, penalty_points, fine_amount in OFFENSE_CATALOGUE:
+            yield Offense(description=description, penalty_points=penalty_points, fine_amount=fine_amount)
+
+    def violations(
+        self,
+        driver_ids: list[int],
+        speed_camera_ids: list[int],
+        offense_ids: list[int],
+        count: int | None = None,
+        stream: str = 'violations',
+    ) -> Iterator[Violation]:
+        """Generates Zipf-skewed violations referencing existing rows.
+
+        Args:
+            driver_ids (list[int]): IDs of drivers that may commit violations.
+            speed_camera_ids (list[int]): IDs of cameras that may record violations.
+            offense_ids (list[int]): IDs of offenses that may be assigned.
+            count (int | None): Number of violations; defaults to `violation_count`.
+            stream (str): Name of the random stream, so independent writers can
+                generate different but reproducible data.
+
+        Yields:
+            Violation: Violation entity without an ID.
+        """
+        rng = self._rng(stream)
+        drivers = self._shuffled(driver_ids, rng)
+        cameras = self._shuffled(speed_camera_ids, rng)
+        driver_sampler = ZipfSampler(len(drivers), self.driver_skew, rng)
+        camera_sampler = ZipfSampler(len(cameras), self.camera_skew, rng)
+        offense_sampler = ZipfSampler(len(offense_ids), 1.0, rng)
+
+        remaining = self.violation_count if count is None else count
+        while remaining > 0:
+            chunk = min(remaining, 1_000)
+            for driver, camera, offense in zip(
+                driver_sampler.sample(chunk), camera_sampler.sample(chunk), offense_sampler.sample(chunk)
+            ):
+                yield Violation(
+                    violation_date=(self.start_date + timedelta(days=rng.randrange(self.days))).isoformat(),
+                    driver_id=drivers[driver],
+                    speed_camera_id=cameras[camera],
+                    offense_id=offense_ids[offense],
+                )
+            remaining -= chunk
+
+    def _rng(self, stream: str) -> random.Random:
+        """Creates the random stream for a given entity kind."""
+        return random.Random(f'{self.seed}:{stream}')
+
+    @staticmethod
+    def _shuffled(ids: list[int], rng: random.Random) -> list[int]:
+        """Returns a shuffled copy, so the busiest IDs are not always the lowest ones."""
+        if not ids:
+            raise ValueError('Cannot generate violations without referenced rows')
+        result = sorted(ids)
+        rng.shuffle(result)
+        return result
+
+    @staticmethod
+    def _registration_number(rng: random.Random) -> str:
+        """Generates a Polish-style registration number, e.g. `KR4F2A1`."""
+        suffix = ''.join(rng.choices(string.digits + string.ascii_uppercase, k=5))
+        return f'{rng.choice(PLATE_PREFIXES)}{suffix}'
+
+
+class SyntheticDataSeeder:
+    """Streams generated data into the database through `insert_many`.
+
+    Reference tables are inserted first; their IDs are read back so that the
+    generated violations reference existing rows.
+    """
+
+    def __init__(
+        self,
+        generator: SyntheticDataGenerator,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        batch_size: int = 1_000,
+    ):
+        """Initializes the seeder.
+
+        Args:
+            generator (SyntheticDataGenerator): Source of the generated entities.
+            driver_repository (DriverRepository): Repository for drivers.
+            speed_camera_repository (SpeedCameraRepository): Repository for speed cameras.
+            offense_repository (OffenseRepository): Repository for offenses.
+            violation_repository (ViolationRepository): Repository for violations.
+            batch_size (int): Number of rows per multi-row INSERT statement.
+        """
+        self._generator = generator
+        self._driver_repository = driver_repository
+        self._speed_camera_repository = speed_camera_repository
+        self._offense_repository = offense_repository
+        self._violation_repository = violation_repository
+        self._batch_size = batch_size
+
+    def seed(self) -> SeedSummary:
+        """Generates and inserts drivers, cameras, offenses and violations.
+
+        Returns:
+            SeedSummary: Inserted row counts and duration.
+        """
+        summary = SeedSummary()
+        start = time.perf_counter()
+
+        summary.drivers = self._insert_in_batches(self._driver_repository, self._generator.drivers())
+        summary.speed_cameras = self._insert_in_batches(
+            self._speed_camera_repository, self._generator.speed_cameras()
+        )
+        summary.offenses = self._insert_in_batches(self._offense_repository, self._generator.offenses())
+
+        violations = self._generator.violations(
+            driver_ids=self._ids(self._driver_repository),
+            speed_camera_ids=self._ids(self._speed_camera_repository),
+            offense_ids=self._ids(self._offense_repository),
+        )
+        summary.violations = self._insert_in_batches(self._violation_repository, violations)
+
+        summary.elapsed_seconds = time.perf_counter() - start
+        logger.info(f'Seeded synthetic data: {summary} ({summary.rows_per_second:.0f} rows/s)')
+        return summary
+
+    def _insert_in_batches[T: Entity](self, repository: CrudRepository[T], items: Iterable[T]) -> int:
+        """Inserts items in fixed-size batches and returns the number of inserted rows."""
+        inserted = 0
+        for batch in batched(items, self._batch_size):
+            repository.insert_many(list(batch))
+            inserted += len(batch)
+        return inserted
+
+    @staticmethod
+    def _ids(repository: CrudRepository) -> list[int]:
+        """Reads back the IDs of all rows of a repository's table."""
+        return [entity.id_ for entity in repository.find(QuerySpec().select('id_')) if entity.id_ is not None]
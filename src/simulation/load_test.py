@@ -0,0 +1,204 @@
+from src.database.connection import MySQLConnectionManager, ConnectionHolder, with_db_connection
+from src.simulation.data_generator import SyntheticDataGenerator
+from src.domain.repository import ViolationRepository
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+from statistics import quantiles
+from typing import Self
+from src.config import logger
+import time
+
+
+@dataclass
+class CameraWriteStats:
+    """Write statistics collected by a single simulated camera.
+
+    Attributes:
+        speed_camera_id (int): ID of the simulated camera.
+        rows (int): Number of successfully inserted violations.
+        failed_batches (int): Number of batches that raised an error.
+        batch_latencies (list[float]): Duration of each successful batch, in seconds.
+    """
+
+    speed_camera_id: int
+    rows: int = 0
+    failed_batches: int = 0
+    batch_latencies: list[float] = field(default_factory=list)
+
+
+@dataclass
+class LoadTestResult:
+    """Aggregated result of a concurrent write load test.
+
+    Attributes:
+        cameras (int): Number of concurrently writing cameras.
+        rows (int): Total number of inserted violations.
+        failed_batches (int): Total number of failed batches.
+        elapsed_seconds (float): Wall-clock duration of the test.
+        latency_p50_ms (float): Median batch latency in milliseconds.
+        latency_p95_ms (float): 95th percentile batch latency in milliseconds.
+        latency_p99_ms (float): 99th percentile batch latency in milliseconds.
+        latency_max_ms (float): Slowest batch in milliseconds.
+        row_lock_waits (int): InnoDB row lock waits that occurred during the test.
+        row_lock_time_ms (int): Total time spent waiting for InnoDB row locks.
+    """
+
+    cameras: int = 0
+    rows: int = 0
+    failed_batches: int = 0
+    elapsed_seconds: float = 0.0
+    latency_p50_ms: float = 0.0
+    latency_p95_ms: float = 0.0
+    latency_p99_ms: float = 0.0
+    latency_max_ms: float = 0.0
+    row_lock_waits: int = 0
+    row_lock_time_ms: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Returns the sustained ingestion throughput."""
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @classmethod
+    def from_stats(
+        cls,
+        stats: list[CameraWriteStats],
+        elapsed_seconds: float,
+        lock_status_before: dict[str, int],
+        lock_status_after: dict[str, int],
+    ) -> Self:
+        """Builds the aggregated result from per-camera statistics.
+
+        Args:
+            stats (list[CameraWriteStats]): Statistics of every simulated camera.
+            elapsed_seconds (float): Wall-clock duration of the test.
+            lock_status_before (dict[str, int]): InnoDB row lock counters before the test.
+            lock_status_after (dict[str, int]): InnoDB row lock counters after the test.
+
+        Returns:
+            LoadTestResult: Aggregated result.
+        """
+        latencies = sorted(latency * 1000 for s in stats for latency in s.batch_latencies)
+
+        def percentile(pct: int) -> float:
+            if len(latencies) < 2:
+                return latencies[0] if latencies else 0.0
+            return quantiles(latencies, n=100, method='inclusive')[pct - 1]
+
+        def lock_delta(name: str) -> int:
+            return lock_status_after.get(name, 0) - lock_status_before.get(name, 0)
+
+        return cls(
+            cameras=len(stats),
+            rows=sum(s.rows for s in stats),
+            failed_batches=sum(s.failed_batches for s in stats),
+            elapsed_seconds=elapsed_seconds,
+            latency_p50_ms=percentile(50),
+            latency_p95_ms=percentile(95),
+            latency_p99_ms=percentile(99),
+            latency_max_ms=latencies[-1] if latencies else 0.0,
+            row_lock_waits=lock_delta('Innodb_row_lock_waits'),
+            row_lock_time_ms=lock_delta('Innodb_row_lock_time'),
+        )
+
+
+class WriteLoadTester(ConnectionHolder):
+    """Simulates speed cameras writing violations concurrently.
+
+    Every camera runs in its own thread with its own repository instance and
+    inserts batches of generated violations through `insert_many`. InnoDB row
+    lock counters are sampled before and after the run to measure contention
+    on the `violations` table.
+    """
+
+    def __init__(
+        self,
+        connection_manager: MySQLConnectionManager,
+        generator: SyntheticDataGenerator,
+        driver_ids: list[int],
+        speed_camera_ids: list[int],
+        offense_ids: list[int],
+    ):
+        """Initializes the load tester.
+
+        Args:
+            connection_manager (MySQLConnectionManager): Provides pooled connections.
+            generator (SyntheticDataGenerator): Source of generated violations.
+            driver_ids (list[int]): IDs of existing drivers.
+            speed_camera_ids (list[int]): IDs of existing cameras; one writer per camera.
+            offense_ids (list[int]): IDs of existing offenses.
+        """
+        self._connection_manager = connection_manager
+        self._generator = generator
+        self._driver_ids = driver_ids
+        self._speed_camera_ids = speed_camera_ids
+        self._offense_ids = offense_ids
+
+    def run(self, cameras: int, violations_per_camera: int, batch_size: int = 100) -> LoadTestResult:
+        """Runs the load test.
+
+        Args:
+            cameras (int): Number of cameras writing concurrently.
+            violations_per_camera (int): Number of violations each camera writes.
+            batch_size (int): Number of violations per INSERT statement.
+
+        Returns:
+            LoadTestResult: Throughput, latency and lock contention figures.
+
+        Raises:
+            ValueError: If there are more cameras than pooled connections or known camera IDs.
+        """
+        if cameras > self._connection_manager.pool_size:
+            raise ValueError(
+                f'Cannot simulate {cameras} cameras with a pool of {self._connection_manager.pool_size} connections'
+            )
+        if cameras > len(self._speed_camera_ids):
+            raise ValueError(f'Cannot simulate {cameras} cameras with {len(self._speed_camera_ids)} camera IDs')
+
+        lock_status_before = self.row_lock_status()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=cameras, thread_name_prefix='camera') as executor:
+            stats = list(executor.map(
+                lambda camera_id: self._simulate_camera(camera_id, violations_per_camera, batch_size),
+                self._speed_camera_ids[:cameras],
+            ))
+        elapsed = time.perf_counter() - start
+        lock_status_after = self.row_lock_status()
+
+        result = LoadTestResult.from_stats(stats, elapsed, lock_status_before, lock_status_after)
+        logger.info(f'Load test finished: {result} ({result.rows_per_second:.0f} rows/s)')
+        return result
+
+    @with_db_connection
+    def row_lock_status(self) -> dict[str, int]:
+        """Reads the global InnoDB row lock counters.
+
+        Returns:
+            dict[str, int]: Counter values keyed by status variable name.
+        """
+        self._cursor.execute("SHOW GLOBAL STATUS LIKE 'Innodb_row_lock%'")
+        return {str(name): int(str(value)) for name, value in self._cursor.fetchall()}
+
+    def _simulate_camera(self, speed_camera_id: int, count: int, batch_size: int) -> CameraWriteStats:
+        """Writes generated violations of a single camera in batches."""
+        repository = ViolationRepository(self._connection_manager)
+        stats = CameraWriteStats(speed_camera_id=speed_camera_id)
+        violations = self._generator.violations(
+            driver_ids=self._driver_ids,
+            speed_camera_ids=[speed_camera_id],
+            offense_ids=self._offense_ids,
+            count=count,
+            stream=f'camera:{speed_camera_id}',
+        )
+        for batch in batched(violations, batch_size):
+            start = time.perf_counter()
+            try:
+                repository.insert_many(list(batch))
+            except Exception as e:
+                stats.failed_batches += 1
+                logger.error(f'Camera {speed_camera_id} failed to write a batch: {e}')
+                continue
+            stats.batch_latencies.append(time.perf_counter() - start)
+            stats.rows += len(batch)
+        return stats
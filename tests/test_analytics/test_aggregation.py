@@ -0,0 +1,45 @@
+from src.analytics.aggregation import ViolationAggregate, ViolationAggregation
+from decimal import Decimal
+
+
+def group(violations: int, points: int, fine: int) -> ViolationAggregate:
+    return ViolationAggregate(
+        violations=violations,
+        offense_violations=violations,
+        driver_violations=violations,
+        total_points=points,
+        total_fine_amount=Decimal(fine),
+        max_fine_amount=Decimal(fine),
+        min_fine_amount=Decimal(fine),
+    )
+
+
+def test_groups_roll_up_into_drivers_cameras_and_overall() -> None:
+    aggregation = ViolationAggregation()
+    aggregation.add(1, 10, group(2, 4, 100))
+    aggregation.add(1, 20, group(1, 5, 300))
+    aggregation.add(2, 10, group(1, 1, 50))
+    aggregation.add(None, 20, ViolationAggregate(violations=3))
+
+    assert aggregation.by_driver[1].total_points == 9
+    assert aggregation.by_camera[10].violations == 3
+    assert aggregation.by_camera[20].violations == 4
+    assert aggregation.overall.violations == 7
+    assert aggregation.overall.offense_violations == 4
+    assert aggregation.overall.average_points == 2.5
+    assert aggregation.overall.max_fine_amount == 300
+    assert aggregation.overall.min_fine_amount == 50
+
+
+def test_merging_partial_aggregations_equals_single_aggregation() -> None:
+    groups = [(1, 10, group(2, 4, 100)), (2, 10, group(1, 1, 50)), (1, 20, group(1, 5, 300))]
+    whole = ViolationAggregation()
+    first, second = ViolationAggregation(), ViolationAggregation()
+    for index, (driver_id, camera_id, aggregate) in enumerate(groups):
+        whole.add(driver_id, camera_id, aggregate)
+        (first if index % 2 else second).add(driver_id, camera_id, aggregate)
+
+    first.merge(second)
+
+    assert first == whole
+    assert ViolationAggregate().average_points is None
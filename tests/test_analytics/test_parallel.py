@@ -0,0 +1,29 @@
+from src.analytics.parallel import ParallelViolationAggregator, id_partitions
+from src.domain.repository import ViolationRepository
+from unittest.mock import MagicMock
+
+
+def test_id_partitions_cover_the_range_without_gaps() -> None:
+    partitions = id_partitions(5, 104, 8)
+
+    assert len(partitions) == 8
+    assert partitions[0][0] == 5
+    assert partitions[-1][1] == 104
+    assert all(previous[1] + 1 == current[0] for previous, current in zip(partitions, partitions[1:]))
+    assert max(last - first for first, last in partitions) - min(last - first for first, last in partitions) <= 1
+
+
+def test_id_partitions_never_create_empty_ranges() -> None:
+    assert id_partitions(1, 3, 16) == [(1, 1), (2, 2), (3, 3)]
+    assert id_partitions(7, 7, 4) == [(7, 7)]
+
+
+def test_aggregate_without_violations_starts_no_workers() -> None:
+    repository = MagicMock(spec=ViolationRepository)
+    repository.violation_id_bounds.return_value = None
+
+    aggregation, driver_names = ParallelViolationAggregator(repository, max_workers=2).aggregate()
+
+    assert aggregation.overall.violations == 0
+    assert driver_names == {}
+    repository.aggregate_id_range.assert_not_called()
@@ -0,0 +1,93 @@
+from src.analytics.sketches import HyperLogLog, CountMinSketch, TopK, TDigest, ViolationSketches
+from src.ingestion.reading import SpeedReading
+from src.domain.entity import Violation
+from datetime import datetime
+import pickle
+import random
+import pytest
+
+
+def test_hyperloglog_estimates_distinct_values() -> None:
+    sketch = HyperLogLog()
+    for value in range(50_000):
+        sketch.add(value)
+        sketch.add(value)
+
+    assert sketch.count() == pytest.approx(50_000, rel=0.03)
+
+
+def test_hyperloglog_is_exact_for_small_sets() -> None:
+    sketch = HyperLogLog()
+    for plate in ['ABC123', 'XYZ123', 'ABC123']:
+        sketch.add(plate)
+
+    assert sketch.count() == 2
+
+
+def test_hyperloglog_merge_counts_the_union() -> None:
+    first, second = HyperLogLog(), HyperLogLog()
+    for value in range(30_000):
+        first.add(value)
+    for value in range(20_000, 50_000):
+        second.add(value)
+
+    first.merge(second)
+
+    assert first.count() == pytest.approx(50_000, rel=0.03)
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLog(precision=10))
+
+
+def test_count_min_sketch_never_underestimates() -> None:
+    sketch = CountMinSketch(width=64, depth=4)
+    counts = {value: value % 7 + 1 for value in range(500)}
+    for value, count in counts.items():
+        sketch.add(value, count)
+
+    assert all(sketch.estimate(value) >= count for value, count in counts.items())
+    assert sketch.total == sum(counts.values())
+
+
+def test_top_k_finds_heavy_hitters_across_merged_workers() -> None:
+    rng = random.Random(7)
+    workers = [TopK[int](k=3), TopK[int](k=3)]
+    for worker in workers:
+        for _ in range(5_000):
+            worker.add(rng.choice([1, 2, 3]) if rng.random() < 0.6 else rng.randint(100, 10_000))
+
+    workers[0].merge(workers[1])
+
+    assert {camera for camera, _ in workers[0].top()} == {1, 2, 3}
+
+
+def test_t_digest_estimates_quantiles_and_merges() -> None:
+    rng = random.Random(7)
+    values = [rng.uniform(0, 1_000) for _ in range(40_000)]
+    first, second = TDigest(), TDigest()
+    for value in values[:20_000]:
+        first.add(value)
+    for value in values[20_000:]:
+        second.add(value)
+
+    first.merge(second)
+
+    values.sort()
+    for q in (0.01, 0.5, 0.9, 0.99):
+        assert first.quantile(q) == pytest.approx(values[int(q * len(values))], abs=10)
+    assert first.quantile(0) == values[0]
+    assert first.quantile(1) == values[-1]
+    assert TDigest().quantile(0.5) is None
+
+
+def test_violation_sketches_survive_pickling_and_merge() -> None:
+    timestamp = datetime(2025, 10, 14)
+    first, second = ViolationSketches(fine_amounts={1: 100.0}), ViolationSketches(fine_amounts={1: 100.0})
+    first.observe([SpeedReading(1, 'ABC123', 80, timestamp)], [Violation(driver_id=1, speed_camera_id=1, offense_id=1)])
+    second.observe([SpeedReading(2, 'XYZ123', 90, timestamp)], [Violation(driver_id=2, speed_camera_id=2, offense_id=1)])
+
+    first.merge(pickle.loads(pickle.dumps(second)))
+
+    summary = first.summary(quantiles=(0.5,))
+    assert (summary.distinct_drivers, summary.distinct_plates) == (2, 2)
+    assert summary.common_offenses == [(1, 2)]
+    assert summary.fine_quantiles == {0.5: 100.0}
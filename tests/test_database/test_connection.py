@@ -0,0 +1,240 @@
+from src.database.workload import (
+    AdmissionTimeoutError,
+    Workload,
+    WorkloadAdmission,
+    WorkloadClass,
+    WorkloadPolicy,
+    active_workload,
+    workload,
+)
+from src.database.connection import ConnectionHolder, MySQLConnectionManager, with_db_connection
+from src.database.profiling import Profiler, current_profiler, profiled
+from src.domain.entity import Violation
+from src.database.deadline import Deadline, QueryTimeoutError, remaining_time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, call
+from typing import Callable
+from datetime import date
+from pathlib import Path
+import threading
+import pytest
+import time
+
+
+class CursorRecorder(ConnectionHolder):
+    def __init__(self) -> None:
+        self._connection_manager = MagicMock()
+        self._connection_manager.get_connection.side_effect = self._new_connection
+        self._barrier = threading.Barrier(4)
+
+    @staticmethod
+    def _new_connection() -> MagicMock:
+        conn = MagicMock()
+        conn.cursor.side_effect = lambda: MagicMock()
+        return conn
+
+    @with_db_connection
+    def cursor_seen_after_barrier(self) -> tuple[object, object]:
+        own_cursor = self._cursor
+        self._barrier.wait()
+        return own_cursor, self._cursor
+
+    @with_db_connection
+    def outer(self) -> tuple[object, object]:
+        cursor = self._cursor
+        self.inner(conn=self._conn)
+        return cursor, self._cursor
+
+    @with_db_connection
+    def inner(self) -> None:
+        pass
+
+    @with_db_connection
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+def test_concurrent_calls_keep_their_own_cursor() -> None:
+    recorder = CursorRecorder()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: recorder.cursor_seen_after_barrier(), range(4)))
+
+    assert all(before is after for before, after in results)
+    assert len({id(before) for before, _ in results}) == 4
+
+
+def test_nested_call_restores_outer_cursor() -> None:
+    before, after = CursorRecorder().outer()
+    assert before is after
+
+
+def test_timeout_limits_statements_and_resets_limit() -> None:
+    recorder = CursorRecorder()
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    recorder.inner(conn=conn, timeout=2.5)
+
+    assert cursor.execute.call_args_list == [
+        call('set session max_execution_time = %s', (2500,)),
+        call('set session max_execution_time = 0'),
+    ]
+
+
+def test_spent_deadline_fails_before_checkout() -> None:
+    recorder = CursorRecorder()
+    with Deadline(0.0):
+        with pytest.raises(QueryTimeoutError):
+            recorder.inner()
+
+    recorder._connection_manager.get_connection.assert_not_called()
+
+
+def test_watchdog_cancels_overrunning_call() -> None:
+    recorder = CursorRecorder()
+    conn = MagicMock(connection_id=42)
+    recorder._connection_manager.get_connection.side_effect = None
+    recorder._connection_manager.get_connection.return_value = conn
+
+    with pytest.raises(QueryTimeoutError):
+        recorder.sleep(0.3, timeout=0.05)
+
+    recorder._connection_manager.kill_query.assert_called_once_with(42)
+    conn.rollback.assert_called_once()
+    conn.close.assert_called_once()
+
+
+def test_nested_deadlines_only_shorten_budget() -> None:
+    assert remaining_time() is None
+    with Deadline(10.0):
+        with Deadline(60.0):
+            budget = remaining_time(timeout=30.0)
+            assert budget is not None and budget <= 10.0
+
+
+def _wait_until(condition: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError('Condition not reached')
+
+
+def test_workload_declaration_is_innermost() -> None:
+    @workload(WorkloadClass.LOOKUP)
+    def lookup() -> WorkloadClass:
+        return active_workload.get()
+
+    with Workload(WorkloadClass.REPORT):
+        assert lookup() is WorkloadClass.LOOKUP
+        assert active_workload.get() is WorkloadClass.REPORT
+    assert active_workload.get() is WorkloadClass.DEFAULT
+
+
+def test_reports_cannot_take_connection_reserved_for_lookups() -> None:
+    admission = WorkloadAdmission({WorkloadClass.LOOKUP: WorkloadPolicy(reserved=1)}, acquire_timeout=0.05)
+    admission.configure(2)
+
+    admission.acquire(WorkloadClass.REPORT)
+    with pytest.raises(AdmissionTimeoutError):
+        admission.acquire(WorkloadClass.REPORT)
+    admission.acquire(WorkloadClass.LOOKUP)
+
+    stats = admission.stats()
+    assert stats[WorkloadClass.REPORT].in_use == 1
+    assert stats[WorkloadClass.REPORT].timed_out == 1
+    assert stats[WorkloadClass.LOOKUP].in_use == 1
+
+
+def test_class_limit_caps_connections() -> None:
+    admission = WorkloadAdmission({WorkloadClass.REPORT: WorkloadPolicy(limit=1)}, acquire_timeout=0.05)
+    admission.configure(3)
+
+    admission.acquire(WorkloadClass.REPORT)
+    with pytest.raises(AdmissionTimeoutError):
+        admission.acquire(WorkloadClass.REPORT)
+    admission.acquire(WorkloadClass.INGESTION)
+
+
+def test_freed_connection_goes_to_waiting_lookup_first() -> None:
+    admission = WorkloadAdmission({})
+    admission.configure(1)
+    admission.acquire(WorkloadClass.REPORT)
+    admitted: list[WorkloadClass] = []
+
+    def wait_for(workload_class: WorkloadClass) -> None:
+        admission.acquire(workload_class)
+        admitted.append(workload_class)
+
+    report = threading.Thread(target=wait_for, args=(WorkloadClass.REPORT,))
+    report.start()
+    _wait_until(lambda: admission.stats()[WorkloadClass.REPORT].waiting == 1)
+    lookup = threading.Thread(target=wait_for, args=(WorkloadClass.LOOKUP,))
+    lookup.start()
+    _wait_until(lambda: admission.stats()[WorkloadClass.LOOKUP].waiting == 1)
+
+    admission.release(WorkloadClass.REPORT)
+    lookup.join(timeout=2)
+    assert admitted == [WorkloadClass.LOOKUP]
+
+    admission.release(WorkloadClass.LOOKUP)
+    report.join(timeout=2)
+    assert admitted == [WorkloadClass.LOOKUP, WorkloadClass.REPORT]
+    stats = admission.stats()
+    assert stats[WorkloadClass.REPORT].queued == 1
+    assert stats[WorkloadClass.REPORT].max_wait_seconds > 0
+
+
+def test_manager_releases_slot_when_connection_is_closed() -> None:
+    admission = WorkloadAdmission({})
+    admission.configure(2)
+    manager = MySQLConnectionManager(admission)
+    pool = MagicMock()
+    manager._pool = pool
+
+    with Workload(WorkloadClass.INGESTION):
+        conn = manager.get_connection()
+    assert admission.stats()[WorkloadClass.INGESTION].in_use == 1
+
+    conn.commit()
+    conn.close()
+    conn.close()
+
+    pool.get_connection.return_value.commit.assert_called_once()
+    pool.get_connection.return_value.close.assert_called_once()
+    assert admission.stats()[WorkloadClass.INGESTION].in_use == 0
+    assert admission.stats()[WorkloadClass.INGESTION].admitted == 1
+
+
+class ProfiledReport:
+    def __init__(self) -> None:
+        self.recorder = CursorRecorder()
+
+    @profiled
+    def hydrate(self, count: int) -> list[Violation]:
+        self.recorder.inner()
+        return [
+            Violation.from_row({'id_': index, 'violation_date': date(2024, 1, 1), 'driver_id': 1,
+                                'speed_camera_id': 1, 'offense_id': 1})
+            for index in range(count)
+        ]
+
+
+def test_profiling_is_off_by_default() -> None:
+    assert current_profiler() is None
+
+
+def test_profiler_writes_stats_and_hydration_sites(tmp_path: Path) -> None:
+    report = ProfiledReport()
+    with Profiler(tmp_path, top=5):
+        violations = report.hydrate(2_000)
+        report.recorder.inner()
+
+    summary = (tmp_path / 'summary.txt').read_text()
+    assert len(violations) == 2_000
+    assert (tmp_path / 'ProfiledReport.hydrate.prof').exists()
+    assert (tmp_path / 'CursorRecorder.inner.prof').exists()
+    assert '== ProfiledReport.hydrate: 1 profiled calls' in summary
+    assert '== CursorRecorder.inner: 1 profiled calls' in summary
+    hydrate_section = summary.split('== ProfiledReport.hydrate')[1]
+    assert 'entity.py' in hydrate_section.split('-- entity and DTO hydration allocation sites')[1]
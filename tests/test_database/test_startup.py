@@ -0,0 +1,24 @@
+import subprocess
+import sys
+import os
+
+STARTUP_SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+from src.database.connection import MySQLConnectionManager
+from src.domain.repository import DriverRepository, ViolationRepository
+from src.service.violation_service import ViolationService
+DriverRepository(MySQLConnectionManager())
+print(time.perf_counter() - start, 'mysql.connector' in sys.modules, 'inflection' in sys.modules)
+'''
+
+
+def test_import_and_setup_defer_driver_and_pool() -> None:
+    root = os.path.join(os.path.dirname(__file__), '../..')
+    result = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT], cwd=root, capture_output=True, text=True, check=True)
+    elapsed, mysql_loaded, inflection_loaded = result.stdout.split()
+
+    assert float(elapsed) < 1.0
+    assert mysql_loaded == 'False'
+    assert inflection_loaded == 'True'
+
@@ -25,12 +25,10 @@ def connection_manager(mysql_container: MySqlContainer) -> MySQLConnectionManage
     os.environ['DB_PASSWORD'] = parsed_url.password
     os.environ['DB_NAME'] = parsed_url.path[1:]
     os.environ['DB_POOL_SIZE'] = '5'
-    return MySQLConnectionManager()
-
-@pytest.fixture(scope='module', autouse=True)
-def setup_database_schema(connection_manager: MySQLConnectionManager) -> None:
+    connection_manager = MySQLConnectionManager()
     execute_sql = SqlFileExecutor(connection_manager)
     execute_sql.execute_sql_file(os.path.join(os.path.dirname(__file__), '../../sql/schema.sql'))
+    return connection_manager
 
 @pytest.fixture
 def driver_repository(connection_manager: MySQLConnectionManager) -> DriverRepository:
@@ -0,0 +1,53 @@
+from src.domain.fuzzy_plate_index import FuzzyPlateIndex, canonical_plate, plate_distance
+import pytest
+
+
+@pytest.fixture
+def fuzzy_index() -> FuzzyPlateIndex:
+    index = FuzzyPlateIndex()
+    index.add(1, 'KR0B123')
+    index.add(2, 'WA12345')
+    index.add(3, 'WA12346')
+    return index
+
+
+def test_canonical_plate_merges_confusable_characters() -> None:
+    assert canonical_plate('KR0B123') == canonical_plate('KRO8I23')
+
+
+@pytest.mark.parametrize('first, second, expected', [
+    ('ABC123', 'ABC123', 0),
+    ('ABC123', 'A8C123', 0.25),
+    ('ABC123', 'ABC124', 1),
+    ('ABC123', 'ABC12', 1),
+    ('ABC123', 'BAC123', 1),
+])
+def test_plate_distance(first: str, second: str, expected: float) -> None:
+    assert plate_distance(first, second) == expected
+
+
+def test_match_finds_ocr_misreads(fuzzy_index: FuzzyPlateIndex) -> None:
+    matches = fuzzy_index.match('kro8i23', max_distance=1)
+
+    assert [match.driver_id for match in matches] == [1]
+    assert matches[0].distance == 0.75
+
+
+def test_match_orders_candidates_by_distance(fuzzy_index: FuzzyPlateIndex) -> None:
+    matches = fuzzy_index.match('WA1234S', max_distance=1)
+
+    assert [match.driver_id for match in matches] == [2, 3]
+    assert matches[0].distance < matches[1].distance
+
+
+def test_match_many_omits_plates_without_candidates(fuzzy_index: FuzzyPlateIndex) -> None:
+    result = fuzzy_index.match_many(['WA12345', 'XXXXXXX'], max_distance=1)
+
+    assert list(result) == ['WA12345']
+
+
+def test_removed_plates_are_not_matched(fuzzy_index: FuzzyPlateIndex) -> None:
+    fuzzy_index.remove(1)
+
+    assert fuzzy_index.match('KR0B123') == []
+    assert len(fuzzy_index) == 2
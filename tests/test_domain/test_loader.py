@@ -0,0 +1,61 @@
+from src.domain.repository import DriverRepository, SpeedCameraRepository, OffenseRepository
+from src.domain.entity import Driver, SpeedCamera, Offense, Violation
+from src.domain.loader import RelationLoaderScope, BatchLoader
+from unittest.mock import MagicMock
+import pytest
+
+
+@pytest.fixture
+def loader_scope(driver_1: Driver, driver_2: Driver, speed_camera_1: SpeedCamera, offense_1: Offense) -> RelationLoaderScope:
+    driver_repository = MagicMock(spec=DriverRepository)
+    speed_camera_repository = MagicMock(spec=SpeedCameraRepository)
+    offense_repository = MagicMock(spec=OffenseRepository)
+    driver_repository.find_by_ids.return_value = [driver_1, driver_2]
+    speed_camera_repository.find_by_ids.return_value = [speed_camera_1]
+    offense_repository.find_by_ids.return_value = [offense_1]
+    return RelationLoaderScope(driver_repository, speed_camera_repository, offense_repository)
+
+
+def test_relations_of_all_violations_are_loaded_with_one_query_per_table(loader_scope: RelationLoaderScope) -> None:
+    with loader_scope:
+        violations = [Violation(driver_id=i % 2 + 1, speed_camera_id=1, offense_id=1) for i in range(10)]
+
+        names = [violation.driver.first_name for violation in violations if violation.driver]
+        locations = {violation.speed_camera.location for violation in violations if violation.speed_camera}
+        fines = {violation.offense.fine_amount for violation in violations if violation.offense}
+
+    assert names == ['Jon', 'Bob'] * 5
+    assert locations == {'Warsaw'}
+    assert fines == {200}
+    assert loader_scope.drivers.queries == 1
+    assert loader_scope.speed_cameras.queries == 1
+    assert loader_scope.offenses.queries == 1
+
+
+def test_relations_cannot_be_loaded_outside_scope() -> None:
+    violation = Violation(driver_id=1)
+
+    with pytest.raises(RuntimeError):
+        _ = violation.driver
+
+
+def test_batch_loader_memoizes_missing_entities_and_splits_large_batches() -> None:
+    repository = MagicMock(spec=DriverRepository)
+    repository.find_by_ids.return_value = []
+    loader = BatchLoader[Driver](repository, max_batch_size=2)
+    for driver_id in range(1, 6):
+        loader.prime(driver_id)
+
+    assert loader.load(1) is None
+    assert loader.load(5) is None
+    assert loader.load(None) is None
+    assert loader.queries == 3
+
+
+def test_attached_relations_do_not_need_scope(driver_1: Driver, speed_camera_1: SpeedCamera) -> None:
+    violation = Violation(driver_id=1, speed_camera_id=1)
+    violation.attach_relations(driver_1, speed_camera_1, None)
+
+    assert violation.driver is driver_1
+    assert violation.speed_camera is speed_camera_1
+    assert violation.offense is None
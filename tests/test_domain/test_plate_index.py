@@ -0,0 +1,30 @@
+from src.domain.plate_index import PlateIndex, normalize_plate
+import pytest
+
+
+@pytest.mark.parametrize('plate, expected', [('kr 4f2-a1', 'KR4F2A1'), ('ABC123', 'ABC123'), (' wa-1 ', 'WA1')])
+def test_normalize_plate(plate: str, expected: str) -> None:
+    assert normalize_plate(plate) == expected
+
+
+def test_plate_index_resolves_normalized_plates() -> None:
+    index = PlateIndex()
+    index.add(1, 'ABC123')
+    index.add(2, 'XY Z123')
+
+    assert index.resolve('abc-123') == 1
+    assert index.resolve_many(['xyz123', 'ABC123', 'UNKNOWN']) == {'xyz123': 2, 'ABC123': 1}
+
+
+def test_plate_index_follows_updates_and_deletes() -> None:
+    index = PlateIndex()
+    index.add(1, 'ABC123')
+    index.add(2, 'XYZ123')
+
+    index.add(1, 'NEW123')
+    index.remove(2)
+
+    assert index.resolve('ABC123') is None
+    assert index.resolve('NEW123') == 1
+    assert index.resolve('XYZ123') is None
+    assert len(index) == 1
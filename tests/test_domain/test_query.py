@@ -0,0 +1,89 @@
+from src.domain.query import QuerySpec, Eq, In, Range, DateWindow, compile_select, compile_delete
+from src.domain.repository import ViolationRepository
+from src.domain.entity import Violation
+from unittest.mock import MagicMock
+import pytest
+
+
+def test_compile_select_with_all_clauses() -> None:
+    spec = (QuerySpec()
+            .where(Eq('driver_id', 1), In('offense_id', (2, 3)), Range('speed_camera_id', high=9),
+                   DateWindow('violation_date', '2024-01-01', '2024-02-01'))
+            .order('violation_date', descending=True)
+            .order('id_')
+            .take(10)
+            .select('id_', 'violation_date'))
+
+    sql, params = compile_select('violations', spec)
+
+    assert sql == ('select id_, violation_date from violations '
+                   'where driver_id = %s and offense_id in (%s, %s) and speed_camera_id <= %s '
+                   'and violation_date >= %s and violation_date < %s '
+                   'order by violation_date desc, id_ limit %s')
+    assert params == (1, 2, 3, 9, '2024-01-01', '2024-02-01', 10)
+
+
+def test_specs_of_same_shape_share_statement() -> None:
+    first, _ = compile_select('drivers', QuerySpec().where(In('id_', (1, 2))))
+    second, params = compile_select('drivers', QuerySpec().where(In('id_', (7, 8))))
+
+    assert first is second
+    assert params == (7, 8)
+    assert compile_select('drivers', QuerySpec().where(In('id_', ())))[0] == 'select * from drivers where 1 = 0'
+
+
+def test_find_projects_columns_and_rejects_unknown_ones() -> None:
+    repository = ViolationRepository(MagicMock())
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.description = [('id_',), ('driver_id',)]
+    cursor.fetchall.return_value = [(5, 1)]
+
+    result = repository.find(QuerySpec().where(Eq('driver_id', 1)).select('id_', 'driver_id'), conn=conn)
+
+    assert result == [Violation(id_=5, driver_id=1)]
+    cursor.execute.assert_called_once_with(
+        'select id_, driver_id from violations where driver_id = %s', (1,)
+    )
+    with pytest.raises(ValueError):
+        repository.find(QuerySpec().where(Eq('driver_id; drop table drivers', 1)), conn=conn)
+
+
+def test_compile_delete_requires_filters() -> None:
+    sql, params = compile_delete('violations', QuerySpec().where(Eq('speed_camera_id', 3)), limit=500)
+
+    assert sql == 'delete from violations where speed_camera_id = %s limit %s'
+    assert params == (3, 500)
+    with pytest.raises(ValueError):
+        compile_delete('violations', QuerySpec(), limit=500)
+
+
+def test_unbounded_range_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        QuerySpec().where(Range('id_'))
+    with pytest.raises(ValueError):
+        ViolationRepository(MagicMock()).delete_where(QuerySpec(), conn=MagicMock())
+
+
+def test_eq_none_compiles_to_is_null() -> None:
+    spec = QuerySpec().where(Eq('driver_id', None), Eq('offense_id', 2))
+
+    assert compile_select('violations', spec) == (
+        'select * from violations where driver_id is null and offense_id = %s', (2,)
+    )
+    assert compile_delete('violations', spec, limit=10) == (
+        'delete from violations where driver_id is null and offense_id = %s limit %s', (2, 10)
+    )
+
+
+def test_delete_where_runs_limited_chunks_until_exhausted() -> None:
+    repository = ViolationRepository(MagicMock())
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    deleted_per_chunk = iter([2, 2, 1])
+    cursor.execute.side_effect = lambda *args: setattr(cursor, 'rowcount', next(deleted_per_chunk))
+
+    deleted = repository.delete_where(QuerySpec().where(Eq('speed_camera_id', 3)), chunk_size=2, conn=conn)
+
+    assert deleted == 5
+    assert cursor.execute.call_count == 3
@@ -1,11 +1,18 @@
-from src.domain.repository import DriverRepository, SpeedCameraRepository, ViolationRepository, OffenseRepository
-from src.domain.typed_dict import PopularSpeedCameraDict, TopDriverDict, SummaryStatisticDict, DriverOffensesDict
-from src.domain.entity import Driver, SpeedCamera, Offense, Violation
+from src.domain.repository import DriverRepository, SpeedCameraRepository, ViolationRepository, OffenseRepository, CheckpointRepository, CameraSectionRepository, ViolationRollupRepository, ViolationOutboxRepository
+from src.domain.typed_dict import PopularSpeedCameraDict, TopDriverDict, SummaryStatisticDict, DriverOffensesDict, FineNoticeDict
+from src.domain.entity import Driver, SpeedCamera, Offense, Violation, CameraSection
+from src.domain.query import QuerySpec, Range, Eq
 from src.database.execute_sql_file import SqlFileExecutor
 from src.database.connection import MySQLConnectionManager
+from src.database.deadline import QueryTimeoutError
+from src.jobs.retention import ViolationArchiver
+from src.jobs.rollups import ViolationRollupJob
+from src.analytics.parallel import ParallelViolationAggregator
 from mysql.connector import Error
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+from datetime import date, datetime
 import pytest
+import time
 import os
 
 
@@ -215,3 +222,594 @@ def test_execute_query_return_data(
     )
     assert result[0]['location'] == 'Warsaw'
 
+
+def test_find_by_ids(
+        speed_camera_repository: SpeedCameraRepository,
+        speed_camera_1: SpeedCamera,
+        speed_camera_2: SpeedCamera,
+        clear_database
+) -> None:
+    speed_camera_repository.insert_many([speed_camera_1, speed_camera_2])
+
+    result = speed_camera_repository.find_by_ids([2, 3])
+    assert [camera.location for camera in result] == [speed_camera_2.location]
+    assert speed_camera_repository.find_by_ids([]) == []
+
+def test_find_by_registration_numbers(
+        driver_repository: DriverRepository,
+        driver_1: Driver,
+        driver_2: Driver,
+        clear_database
+) -> None:
+    driver_repository.insert_many([driver_1, driver_2])
+
+    result = driver_repository.find_by_registration_numbers({'XYZ123', 'UNKNOWN'})
+    assert [driver.first_name for driver in result] == [driver_2.first_name]
+
+def test_checkpoint_save_and_get(connection_manager: MySQLConnectionManager, clear_database) -> None:
+    checkpoint_repository = CheckpointRepository(connection_manager)
+    assert checkpoint_repository.get('test') is None
+
+    checkpoint_repository.save('test', 10)
+    checkpoint_repository.save('test', 42)
+    assert checkpoint_repository.get('test') == 42
+
+def test_plate_index_is_warmed_and_kept_current(
+        driver_repository: DriverRepository,
+        driver_1: Driver,
+        driver_2: Driver,
+        clear_database
+) -> None:
+    driver_id = driver_repository.insert(driver_1)
+    assert driver_repository.resolve_plates(['abc123', 'XYZ123']) == {'abc123': driver_id}
+
+    driver_repository.insert_many([driver_2])
+    assert driver_repository.resolve_plate('XYZ123') is not None
+
+    driver_repository.delete(driver_id)
+    assert driver_repository.resolve_plate('ABC123') is None
+
+def test_resolve_plates_fuzzy_mode(connection_manager: MySQLConnectionManager, driver_1: Driver, clear_database) -> None:
+    driver_repository = DriverRepository(connection_manager, fuzzy_plates=True)
+    driver_id = driver_repository.insert(driver_1)
+
+    assert driver_repository.resolve_plates(['A8C1Z3']) == {}
+    assert driver_repository.resolve_plates(['A8C1Z3'], fuzzy=True) == {'A8C1Z3': driver_id}
+    assert driver_repository.match_plates(['ABC12'])['ABC12'][0].driver_id == driver_id
+
+def test_find_with_relations_shares_related_instances(
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_id = driver_repository.insert(driver_1)
+    speed_camera_id = speed_camera_repository.insert(speed_camera_1)
+    offense_id = offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=driver_id, speed_camera_id=speed_camera_id, offense_id=offense_id, violation_date=day)
+        for day in ['2024-01-01', '2024-01-02', '2024-01-03']
+    ])
+
+    result = violation_repository.find_with_relations({'registration_number': driver_1.registration_number,
+                                                       'date_from': '2024-01-02'})
+    assert len(result) == 2
+    assert result[0].driver is result[1].driver
+    assert result[0].driver.first_name == driver_1.first_name
+    assert result[0].offense.fine_amount == offense_1.fine_amount
+    assert violation_repository.find_with_relations({'driver_id': driver_id + 1}) == []
+
+def test_find_with_spec(
+        speed_camera_repository: SpeedCameraRepository,
+        speed_camera_1: SpeedCamera,
+        speed_camera_2: SpeedCamera,
+        clear_database
+) -> None:
+    speed_camera_repository.insert_many([speed_camera_1, speed_camera_2])
+
+    result = speed_camera_repository.find(
+        QuerySpec().where(Range('allowed_speed', low=0)).order('id_', descending=True).take(1).select('location')
+    )
+    assert [(camera.id_, camera.location) for camera in result] == [(None, speed_camera_2.location)]
+
+def test_combined_statistics_match_separate_reports(
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        driver_2: Driver,
+        speed_camera_1: SpeedCamera,
+        speed_camera_2: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert_many([driver_1, driver_2])
+    speed_camera_repository.insert_many([speed_camera_1, speed_camera_2])
+    offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-01'),
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-02'),
+        Violation(driver_id=2, speed_camera_id=1, offense_id=1, violation_date='2024-01-03'),
+    ])
+
+    combined = violation_repository.combined_statistics(chunk_size=1)
+
+    assert [(d['first_name'], d['total_points']) for d in combined['top_drivers']] == \
+           [(d['first_name'], d['total_points']) for d in violation_repository.get_driver_points()]
+    assert combined['popular_speed_cameras'] == violation_repository.get_most_popular_speed_camera()
+    summary, = violation_repository.summary_statistics()
+    assert {key: float(str(value)) for key, value in combined['summary'][0].items()} == \
+           {key: float(str(value)) for key, value in summary.items()}
+
+def test_query_exceeding_timeout_is_cancelled(
+        connection_manager: MySQLConnectionManager,
+        violation_repository: ViolationRepository
+) -> None:
+    with pytest.raises(QueryTimeoutError):
+        violation_repository._execute_query(
+            'select count(*) from information_schema.columns a, information_schema.columns b, '
+            'information_schema.columns c',
+            timeout=0.5,
+        )
+
+    assert violation_repository._execute_query('select 1 as one') == [{'one': 1}]
+
+def test_upsert_many_inserts_and_updates(
+        driver_repository: DriverRepository,
+        driver_1: Driver,
+        driver_2: Driver,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+
+    affected = driver_repository.upsert_many([
+        Driver(id_=1, first_name='Jonathan', last_name='Smith', registration_number='ABC123'),
+        Driver(first_name=driver_2.first_name, last_name=driver_2.last_name,
+               registration_number=driver_2.registration_number),
+    ], chunk_size=1)
+
+    assert affected == 3
+    assert [driver.first_name for driver in driver_repository.find_all()] == ['Jonathan', driver_2.first_name]
+
+def test_update_many_delete_many_and_delete_where(
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        speed_camera_2: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+    speed_camera_repository.insert_many([speed_camera_1, speed_camera_2])
+    offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date=f'2024-01-{day:02d}')
+        for day in range(1, 11)
+    ])
+
+    assert violation_repository.update_many(range(1, 8), {'speed_camera_id': 2}, chunk_size=3) == 7
+    assert violation_repository.delete_many([9, 10, 11]) == 2
+    assert violation_repository.delete_where(QuerySpec().where(Eq('speed_camera_id', 2)), chunk_size=3) == 7
+    assert [violation.id_ for violation in violation_repository.find_all()] == [8]
+    with pytest.raises(ValueError):
+        violation_repository.update_many([8], {'unknown': 1})
+
+def test_archiver_moves_old_violations_and_reports_can_include_them(
+        connection_manager: MySQLConnectionManager,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+    speed_camera_repository.insert(speed_camera_1)
+    offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date=f'2024-0{month}-01')
+        for month in range(1, 7)
+    ])
+
+    summary = ViolationArchiver(connection_manager, chunk_size=2, pause_seconds=0).run(date(2024, 4, 1))
+
+    assert (summary.archived, summary.chunks, summary.last_id) == (3, 2, 3)
+    assert [violation.id_ for violation in violation_repository.find_all()] == [4, 5, 6]
+    assert violation_repository.summary_statistics()[0]['total_offenses'] == 3
+    assert violation_repository.summary_statistics(include_archived=True)[0]['total_offenses'] == 6
+    assert CheckpointRepository(connection_manager).get('violation_retention') == 0
+
+def test_parallel_aggregation_matches_combined_statistics(
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        driver_2: Driver,
+        speed_camera_1: SpeedCamera,
+        speed_camera_2: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert_many([driver_1, driver_2])
+    speed_camera_repository.insert_many([speed_camera_1, speed_camera_2])
+    offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=day % 2 + 1, speed_camera_id=day % 3 // 2 + 1, offense_id=1,
+                  violation_date=f'2024-01-{day:02d}')
+        for day in range(1, 29)
+    ])
+
+    parallel = ParallelViolationAggregator(violation_repository, max_workers=2, chunk_size=2)
+
+    assert parallel.combined_statistics() == violation_repository.combined_statistics()
+
+def test_stream_fine_notices_computes_running_points(
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        driver_2: Driver,
+        speed_camera_1: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert_many([driver_1, driver_2])
+    speed_camera_repository.insert(speed_camera_1)
+    offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-01'),
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-02'),
+        Violation(driver_id=2, speed_camera_id=1, offense_id=1, violation_date='2024-01-02'),
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-02'),
+    ])
+    chunks: list[list[FineNoticeDict]] = []
+
+    streamed = violation_repository.stream_fine_notices(date(2024, 1, 2), chunks.append, chunk_size=2)
+
+    points = offense_1.penalty_points or 0
+    assert streamed == 3
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert [(n['violation_id'], n['total_points']) for chunk in chunks for n in chunk] == \
+           [(2, 2 * points), (4, 3 * points), (3, points)]
+
+def test_camera_sections_are_stored(
+        connection_manager: MySQLConnectionManager,
+        speed_camera_repository: SpeedCameraRepository,
+        speed_camera_1: SpeedCamera,
+        speed_camera_2: SpeedCamera,
+        clear_database
+) -> None:
+    speed_camera_repository.insert_many([speed_camera_1, speed_camera_2])
+    section_repository = CameraSectionRepository(connection_manager)
+
+    section_repository.insert(CameraSection(entry_camera_id=1, exit_camera_id=2, distance_m=4_200, speed_limit=90,
+                                            max_travel_seconds=900))
+
+    section, = section_repository.find_all()
+    assert (section.entry_camera_id, section.exit_camera_id, section.distance_m) == (1, 2, 4_200)
+
+def test_rollup_job_counts_violations_per_day_and_month(
+        connection_manager: MySQLConnectionManager,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        speed_camera_2: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+    speed_camera_repository.insert_many([speed_camera_1, speed_camera_2])
+    offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-05'),
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-05'),
+        Violation(driver_id=1, speed_camera_id=2, offense_id=1, violation_date='2024-02-10'),
+    ])
+    job = ViolationRollupJob(connection_manager, chunk_size=2)
+    job.run()
+    violation_repository.insert(Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-20'))
+
+    summary = job.run()
+
+    rollups = ViolationRollupRepository(connection_manager)
+    assert (summary.rolled_up, summary.high_water_mark) == (1, 4)
+    assert rollups.violation_counts(date(2024, 1, 1), date(2024, 3, 1)) == [
+        {'period_start': date(2024, 1, 1), 'speed_camera_id': 1, 'violation_count': 3},
+        {'period_start': date(2024, 2, 1), 'speed_camera_id': 2, 'violation_count': 1},
+    ]
+    assert [row['violation_count'] for row in rollups.violation_counts(date(2024, 1, 1), date(2024, 1, 31))] == [2, 1]
+    assert job.backfill().rolled_up == 4
+
+
+def test_rollup_job_counts_violations_committed_below_high_water_mark(
+        connection_manager: MySQLConnectionManager,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+    speed_camera_repository.insert(speed_camera_1)
+    offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date=f'2024-01-0{day}')
+        for day in range(5, 8)
+    ])
+    violation_repository.delete(2)
+    job = ViolationRollupJob(connection_manager, recount_window=5)
+    job.run()
+    with connection_manager.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                'insert into violations (id_, violation_date, driver_id, speed_camera_id, offense_id) '
+                "values (2, '2024-01-06', 1, 1, 1)"
+            )
+        conn.commit()
+
+    summary = job.run()
+
+    rollups = ViolationRollupRepository(connection_manager)
+    assert (summary.rolled_up, summary.recounted_days, summary.high_water_mark) == (0, 3, 3)
+    assert rollups.violation_counts(date(2024, 1, 1), date(2024, 2, 1)) == [
+        {'period_start': date(2024, 1, 1), 'speed_camera_id': 1, 'violation_count': 3},
+    ]
+    assert [row['violation_count'] for row in rollups.violation_counts(date(2024, 1, 5), date(2024, 1, 8))] == [1, 1, 1]
+
+
+def test_roll_up_range_adds_to_existing_rollups(
+        connection_manager: MySQLConnectionManager,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+    speed_camera_repository.insert(speed_camera_1)
+    offense_repository.insert(offense_1)
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-03-07')
+        for _ in range(3)
+    ])
+    rollups = ViolationRollupRepository(connection_manager)
+
+    assert rollups.roll_up_range(1, 2) == 2
+    assert rollups.roll_up_range(2, 3) == 2
+
+    for granularity, period_start in (('day', date(2024, 3, 7)), ('month', date(2024, 3, 1))):
+        assert rollups.violation_counts(date(2024, 3, 1), date(2024, 4, 1), granularity=granularity) == [
+            {'period_start': period_start, 'speed_camera_id': 1, 'violation_count': 4},
+        ]
+
+
+def test_outbox_delivers_new_violations_to_every_subscription_once(
+        connection_manager: MySQLConnectionManager,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+    speed_camera_repository.insert(speed_camera_1)
+    offense_repository.insert(offense_1)
+    outbox = ViolationOutboxRepository(connection_manager)
+    outbox.subscribe('notices')
+    outbox.subscribe('points_registry')
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date=f'2024-01-0{day}')
+        for day in range(1, 4)
+    ])
+    violation_repository.insert(Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-04'))
+
+    with connection_manager.get_connection() as conn:
+        first = outbox.claim('notices', batch_size=2, conn=conn)
+        second = outbox.claim('notices', batch_size=2)
+        conn.commit()
+
+    assert [entry.violation.id_ for entry in first] == [1, 2]
+    assert [entry.violation.id_ for entry in second] == [3, 4]
+    assert first[0].violation.violation_date == '2024-01-01'
+    assert outbox.claim('notices') == []
+    assert outbox.acknowledge([entry.entry_id for entry in first + second]) == 4
+    assert [(lag['subscription'], lag['pending'], lag['in_flight']) for lag in outbox.lag()] == [
+        ('notices', 0, 0),
+        ('points_registry', 4, 0),
+    ]
+
+    claimed = outbox.claim('points_registry', batch_size=1)
+    outbox.release([entry.entry_id for entry in claimed])
+    assert [(entry.violation.id_, entry.attempts) for entry in outbox.claim('points_registry', batch_size=1)] == [(1, 2)]
+
+
+def test_outbox_queues_violations_inserted_with_auto_increment_step(
+        connection_manager: MySQLConnectionManager,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+    speed_camera_repository.insert(speed_camera_1)
+    offense_repository.insert(offense_1)
+    outbox = ViolationOutboxRepository(connection_manager)
+    outbox.subscribe('notices')
+
+    with connection_manager.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute('set session auto_increment_increment = 2')
+        try:
+            violation_repository.insert_many([
+                Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date=f'2024-01-0{day}')
+                for day in range(1, 4)
+            ], conn=conn)
+            conn.commit()
+        finally:
+            with conn.cursor() as cursor:
+                cursor.execute('set session auto_increment_increment = 1')
+
+    stored_ids = [violation.id_ for violation in violation_repository.find_all()]
+    assert [entry.violation.id_ for entry in outbox.claim('notices')] == stored_ids
+    assert len(stored_ids) == 3
+
+
+def test_first_query_opens_single_connection(connection_manager: MySQLConnectionManager) -> None:
+    start = time.perf_counter()
+    lazy_manager = MySQLConnectionManager()
+    DriverRepository(lazy_manager).find_all()
+
+    assert time.perf_counter() - start < 5.0
+    assert lazy_manager.opened_connections == 1
+    assert lazy_manager.pool_size == 5
+
+
+def test_insert_many_queues_ids_spaced_by_auto_increment_increment() -> None:
+    repository = ViolationRepository(MagicMock())
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.lastrowid = 11
+    cursor.fetchone.return_value = (2,)
+
+    repository.insert_many([Violation(driver_id=1), Violation(driver_id=2), Violation(driver_id=3)], conn=conn)
+
+    sql, params = cursor.execute.call_args.args
+    assert sql.startswith('insert into violation_outbox')
+    assert sql.endswith('on v.id_ in (%s, %s, %s)')
+    assert params == (11, 13, 15)
+
+
+def warmed_driver_repository(driver: Driver) -> tuple[DriverRepository, MagicMock]:
+    connection_manager = MagicMock()
+    repository = DriverRepository(connection_manager, fuzzy_plates=True)
+    repository.plate_index.warmed = True
+    repository._index_plate(1, driver.registration_number or '')
+    conn = connection_manager.get_connection.return_value
+    conn.cursor.return_value.__enter__.return_value.lastrowid = 2
+    return repository, conn
+
+
+def test_plate_index_is_unchanged_when_commit_fails(driver_1: Driver, driver_2: Driver) -> None:
+    repository, conn = warmed_driver_repository(driver_1)
+    conn.commit.side_effect = Error('Lost connection to MySQL server during query')
+
+    with pytest.raises(Error):
+        repository.insert(driver_2)
+    with pytest.raises(Error):
+        repository.delete(1)
+
+    conn.rollback.assert_called()
+    assert repository.resolve_plates(['ABC123', 'XYZ123']) == {'ABC123': 1}
+
+
+def test_plate_index_is_unchanged_when_statement_fails(driver_1: Driver) -> None:
+    repository, conn = warmed_driver_repository(driver_1)
+    conn.cursor.return_value.__enter__.return_value.execute.side_effect = Error('Lock wait timeout exceeded')
+
+    with pytest.raises(Error):
+        repository.update_many([1], {'registration_number': 'NEW1'})
+
+    assert repository.resolve_plate('ABC123') == 1
+    assert repository.resolve_plate('NEW1') is None
+
+
+def test_plate_index_follows_committed_writes(driver_1: Driver, driver_2: Driver) -> None:
+    repository, conn = warmed_driver_repository(driver_1)
+
+    assert repository.insert(driver_2) == 2
+    repository.delete(1)
+
+    assert repository.resolve_plates(['ABC123', 'XYZ123']) == {'XYZ123': 2}
+
+
+def test_write_on_external_connection_drops_plate_index(driver_1: Driver, driver_2: Driver) -> None:
+    repository, _ = warmed_driver_repository(driver_1)
+    external = MagicMock()
+
+    repository.insert(driver_2, conn=external)
+
+    external.commit.assert_not_called()
+    assert not repository.plate_index.warmed
+    assert len(repository.plate_index) == 0
+    assert repository.fuzzy_plate_index is not None and len(repository.fuzzy_plate_index) == 0
+
+
+def test_outbox_delivers_archived_violations(
+        connection_manager: MySQLConnectionManager,
+        driver_repository: DriverRepository,
+        speed_camera_repository: SpeedCameraRepository,
+        offense_repository: OffenseRepository,
+        violation_repository: ViolationRepository,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera,
+        offense_1: Offense,
+        clear_database
+) -> None:
+    driver_repository.insert(driver_1)
+    speed_camera_repository.insert(speed_camera_1)
+    offense_repository.insert(offense_1)
+    outbox = ViolationOutboxRepository(connection_manager)
+    outbox.subscribe('notices')
+    violation_repository.insert_many([
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2020-01-01'),
+        Violation(driver_id=1, speed_camera_id=1, offense_id=1, violation_date='2024-01-01'),
+    ])
+
+    ViolationArchiver(connection_manager, pause_seconds=0).run(date(2023, 1, 1))
+
+    assert [(entry.violation.id_, entry.violation.violation_date) for entry in outbox.claim('notices')] == [
+        (1, '2020-01-01'),
+        (2, '2024-01-01'),
+    ]
+
+
+def test_outbox_claim_skips_batches_of_orphaned_entries() -> None:
+    repository = ViolationOutboxRepository(MagicMock())
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.description = [(column,) for column in (
+        'entry_id', 'created_at', 'attempts', 'lag_seconds',
+        'id_', 'violation_date', 'driver_id', 'speed_camera_id', 'offense_id',
+    )]
+    cursor.fetchall.side_effect = [
+        [(1, 10)],
+        [],
+        [(2, 11)],
+        [(2, datetime(2024, 1, 1), 1, 0.5, 11, date(2024, 1, 1), 1, 1, 1)],
+    ]
+
+    entries = repository.claim('notices', batch_size=1, conn=conn)
+
+    assert [(entry.entry_id, entry.violation.id_) for entry in entries] == [(2, 11)]
+    assert any(
+        call.args[0].startswith('delete from violation_outbox') and call.args[1] == (1,)
+        for call in cursor.execute.call_args_list
+    )
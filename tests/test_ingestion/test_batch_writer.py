@@ -0,0 +1,97 @@
+from src.ingestion.batch_writer import AsyncBatchWriter
+from src.domain.entity import Violation
+from unittest.mock import MagicMock
+import asyncio
+import time
+
+
+def test_writer_flushes_full_batches_and_remainder_on_stop() -> None:
+    repository = MagicMock()
+
+    async def produce() -> AsyncBatchWriter:
+        async with AsyncBatchWriter(repository, max_batch_size=10, max_batch_age=5) as writer:
+            await writer.put_many([Violation(driver_id=i) for i in range(25)])
+        return writer
+
+    writer = asyncio.run(produce())
+
+    assert [len(call.args[0]) for call in repository.insert_many.call_args_list] == [10, 10, 5]
+    assert writer.metrics.written == 25
+    assert writer.metrics.flushes == 3
+    assert writer.metrics.queue_depth == 0
+
+
+def test_writer_flushes_partial_batch_after_max_age() -> None:
+    repository = MagicMock()
+
+    async def produce() -> int:
+        async with AsyncBatchWriter(repository, max_batch_size=100, max_batch_age=0.05) as writer:
+            await writer.put(Violation(driver_id=1))
+            await asyncio.sleep(0.2)
+            return repository.insert_many.call_count
+
+    assert asyncio.run(produce()) == 1
+
+
+def test_writer_applies_backpressure_when_database_is_slow() -> None:
+    repository = MagicMock()
+    repository.insert_many.side_effect = lambda batch: time.sleep(0.1)
+
+    async def produce() -> tuple[int, float]:
+        async with AsyncBatchWriter(repository, max_batch_size=2, max_batch_age=0, max_queue_size=2) as writer:
+            start = time.perf_counter()
+            await writer.put_many([Violation(driver_id=i) for i in range(8)])
+            elapsed = time.perf_counter() - start
+            depth = writer.metrics.queue_depth
+        return depth, elapsed
+
+    depth, elapsed = asyncio.run(produce())
+    assert depth <= 2
+    assert elapsed >= 0.1
+
+
+def test_writer_counts_failed_flushes() -> None:
+    repository = MagicMock()
+    repository.insert_many.side_effect = RuntimeError('database unavailable')
+
+    async def produce() -> AsyncBatchWriter:
+        async with AsyncBatchWriter(repository, max_batch_size=3, max_attempts=3, retry_delay=0) as writer:
+            await writer.put_many([Violation(driver_id=i) for i in range(3)])
+        return writer
+
+    metrics = asyncio.run(produce()).metrics
+    assert repository.insert_many.call_count == 3
+    assert metrics.failed == 3
+    assert metrics.written == 0
+    assert metrics.flush_latency_max_ms >= 0
+
+
+def test_writer_retries_failed_flush_until_it_succeeds() -> None:
+    repository = MagicMock()
+    repository.insert_many.side_effect = [RuntimeError('database unavailable'), None, None]
+    violations = [Violation(driver_id=i) for i in range(6)]
+
+    async def produce() -> AsyncBatchWriter:
+        async with AsyncBatchWriter(repository, max_batch_size=3, max_batch_age=5, retry_delay=0.01) as writer:
+            await writer.put_many(violations)
+        return writer
+
+    metrics = asyncio.run(produce()).metrics
+    written = [violation for call in repository.insert_many.call_args_list[1:] for violation in call.args[0]]
+    assert written == violations
+    assert (metrics.written, metrics.failed, metrics.retries) == (6, 0, 1)
+
+
+def test_writer_spools_batch_after_last_attempt() -> None:
+    repository = MagicMock()
+    repository.insert_many.side_effect = RuntimeError('database unavailable')
+    spool = MagicMock()
+
+    async def produce() -> AsyncBatchWriter:
+        async with AsyncBatchWriter(repository, max_batch_size=2, max_attempts=2, retry_delay=0, spool=spool) as writer:
+            await writer.put_many([Violation(driver_id=1), Violation(driver_id=2)])
+        return writer
+
+    metrics = asyncio.run(produce()).metrics
+    assert [violation.driver_id for violation in spool.append.call_args.args[0]] == [1, 2]
+    assert (metrics.spooled, metrics.failed, metrics.retries) == (2, 0, 1)
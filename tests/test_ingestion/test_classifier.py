@@ -0,0 +1,70 @@
+from src.ingestion.reading import SpeedReading, OverspeedBand
+from src.ingestion.classifier import OverspeedClassifier
+from src.ingestion.section import SectionPassage
+from src.domain.entity import CameraSection
+from datetime import datetime
+import pytest
+
+
+@pytest.fixture
+def classifier() -> OverspeedClassifier:
+    return OverspeedClassifier([
+        OverspeedBand(min_excess=21, offense_id=3),
+        OverspeedBand(min_excess=1, offense_id=1),
+        OverspeedBand(min_excess=11, offense_id=2),
+    ])
+
+
+@pytest.mark.parametrize('excess, expected', [(-5, None), (0, None), (1, 1), (10, 1), (11, 2), (21, 3), (80, 3)])
+def test_offense_for_picks_highest_matching_band(classifier: OverspeedClassifier, excess: int, expected: int) -> None:
+    assert classifier.offense_for(excess) == expected
+
+
+def test_classify_creates_violations_and_counts_discarded_readings(classifier: OverspeedClassifier) -> None:
+    timestamp = datetime(2025, 10, 14, 8, 30)
+    readings = [
+        SpeedReading(1, 'ABC123', 65, timestamp),
+        SpeedReading(1, 'XYZ123', 50, timestamp),
+        SpeedReading(2, 'ABC123', 120, timestamp),
+        SpeedReading(1, 'UNKNOWN', 90, timestamp),
+    ]
+
+    result = classifier.classify(readings, allowed_speeds={1: 50}, driver_ids={'ABC123': 7, 'XYZ123': 8})
+
+    assert len(result.violations) == 1
+    assert result.violations[0].violation_date == '2025-10-14'
+    assert result.violations[0].driver_id == 7
+    assert result.violations[0].offense_id == 2
+    assert result.within_limit == 1
+    assert result.unknown_cameras == 1
+    assert result.unknown_drivers == 1
+
+
+def test_violating_plates_skips_readings_within_limit(classifier: OverspeedClassifier) -> None:
+    timestamp = datetime(2025, 10, 14)
+    readings = [SpeedReading(1, 'ABC123', 51, timestamp), SpeedReading(1, 'XYZ123', 50, timestamp)]
+
+    assert classifier.violating_plates(readings, {1: 50}) == {'ABC123'}
+
+
+@pytest.mark.parametrize('bands', [[], [OverspeedBand(0, 1)], [OverspeedBand(5, 1), OverspeedBand(5, 2)]])
+def test_classifier_rejects_invalid_bands(bands: list[OverspeedBand]) -> None:
+    with pytest.raises(ValueError):
+        OverspeedClassifier(bands)
+
+
+def test_classify_passages_uses_average_speed_and_exit_camera(classifier: OverspeedClassifier) -> None:
+    section = CameraSection(entry_camera_id=4, exit_camera_id=5, distance_m=1_000, speed_limit=50, max_travel_seconds=600)
+    entry = datetime(2025, 10, 14, 23, 59, 30)
+    passages = [
+        SectionPassage(section, 'ABC123', entry, datetime(2025, 10, 15, 0, 0, 30), 60.0),
+        SectionPassage(section, 'XYZ123', entry, datetime(2025, 10, 15, 0, 0, 30), 50.5),
+        SectionPassage(section, 'UNKNOWN', entry, datetime(2025, 10, 15, 0, 0, 30), 90.0),
+    ]
+
+    result = classifier.classify_passages(passages, driver_ids={'ABC123': 7, 'XYZ123': 8})
+
+    assert classifier.violating_passage_plates(passages) == {'ABC123', 'UNKNOWN'}
+    assert [(v.driver_id, v.speed_camera_id, v.offense_id, v.violation_date) for v in result.violations] == \
+           [(7, 5, 1, '2025-10-15')]
+    assert (result.within_limit, result.unknown_drivers) == (1, 1)
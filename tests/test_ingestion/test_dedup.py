@@ -0,0 +1,52 @@
+from src.ingestion.dedup import DetectionDeduplicator
+from src.ingestion.reading import SpeedReading
+from datetime import datetime, timedelta
+import pytest
+
+START = datetime(2025, 10, 14, 12, 0, 0)
+
+
+def reading(plate: str, camera: int, seconds: float) -> SpeedReading:
+    return SpeedReading(camera, plate, 80, START + timedelta(seconds=seconds))
+
+
+def test_filter_drops_repeated_detections_within_bucket() -> None:
+    deduplicator = DetectionDeduplicator(bucket_seconds=10)
+    readings = [reading('ABC123', 1, 0), reading('ABC123', 1, 3), reading('ABC123', 2, 3), reading('XYZ123', 1, 4)]
+
+    result = deduplicator.filter(readings)
+
+    assert result == [readings[0], readings[2], readings[3]]
+    assert deduplicator.stats.duplicates == 1
+    assert deduplicator.stats.accepted == 3
+
+
+def test_filter_accepts_same_plate_in_next_bucket() -> None:
+    deduplicator = DetectionDeduplicator(bucket_seconds=10)
+
+    assert len(deduplicator.filter([reading('ABC123', 1, 0), reading('ABC123', 1, 15)])) == 2
+
+
+def test_old_buckets_are_dropped_and_late_readings_passed_on() -> None:
+    deduplicator = DetectionDeduplicator(bucket_seconds=10, retained_buckets=2)
+    deduplicator.filter([reading('ABC123', 1, 0), reading('XYZ123', 1, 10), reading('QWE123', 1, 20)])
+
+    assert deduplicator.size == 2
+    assert len(deduplicator.filter([reading('ABC123', 1, 1)])) == 1
+    assert deduplicator.stats.late == 1
+
+
+def test_full_bucket_passes_readings_without_recording_them() -> None:
+    deduplicator = DetectionDeduplicator(max_keys_per_bucket=1)
+
+    result = deduplicator.filter([reading('ABC123', 1, 0), reading('XYZ123', 1, 0), reading('XYZ123', 1, 0)])
+
+    assert len(result) == 3
+    assert deduplicator.stats.overflow == 2
+    assert deduplicator.size == 1
+
+
+@pytest.mark.parametrize('kwargs', [{'bucket_seconds': 0}, {'retained_buckets': 0}, {'max_keys_per_bucket': 0}])
+def test_deduplicator_rejects_invalid_configuration(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        DetectionDeduplicator(**kwargs)
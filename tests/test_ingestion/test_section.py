@@ -0,0 +1,89 @@
+from src.ingestion.section import SectionSpeedMatcher
+from src.ingestion.reading import SpeedReading
+from src.domain.entity import CameraSection
+from datetime import datetime, timedelta
+import pytest
+
+START = datetime(2025, 10, 14, 8, 0)
+
+
+def section(entry: int = 1, exit_: int = 2, max_travel_seconds: int = 600) -> CameraSection:
+    return CameraSection(entry_camera_id=entry, exit_camera_id=exit_, distance_m=5_000, speed_limit=100,
+                         max_travel_seconds=max_travel_seconds)
+
+
+def reading(camera: int, plate: str, seconds: float) -> SpeedReading:
+    return SpeedReading(camera, plate, 0, START + timedelta(seconds=seconds))
+
+
+def test_match_computes_average_speed_of_passages() -> None:
+    matcher = SectionSpeedMatcher([section()])
+
+    passages = matcher.match([
+        reading(1, 'ABC123', 0),
+        reading(1, 'XYZ123', 10),
+        reading(2, 'abc 123', 150),
+        reading(2, 'XYZ123', 190),
+    ])
+
+    assert [(p.registration_number, round(p.average_speed)) for p in passages] == [('abc 123', 120), ('XYZ123', 100)]
+    assert [p.excess for p in passages] == [20, 0]
+    assert matcher.size == 0
+
+
+def test_exit_without_entry_is_not_matched() -> None:
+    matcher = SectionSpeedMatcher([section()])
+
+    assert matcher.match([reading(2, 'ABC123', 10), reading(1, 'ABC123', 20)]) == []
+    assert matcher.stats.unmatched_exits == 1
+    assert matcher.size == 1
+
+
+def test_exit_read_before_entry_keeps_pending_entry() -> None:
+    matcher = SectionSpeedMatcher([section()])
+
+    passages = matcher.match([reading(1, 'ABC123', 100), reading(2, 'ABC123', 90), reading(2, 'ABC123', 250)])
+
+    assert [(p.entry_time, p.exit_time) for p in passages] == [
+        (START + timedelta(seconds=100), START + timedelta(seconds=250)),
+    ]
+    assert matcher.stats.unmatched_exits == 1
+    assert matcher.size == 0
+
+
+def test_entries_expire_after_time_window() -> None:
+    matcher = SectionSpeedMatcher([section(max_travel_seconds=300)])
+
+    passages = matcher.match([reading(1, 'ABC123', 0), reading(1, 'XYZ123', 200), reading(2, 'ABC123', 400)])
+
+    assert passages == []
+    assert matcher.stats.expired == 1
+    assert matcher.size == 1
+
+
+def test_pending_entries_are_bounded() -> None:
+    matcher = SectionSpeedMatcher([section()], max_pending_per_section=2)
+
+    matcher.match([reading(1, plate, index) for index, plate in enumerate(['A1', 'B2', 'C3', 'B2'])])
+
+    assert matcher.size == 2
+    assert matcher.stats.evicted == 1
+    assert matcher.match([reading(2, 'A1', 100)]) == []
+
+
+def test_reading_can_end_one_section_and_start_the_next() -> None:
+    matcher = SectionSpeedMatcher([section(1, 2), section(2, 3)])
+
+    passages = matcher.match([reading(1, 'ABC123', 0), reading(2, 'ABC123', 180), reading(3, 'ABC123', 360)])
+
+    assert [(p.section.entry_camera_id, p.section.exit_camera_id) for p in passages] == [(1, 2), (2, 3)]
+
+
+@pytest.mark.parametrize('sections, kwargs', [
+    ([CameraSection(entry_camera_id=1, distance_m=1, speed_limit=1, max_travel_seconds=1)], {}),
+    ([CameraSection(entry_camera_id=1, exit_camera_id=2, distance_m=0, speed_limit=1, max_travel_seconds=1)], {}),
+    ([], {'max_pending_per_section': 0}),
+])
+def test_matcher_rejects_invalid_configuration(sections: list[CameraSection], kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        SectionSpeedMatcher(sections, **kwargs)
@@ -0,0 +1,109 @@
+from src.ingestion.spool import ViolationSpool, SpoolReplayer, RECORD_HEADER
+from src.database.connection import MySQLConnectionManager
+from src.domain.entity import Violation
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+import pytest
+
+
+def make_violations(count: int) -> list[Violation]:
+    return [
+        Violation(violation_date='2025-10-14', driver_id=i + 1, speed_camera_id=2, offense_id=3)
+        for i in range(count)
+    ]
+
+
+def test_spool_round_trips_violations(tmp_path: Path) -> None:
+    spool = ViolationSpool(tmp_path)
+    end_offset = spool.append(make_violations(3))
+
+    violations, next_offset = spool.read(0, 10)
+
+    assert violations == make_violations(3)
+    assert next_offset == end_offset == spool.end_offset
+
+
+def test_spool_rolls_segments_and_releases_committed_ones(tmp_path: Path) -> None:
+    spool = ViolationSpool(tmp_path, segment_size=256)
+    spool.append(make_violations(30))
+
+    assert len(list(tmp_path.glob('*.seg'))) > 1
+    violations, offset = spool.read(0, 100)
+    assert violations == make_violations(30)
+
+    spool.release(offset)
+    assert len(list(tmp_path.glob('*.seg'))) == 1
+    assert spool.read(offset, 100) == ([], offset)
+
+
+def test_spool_recovers_records_after_reopening(tmp_path: Path) -> None:
+    spool = ViolationSpool(tmp_path, segment_size=256)
+    spool.append(make_violations(12))
+    end_offset = spool.end_offset
+    spool.close()
+
+    reopened = ViolationSpool(tmp_path, segment_size=256)
+
+    assert reopened.end_offset == end_offset
+    assert reopened.read(0, 100)[0] == make_violations(12)
+
+
+def test_spool_discards_torn_trailing_record(tmp_path: Path) -> None:
+    spool = ViolationSpool(tmp_path)
+    spool.append(make_violations(2))
+    spool.close()
+
+    segment_path = next(tmp_path.glob('*.seg'))
+    data = bytearray(segment_path.read_bytes())
+    data[RECORD_HEADER.size * 2 + 16 + 3] ^= 0xFF
+    segment_path.write_bytes(bytes(data))
+
+    reopened = ViolationSpool(tmp_path)
+    assert reopened.read(0, 10)[0] == make_violations(1)
+
+
+@pytest.fixture
+def connection_manager() -> MagicMock:
+    return MagicMock(spec=MySQLConnectionManager)
+
+
+def test_replayer_commits_batch_with_offset_in_one_transaction(tmp_path: Path, connection_manager: MagicMock) -> None:
+    spool = ViolationSpool(tmp_path)
+    spool.append(make_violations(5))
+    conn = connection_manager.get_connection.return_value
+
+    with (
+        patch('src.ingestion.spool.ViolationRepository') as violation_repository_type,
+        patch('src.ingestion.spool.CheckpointRepository') as checkpoint_repository_type,
+    ):
+        checkpoint_repository_type.return_value.get.return_value = None
+        replayer = SpoolReplayer(spool, connection_manager, batch_size=3)
+
+        assert replayer.replay_once() == 3
+        assert replayer.replay_once() == 2
+        assert replayer.replay_once() == 0
+
+    violation_repository_type.return_value.insert_many.assert_called_with(make_violations(5)[3:], conn=conn)
+    checkpoint_repository_type.return_value.save.assert_called_with('violation_spool', spool.end_offset, conn=conn)
+    assert conn.commit.call_count == 2
+    assert replayer.lag == 0
+
+
+def test_replayer_keeps_offset_when_commit_fails(tmp_path: Path, connection_manager: MagicMock) -> None:
+    spool = ViolationSpool(tmp_path)
+    spool.append(make_violations(2))
+    conn = connection_manager.get_connection.return_value
+    conn.commit.side_effect = RuntimeError('connection lost')
+
+    with (
+        patch('src.ingestion.spool.ViolationRepository'),
+        patch('src.ingestion.spool.CheckpointRepository') as checkpoint_repository_type,
+    ):
+        checkpoint_repository_type.return_value.get.return_value = 0
+        replayer = SpoolReplayer(spool, connection_manager)
+        with pytest.raises(RuntimeError):
+            replayer.replay_once()
+
+    conn.rollback.assert_called_once()
+    conn.close.assert_called_once()
+    assert replayer.committed_offset == 0
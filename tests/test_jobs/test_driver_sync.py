@@ -0,0 +1,81 @@
+from src.jobs.driver_sync import DriverRegistrySync, driver_hash
+from src.domain.repository import DriverRepository
+from src.domain.entity import Driver
+from unittest.mock import MagicMock
+from pathlib import Path
+import pytest
+
+
+def write_registry(path: Path, rows: list[tuple[str, str, str]]) -> Path:
+    path.write_text('registration_number,first_name,last_name\n' + ''.join(f'{",".join(row)}\n' for row in rows))
+    return path
+
+
+@pytest.fixture
+def driver_repository() -> MagicMock:
+    repository = MagicMock(spec=DriverRepository)
+    repository.find.return_value = [
+        Driver(id_=1, first_name='Jon', last_name='Smith', registration_number='ABC123'),
+        Driver(id_=2, first_name='Bob', last_name='Doe', registration_number='XYZ123'),
+    ]
+    repository.find_by_registration_numbers.side_effect = [
+        [],
+        [Driver(id_=3, first_name='Ann', last_name='Lee', registration_number='NEW1')],
+    ]
+    return repository
+
+
+def test_sync_writes_only_new_and_changed_drivers(driver_repository: MagicMock, tmp_path: Path) -> None:
+    registry = write_registry(tmp_path / 'registry.csv', [
+        ('ABC123', 'Jon', 'Smith'),
+        ('XYZ123', 'Bob', 'Doe-Smith'),
+        ('NEW1', 'Ann', 'Lee'),
+        ('NEW1', 'Ann', 'Lee'),
+    ])
+    sync = DriverRegistrySync(driver_repository, tmp_path / 'drivers.snapshot')
+
+    summary = sync.sync(registry)
+
+    written = driver_repository.upsert_many.call_args.args[0]
+    assert [(driver.id_, driver.registration_number) for driver in written] == [(2, 'XYZ123'), (None, 'NEW1')]
+    assert (summary.read, summary.duplicates, summary.inserted, summary.updated, summary.unchanged) == (4, 1, 1, 1, 1)
+    snapshot = (tmp_path / 'drivers.snapshot').read_text()
+    assert f'NEW1\t3\t{driver_hash("Ann", "Lee")}' in snapshot
+
+
+def test_sync_updates_stored_plate_missing_from_snapshot(driver_repository: MagicMock, tmp_path: Path) -> None:
+    driver_repository.find_by_registration_numbers.side_effect = [[
+        Driver(id_=7, first_name='Ann', last_name='Lee', registration_number='NEW1'),
+        Driver(id_=5, first_name='Ann', last_name='Lee', registration_number='NEW1'),
+    ]]
+    registry = write_registry(tmp_path / 'registry.csv', [('NEW1', 'Ann', 'Lee-Smith')])
+    sync = DriverRegistrySync(driver_repository, tmp_path / 'drivers.snapshot')
+
+    summary = sync.sync(registry)
+
+    written = driver_repository.upsert_many.call_args.args[0]
+    assert [(driver.id_, driver.registration_number) for driver in written] == [(5, 'NEW1')]
+    assert driver_repository.find_by_registration_numbers.call_count == 1
+    assert (summary.inserted, summary.updated) == (0, 1)
+
+
+def test_second_sync_of_same_registry_writes_nothing(driver_repository: MagicMock, tmp_path: Path) -> None:
+    registry = write_registry(tmp_path / 'registry.csv', [('ABC123', 'Jon', 'Smith'), ('NEW1', 'Ann', 'Lee')])
+    sync = DriverRegistrySync(driver_repository, tmp_path / 'drivers.snapshot')
+    sync.sync(registry)
+    driver_repository.reset_mock()
+
+    summary = sync.sync(registry)
+
+    driver_repository.upsert_many.assert_not_called()
+    driver_repository.find.assert_not_called()
+    assert summary.unchanged == 2
+    assert summary.missing == 1
+
+
+def test_registry_without_required_columns_is_rejected(driver_repository: MagicMock, tmp_path: Path) -> None:
+    registry = tmp_path / 'registry.csv'
+    registry.write_text('registration_number,first_name\nABC123,Jon\n')
+
+    with pytest.raises(ValueError):
+        DriverRegistrySync(driver_repository, tmp_path / 'drivers.snapshot').sync(registry)
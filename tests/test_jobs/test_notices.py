@@ -0,0 +1,60 @@
+from src.jobs.notices import FineNoticeGenerator, render_notices, NOTICE_TEMPLATE, NOTICE_SEPARATOR
+from src.domain.repository import ViolationRepository
+from src.domain.typed_dict import FineNoticeDict
+from unittest.mock import MagicMock
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable
+
+
+def notice(violation_id: int, total_points: int) -> FineNoticeDict:
+    return {
+        'violation_id': violation_id,
+        'violation_date': date(2025, 10, 14),
+        'driver_id': 1,
+        'first_name': 'John',
+        'last_name': 'Doe',
+        'registration_number': 'ABC123',
+        'description': 'Speeding 21-30 km/h',
+        'penalty_points': 5,
+        'fine_amount': Decimal('300.00'),
+        'total_points': total_points,
+    }
+
+
+def test_render_notices_fills_the_template() -> None:
+    rendered = render_notices(NOTICE_TEMPLATE, [notice(1, 5), notice(2, 10)])
+
+    first, second = rendered.split(NOTICE_SEPARATOR)
+    assert 'FINE NOTICE No. 1' in first
+    assert 'Date of violation: 2025-10-14' in first
+    assert 'Fine: 300.00 PLN' in first
+    assert 'Penalty points: 5 (total: 10)' in second
+
+
+def test_generate_writes_one_file_per_chunk(tmp_path: Path) -> None:
+    repository = MagicMock(spec=ViolationRepository)
+
+    def stream(
+            day: date,
+            consumer: Callable[[list[FineNoticeDict]], None],
+            chunk_size: int,
+            include_archived: bool
+    ) -> int:
+        for chunk in ([notice(1, 5), notice(2, 10)], [notice(3, 15)]):
+            consumer(chunk)
+        return 3
+
+    repository.stream_fine_notices.side_effect = stream
+    stale_file = tmp_path / '2025-10-14' / 'notices-00009.txt'
+    stale_file.parent.mkdir()
+    stale_file.write_text('old')
+
+    summary = FineNoticeGenerator(repository, tmp_path, max_workers=2, chunk_size=2).generate(date(2025, 10, 14))
+
+    assert (summary.notices, summary.files) == (3, 2)
+    files = sorted((tmp_path / '2025-10-14').iterdir())
+    assert [file.name for file in files] == ['notices-00001.txt', 'notices-00002.txt']
+    assert files[0].read_text().count('FINE NOTICE') == 2
+    assert 'FINE NOTICE No. 3' in files[1].read_text()
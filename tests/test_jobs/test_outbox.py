@@ -0,0 +1,87 @@
+from src.database.connection import MySQLConnectionManager
+from src.domain.repository import OutboxEntry
+from src.jobs.outbox import ViolationOutboxConsumer
+from src.domain.entity import Violation
+from unittest.mock import MagicMock
+from datetime import datetime
+import threading
+import pytest
+
+
+def _entry(entry_id: int, attempts: int = 1, lag_seconds: float = 0.5) -> OutboxEntry:
+    return OutboxEntry(
+        entry_id=entry_id,
+        violation=Violation(id_=entry_id * 10, driver_id=1, speed_camera_id=1, offense_id=1),
+        created_at=datetime(2024, 1, 1),
+        attempts=attempts,
+        lag_seconds=lag_seconds,
+    )
+
+
+@pytest.fixture
+def outbox_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.claim.return_value = [_entry(1), _entry(2, attempts=2, lag_seconds=3.0)]
+    repository.acknowledge.side_effect = lambda entry_ids: len(entry_ids)
+    return repository
+
+
+@pytest.fixture
+def handler() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def consumer(outbox_repository: MagicMock, handler: MagicMock) -> ViolationOutboxConsumer:
+    consumer = ViolationOutboxConsumer(MagicMock(spec=MySQLConnectionManager), 'notices', handler, batch_size=2)
+    consumer._outbox_repository = outbox_repository
+    return consumer
+
+
+def test_poll_acknowledges_batch_after_handler(
+        consumer: ViolationOutboxConsumer,
+        outbox_repository: MagicMock,
+        handler: MagicMock
+) -> None:
+    assert consumer.poll() == 2
+
+    outbox_repository.claim.assert_called_once_with('notices', 2, 60.0)
+    assert [entry.violation.id_ for entry in handler.call_args.args[0]] == [10, 20]
+    outbox_repository.acknowledge.assert_called_once_with([1, 2])
+    stats = consumer.stats
+    assert (stats.batches, stats.delivered, stats.acknowledged, stats.redelivered) == (1, 2, 2, 1)
+    assert stats.last_lag_seconds == 3.0
+
+
+def test_failed_handler_releases_batch_for_redelivery(
+        consumer: ViolationOutboxConsumer,
+        outbox_repository: MagicMock,
+        handler: MagicMock
+) -> None:
+    handler.side_effect = RuntimeError('registry down')
+
+    with pytest.raises(RuntimeError):
+        consumer.poll()
+
+    outbox_repository.release.assert_called_once_with([1, 2])
+    outbox_repository.acknowledge.assert_not_called()
+    assert consumer.stats.failed_batches == 1
+
+
+def test_run_polls_until_stopped(consumer: ViolationOutboxConsumer, outbox_repository: MagicMock) -> None:
+    stop = threading.Event()
+    batches = [[_entry(1)], []]
+
+    def claim(*args: object) -> list[OutboxEntry]:
+        batch = batches.pop(0)
+        if not batch:
+            stop.set()
+        return batch
+
+    outbox_repository.claim.side_effect = claim
+    consumer._poll_interval = 0
+
+    stats = consumer.run(stop)
+
+    assert (stats.batches, stats.acknowledged) == (1, 1)
+    assert outbox_repository.claim.call_count == 2
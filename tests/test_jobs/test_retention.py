@@ -0,0 +1,150 @@
+from src.database.connection import MySQLConnectionManager
+from src.jobs.retention import ViolationArchiver
+from unittest.mock import MagicMock, patch
+from datetime import date
+import pytest
+
+
+@pytest.fixture
+def connection_manager() -> MagicMock:
+    return MagicMock(spec=MySQLConnectionManager)
+
+
+@pytest.fixture
+def violation_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.archivable_id_range.return_value = (1, 25)
+    return repository
+
+
+@pytest.fixture
+def checkpoint_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.get.return_value = None
+    return repository
+
+
+def make_archiver(
+        connection_manager: MagicMock,
+        violation_repository: MagicMock,
+        checkpoint_repository: MagicMock,
+        pause_seconds: float = 0
+) -> ViolationArchiver:
+    archiver = ViolationArchiver(connection_manager, chunk_size=10, pause_seconds=pause_seconds)
+    archiver._violation_repository = violation_repository
+    archiver._checkpoint_repository = checkpoint_repository
+    return archiver
+
+
+@pytest.fixture
+def archiver(
+        connection_manager: MagicMock,
+        violation_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> ViolationArchiver:
+    return make_archiver(connection_manager, violation_repository, checkpoint_repository)
+
+
+def test_run_archives_id_ranges_and_resets_checkpoint(
+        archiver: ViolationArchiver,
+        connection_manager: MagicMock,
+        violation_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    violation_repository.archive_range.side_effect = [10, 4, 1]
+    conn = connection_manager.get_connection.return_value
+
+    summary = archiver.run(date(2024, 1, 1))
+
+    ranges = [call.args[:2] for call in violation_repository.archive_range.call_args_list]
+    assert ranges == [(1, 10), (11, 20), (21, 25)]
+    saved = [call.args[1] for call in checkpoint_repository.save.call_args_list]
+    assert saved == [10, 20, 25, 0]
+    conn.start_transaction.assert_called_with(isolation_level='READ COMMITTED')
+    assert conn.commit.call_count == 3
+    assert (summary.archived, summary.chunks, summary.last_id) == (15, 3, 25)
+
+
+def test_run_resumes_after_checkpoint(
+        archiver: ViolationArchiver,
+        violation_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    violation_repository.archive_range.return_value = 0
+    checkpoint_repository.get.return_value = 20
+
+    summary = archiver.run(date(2024, 1, 1))
+
+    violation_repository.archive_range.assert_called_once()
+    assert violation_repository.archive_range.call_args.args[:2] == (21, 25)
+    assert summary.chunks == 1
+
+
+def test_run_without_old_violations_does_nothing(
+        archiver: ViolationArchiver,
+        violation_repository: MagicMock
+) -> None:
+    violation_repository.archivable_id_range.return_value = None
+
+    summary = archiver.run(date(2024, 1, 1))
+
+    violation_repository.archive_range.assert_not_called()
+    assert summary.archived == 0
+
+
+def test_failed_chunk_is_rolled_back_and_keeps_checkpoint(
+        archiver: ViolationArchiver,
+        connection_manager: MagicMock,
+        violation_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    violation_repository.archive_range.side_effect = [10, RuntimeError('lock wait timeout')]
+    conn = connection_manager.get_connection.return_value
+
+    with pytest.raises(RuntimeError):
+        archiver.run(date(2024, 1, 1))
+
+    conn.rollback.assert_called_once()
+    assert [call.args[1] for call in checkpoint_repository.save.call_args_list] == [10]
+
+
+def test_run_pauses_between_chunks(
+        connection_manager: MagicMock,
+        violation_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    archiver = make_archiver(connection_manager, violation_repository, checkpoint_repository, pause_seconds=0.5)
+    violation_repository.archive_range.side_effect = [10, 4, 1]
+
+    with patch('src.jobs.retention.time.sleep') as sleep:
+        archiver.run(date(2024, 1, 1))
+
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 0.5]
+
+
+def test_run_starts_at_lowest_archivable_id(
+        archiver: ViolationArchiver,
+        violation_repository: MagicMock
+) -> None:
+    violation_repository.archivable_id_range.return_value = (1_003, 1_025)
+    violation_repository.archive_range.return_value = 1
+
+    summary = archiver.run(date(2024, 1, 1))
+
+    ranges = [call.args[:2] for call in violation_repository.archive_range.call_args_list]
+    assert ranges == [(1_003, 1_012), (1_013, 1_022), (1_023, 1_025)]
+    assert summary.chunks == 3
+
+
+def test_run_skips_pause_after_empty_chunks(
+        connection_manager: MagicMock,
+        violation_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    archiver = make_archiver(connection_manager, violation_repository, checkpoint_repository, pause_seconds=0.5)
+    violation_repository.archive_range.side_effect = [0, 0, 3]
+
+    with patch('src.jobs.retention.time.sleep') as sleep:
+        archiver.run(date(2024, 1, 1))
+
+    sleep.assert_not_called()
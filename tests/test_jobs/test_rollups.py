@@ -0,0 +1,182 @@
+from src.database.connection import MySQLConnectionManager
+from src.domain.repository import ViolationRollupRepository
+from src.jobs.rollups import ViolationRollupJob
+from unittest.mock import MagicMock
+from datetime import date
+import pytest
+
+
+@pytest.fixture
+def connection_manager() -> MagicMock:
+    return MagicMock(spec=MySQLConnectionManager)
+
+
+@pytest.fixture
+def rollup_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.max_violation_id.return_value = 25
+    repository.recount_days.return_value = 0
+    repository.roll_up_range.side_effect = lambda first_id, last_id, conn: last_id - first_id + 1
+    return repository
+
+
+@pytest.fixture
+def checkpoint_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.get.return_value = 5
+    return repository
+
+
+@pytest.fixture
+def job(connection_manager: MagicMock, rollup_repository: MagicMock, checkpoint_repository: MagicMock) -> ViolationRollupJob:
+    job = ViolationRollupJob(connection_manager, chunk_size=10, recount_window=4)
+    job._rollup_repository = rollup_repository
+    job._checkpoint_repository = checkpoint_repository
+    return job
+
+
+def test_run_rolls_up_violations_above_high_water_mark(
+        job: ViolationRollupJob,
+        connection_manager: MagicMock,
+        rollup_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    summary = job.run()
+
+    assert [call.args[:2] for call in rollup_repository.roll_up_range.call_args_list] == [(6, 15), (16, 25)]
+    assert [call.args[1] for call in checkpoint_repository.save.call_args_list] == [15, 25]
+    assert connection_manager.get_connection.return_value.commit.call_count == 3
+    assert (summary.rolled_up, summary.chunks, summary.high_water_mark) == (20, 2, 25)
+
+
+def test_run_without_new_violations_does_nothing(
+        job: ViolationRollupJob,
+        rollup_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    checkpoint_repository.get.return_value = 25
+
+    summary = job.run()
+
+    rollup_repository.roll_up_range.assert_not_called()
+    assert summary.high_water_mark == 25
+
+
+def test_run_recounts_trailing_window_before_rolling_up(
+        job: ViolationRollupJob,
+        rollup_repository: MagicMock
+) -> None:
+    events: list[str] = []
+
+    def recount_days(first_id: int, last_id: int, conn: object) -> int:
+        events.append(f'recount {first_id}-{last_id}')
+        return 2
+
+    def roll_up_range(first_id: int, last_id: int, conn: object) -> int:
+        events.append(f'roll_up {first_id}-{last_id}')
+        return last_id - first_id + 1
+
+    rollup_repository.recount_days.side_effect = recount_days
+    rollup_repository.roll_up_range.side_effect = roll_up_range
+
+    summary = job.run()
+
+    assert events == ['recount 2-5', 'roll_up 6-15', 'roll_up 16-25']
+    assert summary.recounted_days == 2
+
+
+def test_run_recounts_nothing_before_first_rollup(
+        job: ViolationRollupJob,
+        rollup_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    checkpoint_repository.get.return_value = 0
+
+    job.run()
+
+    rollup_repository.recount_days.assert_not_called()
+
+
+def test_failed_recount_rolls_back_and_keeps_high_water_mark(
+        job: ViolationRollupJob,
+        connection_manager: MagicMock,
+        rollup_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    rollup_repository.recount_days.side_effect = RuntimeError('lock wait timeout')
+
+    with pytest.raises(RuntimeError):
+        job.run()
+
+    connection_manager.get_connection.return_value.rollback.assert_called_once()
+    rollup_repository.roll_up_range.assert_not_called()
+    checkpoint_repository.save.assert_not_called()
+
+
+def test_backfill_clears_rollups_and_restarts_from_first_id(
+        job: ViolationRollupJob,
+        rollup_repository: MagicMock,
+        checkpoint_repository: MagicMock
+) -> None:
+    checkpoint_repository.get.return_value = 0
+
+    summary = job.backfill()
+
+    rollup_repository.clear.assert_called_once()
+    assert checkpoint_repository.save.call_args_list[0].args[1] == 0
+    assert rollup_repository.roll_up_range.call_args_list[0].args[:2] == (1, 10)
+    assert summary.rolled_up == 25
+
+
+@pytest.mark.parametrize('start, end, granularity, table', [
+    (date(2024, 1, 1), date(2024, 4, 1), None, 'violation_monthly_rollups'),
+    (date(2024, 1, 1), date(2024, 1, 15), None, 'violation_daily_rollups'),
+    (date(2024, 1, 1), date(2024, 4, 1), 'day', 'violation_daily_rollups'),
+])
+def test_violation_counts_pick_coarsest_covering_granularity(
+        start: date,
+        end: date,
+        granularity: str | None,
+        table: str
+) -> None:
+    repository = ViolationRollupRepository(MagicMock())
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [(start, 3, 7)]
+
+    result = repository.violation_counts(start, end, 'offense_id', granularity, conn=conn)  # type: ignore[arg-type]
+
+    assert f'from {table} ' in cursor.execute.call_args.args[0]
+    assert result == [{'period_start': start, 'offense_id': 3, 'violation_count': 7}]
+
+
+def test_violation_counts_reject_unaligned_monthly_range() -> None:
+    repository = ViolationRollupRepository(MagicMock())
+
+    with pytest.raises(ValueError):
+        repository.violation_counts(date(2024, 1, 2), date(2024, 3, 1), granularity='month', conn=MagicMock())
+
+
+def test_recount_days_replaces_days_and_resums_their_months() -> None:
+    repository = ViolationRollupRepository(MagicMock())
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [(date(2024, 2, 3),), (date(2024, 1, 31),), (date(2024, 2, 9),)]
+
+    assert repository.recount_days(4, 9, conn=conn) == 3
+
+    statements = [call.args for call in cursor.execute.call_args_list]
+    assert statements[1][1] == [date(2024, 1, 31), date(2024, 2, 3), date(2024, 2, 9)]
+    assert statements[2][1] == (date(2024, 1, 31), date(2024, 2, 3), date(2024, 2, 9), 9)
+    assert [args[1] for args in statements[3::2]] == [(date(2024, 1, 1),), (date(2024, 2, 1),)]
+    assert all('from violation_daily_rollups ' in args[0] for args in statements[4::2])
+
+
+def test_recount_days_without_violations_in_range_changes_nothing() -> None:
+    repository = ViolationRollupRepository(MagicMock())
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = []
+
+    assert repository.recount_days(4, 9, conn=conn) == 0
+    assert cursor.execute.call_count == 1
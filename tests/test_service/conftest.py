@@ -1,4 +1,7 @@
 from src.domain.repository import DriverRepository, OffenseRepository, SpeedCameraRepository, ViolationRepository
+from src.service.ingestion_service import IngestionService
+from src.ingestion.classifier import OverspeedClassifier
+from src.ingestion.reading import OverspeedBand
 from src.service.violation_service import ViolationService
 from unittest.mock import MagicMock
 import pytest
@@ -29,3 +32,16 @@ def mock_violation_service(
         speed_camera_repository=mock_speed_camera_repository,
         violation_repository=mock_violation_repository
     )
+
+@pytest.fixture
+def ingestion_service(
+        mock_driver_repository: MagicMock,
+        mock_speed_camera_repository: MagicMock,
+        mock_violation_repository: MagicMock
+) -> IngestionService:
+    return IngestionService(
+        driver_repository=mock_driver_repository,
+        speed_camera_repository=mock_speed_camera_repository,
+        violation_repository=mock_violation_repository,
+        classifier=OverspeedClassifier([OverspeedBand(min_excess=1, offense_id=1), OverspeedBand(min_excess=21, offense_id=2)])
+    )
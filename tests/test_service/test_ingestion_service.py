@@ -0,0 +1,165 @@
+from src.service.ingestion_service import IngestionService
+from src.ingestion.dedup import DetectionDeduplicator
+from src.analytics.sketches import ViolationSketches
+from src.domain.entity import Driver, SpeedCamera, CameraSection
+from src.ingestion.section import SectionSpeedMatcher
+from src.ingestion.reading import SpeedReading
+from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta
+
+
+def test_ingest_stores_violations_with_one_query_per_table(
+        mock_driver_repository: MagicMock,
+        mock_speed_camera_repository: MagicMock,
+        mock_violation_repository: MagicMock,
+        ingestion_service: IngestionService,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera
+) -> None:
+    mock_speed_camera_repository.find_by_ids.return_value = [speed_camera_1]
+    mock_driver_repository.resolve_plates.return_value = {driver_1.registration_number: driver_1.id_}
+    timestamp = datetime(2025, 10, 14, 12, 0)
+    readings = [
+        SpeedReading(1, 'ABC123', 75, timestamp),
+        SpeedReading(1, 'ABC123', 55, timestamp),
+        SpeedReading(1, 'XYZ123', 40, timestamp),
+    ]
+
+    result = ingestion_service.ingest(readings)
+
+    assert result.received == 3
+    assert result.violations == 2
+    assert result.within_limit == 1
+    mock_speed_camera_repository.find_by_ids.assert_called_once_with({1})
+    mock_driver_repository.resolve_plates.assert_called_once_with({'ABC123'})
+    violations = mock_violation_repository.insert_many.call_args.args[0]
+    assert [violation.offense_id for violation in violations] == [2, 1]
+
+
+def test_ingest_caches_allowed_speeds_between_batches(
+        mock_driver_repository: MagicMock,
+        mock_speed_camera_repository: MagicMock,
+        ingestion_service: IngestionService,
+        speed_camera_1: SpeedCamera
+) -> None:
+    mock_speed_camera_repository.find_by_ids.return_value = [speed_camera_1]
+    mock_driver_repository.resolve_plates.return_value = {}
+    reading = SpeedReading(1, 'ABC123', 30, datetime(2025, 10, 14))
+
+    ingestion_service.ingest([reading])
+    ingestion_service.ingest([reading])
+
+    mock_speed_camera_repository.find_by_ids.assert_called_once()
+
+
+def test_ingest_caches_unknown_cameras_until_ttl_expires(
+        mock_driver_repository: MagicMock,
+        mock_speed_camera_repository: MagicMock,
+        ingestion_service: IngestionService
+) -> None:
+    mock_speed_camera_repository.find_by_ids.return_value = []
+    mock_driver_repository.resolve_plates.return_value = {}
+    reading = SpeedReading(9, 'ABC123', 90, datetime(2025, 10, 14))
+
+    with patch('src.service.ingestion_service.time.monotonic', side_effect=[100.0, 130.0, 161.0]):
+        results = [ingestion_service.ingest([reading]) for _ in range(3)]
+
+    assert [result.unknown_cameras for result in results] == [1, 1, 1]
+    assert mock_speed_camera_repository.find_by_ids.call_count == 2
+
+
+def test_ingest_empty_batch(mock_violation_repository: MagicMock, ingestion_service: IngestionService) -> None:
+    result = ingestion_service.ingest([])
+
+    assert result.received == 0
+    mock_violation_repository.insert_many.assert_not_called()
+
+
+def test_ingest_appends_to_spool_when_configured(
+        mock_driver_repository: MagicMock,
+        mock_speed_camera_repository: MagicMock,
+        mock_violation_repository: MagicMock,
+        ingestion_service: IngestionService,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera
+) -> None:
+    mock_speed_camera_repository.find_by_ids.return_value = [speed_camera_1]
+    mock_driver_repository.resolve_plates.return_value = {driver_1.registration_number: driver_1.id_}
+    ingestion_service.spool = MagicMock()
+
+    ingestion_service.ingest([SpeedReading(1, 'ABC123', 75, datetime(2025, 10, 14))])
+
+    assert len(ingestion_service.spool.append.call_args.args[0]) == 1
+    mock_violation_repository.insert_many.assert_not_called()
+
+
+def test_ingest_drops_repeated_detections(
+        mock_driver_repository: MagicMock,
+        mock_speed_camera_repository: MagicMock,
+        mock_violation_repository: MagicMock,
+        ingestion_service: IngestionService,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera
+) -> None:
+    mock_speed_camera_repository.find_by_ids.return_value = [speed_camera_1]
+    mock_driver_repository.resolve_plates.return_value = {driver_1.registration_number: driver_1.id_}
+    ingestion_service.deduplicator = DetectionDeduplicator()
+    timestamp = datetime(2025, 10, 14, 12, 0)
+
+    result = ingestion_service.ingest([SpeedReading(1, 'ABC123', 75, timestamp)] * 3)
+
+    assert result.duplicates == 2
+    assert result.violations == 1
+    assert len(mock_violation_repository.insert_many.call_args.args[0]) == 1
+
+
+def test_ingest_feeds_sketches(
+        mock_driver_repository: MagicMock,
+        mock_speed_camera_repository: MagicMock,
+        ingestion_service: IngestionService,
+        driver_1: Driver,
+        speed_camera_1: SpeedCamera
+) -> None:
+    mock_speed_camera_repository.find_by_ids.return_value = [speed_camera_1]
+    mock_driver_repository.resolve_plates.return_value = {driver_1.registration_number: driver_1.id_}
+    ingestion_service.sketches = ViolationSketches(fine_amounts={1: 100.0, 2: 500.0})
+    timestamp = datetime(2025, 10, 14, 12, 0)
+
+    ingestion_service.ingest([
+        SpeedReading(1, 'ABC123', 75, timestamp),
+        SpeedReading(1, 'ABC123', 55, timestamp),
+        SpeedReading(1, 'XYZ123', 40, timestamp),
+    ])
+
+    summary = ingestion_service.sketches.summary(quantiles=(1.0,))
+    assert summary.distinct_plates == 2
+    assert summary.distinct_drivers == 1
+    assert summary.busiest_cameras == [(1, 2)]
+    assert summary.fine_quantiles == {1.0: 500.0}
+    assert summary.speed_quantiles == {1.0: 75}
+
+
+def test_ingest_creates_section_violations(
+        mock_driver_repository: MagicMock,
+        mock_speed_camera_repository: MagicMock,
+        mock_violation_repository: MagicMock,
+        ingestion_service: IngestionService,
+        driver_1: Driver
+) -> None:
+    mock_speed_camera_repository.find_by_ids.return_value = [
+        SpeedCamera(id_=1, location='Entry', allowed_speed=120),
+        SpeedCamera(id_=2, location='Exit', allowed_speed=120),
+    ]
+    mock_driver_repository.resolve_plates.return_value = {driver_1.registration_number: driver_1.id_}
+    ingestion_service.section_matcher = SectionSpeedMatcher([
+        CameraSection(entry_camera_id=1, exit_camera_id=2, distance_m=3_000, speed_limit=90, max_travel_seconds=600)
+    ])
+    start = datetime(2025, 10, 14, 12, 0)
+
+    ingestion_service.ingest([SpeedReading(1, 'ABC123', 80, start)])
+    result = ingestion_service.ingest([SpeedReading(2, 'ABC123', 85, start + timedelta(seconds=80))])
+
+    assert (result.section_passages, result.section_violations, result.violations) == (1, 1, 1)
+    mock_driver_repository.resolve_plates.assert_called_with({'ABC123'})
+    violation, = mock_violation_repository.insert_many.call_args.args[0]
+    assert (violation.speed_camera_id, violation.offense_id) == (2, 2)
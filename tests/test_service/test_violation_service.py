@@ -1,7 +1,10 @@
 from src.domain.typed_dict import PopularSpeedCameraDict, TopDriverDict, DriverOffensesDict, SummaryStatisticDict
 from src.service.violation_service import ViolationService
+from src.database.deadline import QueryTimeoutError, remaining_time
 from unittest.mock import MagicMock
+from typing import Callable
 import logging
+import time
 import pytest
 
 def test_get_speed_camera_statistic_returns_data(
@@ -100,3 +103,110 @@ def test_get_generate_report(
 
 
 
+
+
+def test_get_dashboard_runs_reports_concurrently(
+        mock_violation_repository: MagicMock,
+        mock_violation_service: ViolationService,
+        top_driver_data_dict_1: TopDriverDict,
+        summary_statistics_data_dict_1: SummaryStatisticDict
+) -> None:
+    def slow(result: list) -> Callable[..., list]:
+        def query(*args: object, **kwargs: object) -> list:
+            time.sleep(0.2)
+            return result
+        return query
+
+    mock_violation_repository.find_violations_with_offense_by_driver.side_effect = slow([])
+    mock_violation_repository.get_driver_points.side_effect = slow([top_driver_data_dict_1])
+    mock_violation_repository.get_most_popular_speed_camera.side_effect = slow([])
+    mock_violation_repository.summary_statistics.side_effect = slow([summary_statistics_data_dict_1])
+
+    dashboard = mock_violation_service.get_dashboard('K123456')
+
+    assert dashboard.complete
+    assert dashboard.elapsed < 0.6
+    assert set(dashboard.timings) == {'offenses_by_driver', 'top_drivers', 'speed_camera_statistic', 'summary'}
+    assert dashboard.top_drivers is not None and len(dashboard.top_drivers) == 1
+    assert dashboard.summary is not None and len(dashboard.summary) == 1
+
+
+def test_get_dashboard_keeps_successful_reports_on_failure(
+        mock_violation_repository: MagicMock,
+        mock_violation_service: ViolationService
+) -> None:
+    mock_violation_repository.find_violations_with_offense_by_driver.return_value = []
+    mock_violation_repository.get_driver_points.side_effect = RuntimeError('timeout')
+    mock_violation_repository.get_most_popular_speed_camera.return_value = []
+    mock_violation_repository.summary_statistics.return_value = []
+
+    dashboard = mock_violation_service.get_dashboard('K123456')
+
+    assert not dashboard.complete
+    assert dashboard.errors == {'top_drivers': 'timeout'}
+    assert dashboard.top_drivers is None
+    assert dashboard.summary == []
+    assert 'top_drivers' in dashboard.timings
+    with pytest.raises(RuntimeError):
+        mock_violation_service.get_dashboard('K123456', raise_on_error=True)
+
+
+def test_get_combined_statistics(
+        mock_violation_repository: MagicMock,
+        mock_violation_service: ViolationService,
+        top_driver_data_dict_1: TopDriverDict,
+        popular_speed_camera_data_dict_1: PopularSpeedCameraDict,
+        summary_statistics_data_dict_1: SummaryStatisticDict
+) -> None:
+    mock_violation_repository.combined_statistics.return_value = {
+        'top_drivers': [top_driver_data_dict_1],
+        'popular_speed_cameras': [popular_speed_camera_data_dict_1],
+        'summary': [summary_statistics_data_dict_1],
+    }
+
+    result = mock_violation_service.get_combined_statistics()
+
+    assert result.top_drivers[0].total_points == top_driver_data_dict_1['total_points']
+    assert result.speed_camera_statistic[0].location == 'Warshaw'
+    assert result.summary[0].total_offenses == summary_statistics_data_dict_1['total_offenses']
+    mock_violation_repository.combined_statistics.assert_called_once()
+
+
+def test_service_methods_run_within_configured_budget(
+        mock_violation_repository: MagicMock,
+        mock_violation_service: ViolationService
+) -> None:
+    budgets: list[float | None] = []
+
+    def record_budget(**kwargs: object) -> list:
+        budgets.append(remaining_time())
+        return []
+
+    mock_violation_repository.summary_statistics.side_effect = record_budget
+    mock_violation_repository.get_driver_points.side_effect = record_budget
+    mock_violation_service.timeouts = {'get_generate_report': 5.0}
+
+    mock_violation_service.get_generate_report()
+    mock_violation_service.get_top_drivers_by_points()
+
+    assert budgets[0] is not None and 4.0 < budgets[0] <= 5.0
+    assert budgets[1] is None
+
+
+def test_get_dashboard_propagates_deadline_to_reports(
+        mock_violation_repository: MagicMock,
+        mock_violation_service: ViolationService
+) -> None:
+    def too_slow(**kwargs: object) -> list:
+        raise QueryTimeoutError(f'budget {remaining_time()}')
+
+    mock_violation_repository.find_violations_with_offense_by_driver.return_value = []
+    mock_violation_repository.get_driver_points.side_effect = too_slow
+    mock_violation_repository.get_most_popular_speed_camera.return_value = []
+    mock_violation_repository.summary_statistics.return_value = []
+    mock_violation_service.timeouts = {'get_dashboard': 1.0}
+
+    dashboard = mock_violation_service.get_dashboard('K123456')
+
+    assert list(dashboard.errors) == ['top_drivers']
+    assert dashboard.errors['top_drivers'] != 'budget None'
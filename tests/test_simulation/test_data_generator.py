@@ -0,0 +1,68 @@
+from src.simulation.data_generator import SyntheticDataGenerator, SyntheticDataSeeder, ZipfSampler
+from src.domain.entity import Driver, SpeedCamera, Offense
+from unittest.mock import MagicMock
+from collections import Counter
+import random
+
+
+def test_generator_is_deterministic() -> None:
+    first = SyntheticDataGenerator(seed=7, driver_count=50, speed_camera_count=5)
+    second = SyntheticDataGenerator(seed=7, driver_count=50, speed_camera_count=5)
+
+    assert list(first.drivers()) == list(second.drivers())
+    assert list(first.speed_cameras()) == list(second.speed_cameras())
+    assert list(first.violations([1, 2, 3], [1, 2], [1], count=100)) == list(
+        second.violations([1, 2, 3], [1, 2], [1], count=100)
+    )
+
+
+def test_generator_produces_unique_registration_numbers() -> None:
+    generator = SyntheticDataGenerator(driver_count=2_000)
+    plates = [driver.registration_number for driver in generator.drivers()]
+
+    assert len(plates) == 2_000
+    assert len(set(plates)) == 2_000
+
+
+def test_violations_are_skewed_towards_busy_cameras() -> None:
+    generator = SyntheticDataGenerator(camera_skew=1.2)
+    camera_ids = list(range(1, 51))
+    violations = list(generator.violations(list(range(1, 101)), camera_ids, [1, 2, 3], count=10_000))
+
+    counts = Counter(violation.speed_camera_id for violation in violations)
+    busiest_share = counts.most_common(1)[0][1] / len(violations)
+    assert len(violations) == 10_000
+    assert busiest_share > 3 / len(camera_ids)
+    assert set(counts) <= set(camera_ids)
+
+
+def test_zipf_sampler_with_zero_exponent_is_uniform() -> None:
+    sampler = ZipfSampler(4, 0.0, random.Random(1))
+    counts = Counter(sampler.sample(40_000))
+
+    assert all(9_000 < count < 11_000 for count in counts.values())
+
+
+def test_seeder_streams_batches_through_insert_many() -> None:
+    driver_repository = MagicMock()
+    speed_camera_repository = MagicMock()
+    offense_repository = MagicMock()
+    violation_repository = MagicMock()
+    driver_repository.find.return_value = [Driver(id_=i) for i in range(1, 11)]
+    speed_camera_repository.find.return_value = [SpeedCamera(id_=i) for i in range(1, 4)]
+    offense_repository.find.return_value = [Offense(id_=i) for i in range(1, 3)]
+
+    generator = SyntheticDataGenerator(driver_count=10, speed_camera_count=3, violation_count=250)
+    summary = SyntheticDataSeeder(
+        generator,
+        driver_repository,
+        speed_camera_repository,
+        offense_repository,
+        violation_repository,
+        batch_size=100,
+    ).seed()
+
+    assert summary.drivers == 10
+    assert summary.speed_cameras == 3
+    assert summary.violations == 250
+    assert [len(call.args[0]) for call in violation_repository.insert_many.call_args_list] == [100, 100, 50]
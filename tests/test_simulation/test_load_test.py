@@ -0,0 +1,51 @@
+from src.simulation.load_test import WriteLoadTester, LoadTestResult, CameraWriteStats
+from src.simulation.data_generator import SyntheticDataGenerator
+from src.database.connection import MySQLConnectionManager
+from unittest.mock import MagicMock, patch
+import pytest
+
+
+def test_load_test_result_aggregates_camera_stats() -> None:
+    stats = [
+        CameraWriteStats(speed_camera_id=1, rows=200, batch_latencies=[0.01, 0.02]),
+        CameraWriteStats(speed_camera_id=2, rows=100, failed_batches=1, batch_latencies=[0.04]),
+    ]
+    result = LoadTestResult.from_stats(
+        stats,
+        elapsed_seconds=2.0,
+        lock_status_before={'Innodb_row_lock_waits': 3, 'Innodb_row_lock_time': 10},
+        lock_status_after={'Innodb_row_lock_waits': 8, 'Innodb_row_lock_time': 25},
+    )
+
+    assert result.cameras == 2
+    assert result.rows == 300
+    assert result.failed_batches == 1
+    assert result.rows_per_second == 150
+    assert result.latency_max_ms == pytest.approx(40)
+    assert result.row_lock_waits == 5
+    assert result.row_lock_time_ms == 15
+
+
+def test_load_tester_writes_from_every_camera() -> None:
+    connection_manager = MagicMock(spec=MySQLConnectionManager)
+    connection_manager.pool_size = 5
+    tester = WriteLoadTester(connection_manager, SyntheticDataGenerator(), [1, 2, 3], [1, 2, 3], [1])
+
+    with (
+        patch.object(WriteLoadTester, 'row_lock_status', return_value={}),
+        patch('src.simulation.load_test.ViolationRepository') as repository_type,
+    ):
+        result = tester.run(cameras=3, violations_per_camera=250, batch_size=100)
+
+    assert result.cameras == 3
+    assert result.rows == 750
+    assert repository_type.return_value.insert_many.call_count == 9
+
+
+def test_load_tester_rejects_more_cameras_than_pooled_connections() -> None:
+    connection_manager = MagicMock(spec=MySQLConnectionManager)
+    connection_manager.pool_size = 2
+    tester = WriteLoadTester(connection_manager, SyntheticDataGenerator(), [1], [1, 2, 3], [1])
+
+    with pytest.raises(ValueError):
+        tester.run(cameras=3, violations_per_camera=10)